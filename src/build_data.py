@@ -0,0 +1,41 @@
+import argparse
+import sys
+import time
+
+from toolbox.data.invalid_data_error import InvalidDataError
+from toolbox.data.pack import PACK_PATH, build_pack
+
+"""This script validates the JSON data of the moves and of the pokemon and
+compiles it into the data pack loaded by the game.
+
+The moves learned by the pokemon must exist and the enumerations must be
+given by the name of one of their members. The problems found are reported
+and the exit status is 1 if there are any.
+"""
+
+
+def main() -> int:
+    """Build the data pack with the options given on the command line.
+
+    :return: The exit status.
+    """
+
+    parser = argparse.ArgumentParser(description="Validate the JSON data and compile it into the data pack.")
+    parser.add_argument("-o", "--output", default=PACK_PATH, help="The path of the pack.")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        moves, species = build_pack(args.output)
+    except InvalidDataError as error:
+        print(error)
+        return 1
+
+    print("{0} moves and {1} species written in {2:.3f}s.".format(len(moves), len(species),
+                                                                   time.perf_counter() - start))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
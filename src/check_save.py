@@ -0,0 +1,89 @@
+import argparse
+import sys
+
+import dill
+
+from models.enumerations.stat_enum import StatEnum
+from models.game_state_model import GameStateModel
+from models.persistence import Persistence
+from models.pokemon_model import PokemonModel
+
+"""This script loads saved games headlessly to check that they're still
+compatible with the models, e.g. after the models changed how they're stored.
+
+The saves written by the previous versions of the game are migrated when
+they're loaded: ``assets/saves`` holds such saves. The stats of each pokemon
+must match their level, species and IV, and the game state must be the same
+once saved and loaded again. The problems found are reported and the exit
+status is 1 if there are any.
+"""
+
+
+def describe(game_state: GameStateModel) -> list:
+    """Describe the content of a game state which must survive a save.
+
+    :param game_state: The game state.
+    :return: A list of plain values.
+    """
+
+    description = [game_state.map, tuple(game_state.map_players_position)]
+    for pokemon in game_state.player.pokemons:
+        description.append((pokemon.species.id, pokemon.nickname, pokemon.level, pokemon.hp, pokemon.experience,
+                            pokemon.experience_for_next_level, tuple(pokemon.stats.items()),
+                            tuple(pokemon.iv.items()), tuple(pokemon.staged_stats.items()),
+                            tuple((move.move.id, move.pp, move.current_pp) for move in pokemon.moves)))
+
+    return description
+
+
+def check_pokemon(pokemon: PokemonModel) -> list:
+    """Check that a loaded pokemon is consistent.
+
+    :param pokemon: The pokemon.
+    :return: The description of each problem found.
+    """
+
+    errors = []
+    expected_stats = {stat: stat.get_stat(pokemon.level, pokemon.species.base_stats[stat], iv)
+                      for stat, iv in pokemon.iv.items()}
+    if dict(pokemon.stats) != expected_stats:
+        errors.append("the stats {0} don't match the level, species and IV".format(dict(pokemon.stats)))
+    if not 0 <= pokemon.hp <= pokemon.stats[StatEnum.HP]:
+        errors.append("the HP {0} are out of range".format(pokemon.hp))
+    if set(pokemon.effective_stats) != set(pokemon.staged_stats):
+        errors.append("the effective stats are missing")
+
+    return ["{0} ({1}): {2}".format(pokemon.nickname, pokemon.species.id, error) for error in errors]
+
+
+def main() -> int:
+    """Check the saves given on the command line.
+
+    :return: The exit status.
+    """
+
+    parser = argparse.ArgumentParser(description="Load saved games and check that they're consistent.")
+    parser.add_argument("saves", nargs="*", default=[Persistence.DATA_PATH + GameStateModel.FILE_NAME],
+                        help="The saved game states to check, the current one by default.")
+    args = parser.parse_args()
+
+    failures = 0
+    for path in args.saves:
+        try:
+            with open(path, "rb") as file:
+                game_state = dill.load(file)
+            errors = [error for pokemon in game_state.player.pokemons for error in check_pokemon(pokemon)]
+            if describe(dill.loads(dill.dumps(game_state))) != describe(game_state):
+                errors.append("the game state changed when saved again")
+        except Exception as error:
+            errors = ["can't be loaded: {0!r}".format(error)]
+
+        failures += bool(errors)
+        print("{0}: {1}".format(path, "; ".join(errors) if errors else "{0} pokemon OK".format(
+            len(game_state.player.pokemons))))
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
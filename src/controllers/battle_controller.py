@@ -1,16 +1,20 @@
-import random
 import typing
 
 from controllers.main_menu_controller import MainMenuController
 from controllers.pkmn_infos_controller import PkmnInfosController
+from models.battle.battle_engine import BattleEngine
 from models.battle.battle_model import BattleModel
+from models.battle.battle_recorder import BattleRecorder
+from models.battle.battle_replayer import BattleReplayer
+from models.battle.expectimax_ai import ExpectimaxAI
 from models.battle.fight_action_model import FightActionModel
+from models.battle.round_result_model import RoundResultModel
 from models.battle.run_action_model import RunActionModel
 from models.battle.shift_action_model import ShiftActionModel
-from models.enumerations.staged_stat_enum import StagedStatEnum
-from models.enumerations.stat_enum import StatEnum
+from models.enumerations.battle_outcome_enum import BattleOutcomeEnum
 from models.learned_move_model import LearnedMoveModel
 from models.move_model import MoveModel
+from models.persistence import Persistence
 from models.pokemon_model import PokemonModel
 from toolbox.game import Game
 from toolbox.singleton import Singleton
@@ -19,7 +23,16 @@ from views.pkmn_infos.pkmn_infos_type_enum import PkmnInfosTypeEnum
 
 
 class BattleController(metaclass=Singleton):
-    """Manages the battle."""
+    """Manages the battle.
+
+    Every battle is recorded into the ``BATTLE_LOG`` file so that it can be
+    replayed, either headlessly or in the battle scene.
+
+    Attributes:
+        - BATTLE_LOG: Name of the file containing the log of the last battle.
+    """
+
+    BATTLE_LOG = "last_battle.log"
 
     def battle(self, battle: BattleModel, battle_over_callback: typing.Callable = None) -> None:
         """Starts a battle.
@@ -29,65 +42,56 @@ class BattleController(metaclass=Singleton):
         """
 
         self._battle = battle
+        self._battle_recorder = BattleRecorder(battle, Persistence.DATA_PATH + BattleController.BATTLE_LOG)
+        self._battle_engine = BattleEngine(battle, ExpectimaxAI(battle), self._battle_recorder)
+        self._replay_steps = None
         self._battle_scene = BattleScene(self, battle)
         self._battle_over_callback = battle_over_callback
 
-    def round(self, players_action: typing.Union[FightActionModel, RunActionModel, ShiftActionModel]) -> None:
-        """Plays the round of the battle.
+    def replay(self, path: str, battle_over_callback: typing.Callable = None) -> None:
+        """Play a recorded battle again in the battle scene.
 
-        :param players_action: The action chosen by the player.
-        """
+        The actions are taken from the log instead of being asked to the
+        player and the game state is left untouched.
 
-        opponent_action = FightActionModel(self._battle, False, random.choice(self._battle.opponent_pokemon.moves))
+        :param path: The path of the battle log.
+        :param battle_over_callback: The function to be called when the replay
+        is over.
+        """
 
-        if isinstance(players_action, (RunActionModel, ShiftActionModel)):
-            first_action, second_action = players_action, opponent_action
-        else:
-            player_speed = self._battle.players_pokemon.stats[StatEnum.SPEED] * StagedStatEnum.SPEED.get_multiplier(
-                self._battle.players_pokemon.staged_stats[StagedStatEnum.SPEED])
-            opponent_speed = self._battle.opponent_pokemon.stats[StatEnum.SPEED] * StagedStatEnum.SPEED.get_multiplier(
-                self._battle.opponent_pokemon.staged_stats[StagedStatEnum.SPEED])
-            if player_speed > opponent_speed:
-                first_action, second_action = players_action, opponent_action
-            else:
-                first_action, second_action = opponent_action, players_action
+        replayer = BattleReplayer(path)
+        self._battle = replayer.battle
+        self._battle_recorder = None
+        self._battle_engine = replayer.engine
+        self._replay_steps = replayer.steps()
+        self._battle_scene = BattleScene(self, self._battle)
+        self._battle_over_callback = battle_over_callback
 
-        if isinstance(first_action, FightActionModel):
-            self._fight_action(first_action)
-        elif isinstance(first_action, ShiftActionModel):
-            first_action.shift(self._battle)
+    @property
+    def replaying(self) -> bool:
+        """Get whether the current battle is a replay.
 
-        if isinstance(second_action, FightActionModel) and second_action.attacker.hp > 0:
-            if not isinstance(first_action, RunActionModel) or (
-                    isinstance(first_action, RunActionModel) and not first_action.is_run_successful()):
-                self._fight_action(second_action)
+        :return: True if the actions are taken from a battle log.
+        """
 
-        self._battle_scene.round(first_action, second_action)
+        return self._replay_steps is not None
 
-    def _fight_action(self, fight_action: FightActionModel) -> None:
-        """A move has been chosen as an action. Apply its effects.
+    def round(self, players_action: typing.Union[FightActionModel, RunActionModel, ShiftActionModel]) -> None:
+        """Plays the round of the battle.
 
-        :param fight_action: The ``FightActionModel`` containing all the
-        information about the move.
+        :param players_action: The action chosen by the player.
         """
 
-        move_effects = fight_action.get_effects()
+        self._battle_scene.round(self._battle_engine.round(players_action))
 
-        fight_action.defender.hp = fight_action.defender.hp + move_effects.hp
-        if fight_action.defender.hp < 0:
-            fight_action.defender.hp = 0
-        elif fight_action.defender.hp > fight_action.defender.stats[StatEnum.HP]:
-            fight_action.defender.hp = fight_action.defender.stats[StatEnum.HP]
+    def replay_round(self) -> None:
+        """Plays the next recorded round of the replayed battle."""
 
-        for staged_stat, value in move_effects.staged_stats.items():
-            if value > 0:
-                fight_action.attacker.staged_stats[staged_stat] = min(6, fight_action.attacker.staged_stats[
-                    staged_stat] + value)
-            elif value < 0:
-                fight_action.defender.staged_stats[staged_stat] = max(-6, fight_action.defender.staged_stats[
-                    staged_stat] + value)
-
-        fight_action.move.current_pp = fight_action.move.current_pp - 1 if fight_action.move.current_pp > 0 else 0
+        round_result = next(self._replay_steps, None)
+        if isinstance(round_result, RoundResultModel):
+            self._battle_scene.round(round_result)
+        else:
+            self._end_battle()
 
     def pokemon_ko(self, pokemon_ko: PokemonModel) -> None:
         """A pokemon got defeated.
@@ -97,20 +101,29 @@ class BattleController(metaclass=Singleton):
         :param pokemon_ko: The pokemon who is KO.
         """
 
-        if pokemon_ko == self._battle.players_pokemon:
-            if Game().game_state.player.has_conscious_pokemon():
-                self._battle_scene.ask_player_shift_pokemon()
+        ko_result = self._battle_engine.pokemon_ko(pokemon_ko)
+
+        if ko_result.outcome == BattleOutcomeEnum.PLAYER_SHIFT and self.replaying:
+            shift_action = next(self._replay_steps, None)
+            if isinstance(shift_action, ShiftActionModel):
+                self._battle_scene.shift_players_pokemon(shift_action)
             else:
-                self._battle_scene.player_lost_battle()
+                self._end_battle()
+        elif ko_result.outcome == BattleOutcomeEnum.PLAYER_SHIFT:
+            self._battle_scene.ask_player_shift_pokemon()
+        elif ko_result.outcome == BattleOutcomeEnum.PLAYER_LOST:
+            self._battle_scene.player_lost_battle()
         else:
-            wild_pokemon = 1 if self._battle.is_wild_pokemon else 1.5
-            experience_gained = (wild_pokemon * pokemon_ko.species.base_experience * pokemon_ko.level) // 7
-            gained_levels = self._battle.players_pokemon.gain_experience(experience_gained)
-            self._battle_scene.player_won_fight(experience_gained, gained_levels)
+            self._battle_scene.player_won_fight(ko_result.experience_gained, ko_result.gained_levels)
 
     def run(self) -> None:
         """The player escapes the battle."""
 
+        if self.replaying:
+            self._end_battle()
+            return
+
+        self._battle_recorder.close()
         MainMenuController().show_menu()
 
     def infos_pkmn(self, pkmn_infos_type: PkmnInfosTypeEnum, new_move: MoveModel = None,
@@ -133,7 +146,7 @@ class BattleController(metaclass=Singleton):
         :param shift_action: The ``ShiftActionModel``.
         """
 
-        shift_action.shift(self._battle)
+        self._battle_engine.shift(shift_action)
         self._battle_scene.shift_players_pokemon(shift_action)
 
     def forget_move(self, gained_levels: typing.Dict[int, typing.Dict], new_move: MoveModel,
@@ -154,12 +167,25 @@ class BattleController(metaclass=Singleton):
     def lost_battle(self) -> None:
         """The player lost the battle. His game state is erased."""
 
+        if self.replaying:
+            self._end_battle()
+            return
+
+        self._battle_recorder.close()
         Game().game_state.delete()
         MainMenuController().show_menu()
 
     def won_battle(self) -> None:
         """The player won the battle."""
 
+        self._end_battle()
+
+    def _end_battle(self) -> None:
+        """Leave the battle scene and stop recording."""
+
+        if self._battle_recorder:
+            self._battle_recorder.close()
+
         self._battle_scene.pop_scene()
 
         if self._battle_over_callback:
@@ -1,11 +1,23 @@
-import importlib
+import random
 import typing
 
 import cocos
 
+from models.game_state_model import GameStateModel
+from models.map.encounter_scheduler_model import EncounterSchedulerModel
+from models.map.encounter_table_model import EncounterTableModel
+from models.map.event_index_model import EventIndexModel
+from models.map.teleport_model import TeleportModel
+from models.map.walkability_model import WalkabilityModel
+from toolbox.data.pokemon import pokemons
 from toolbox.game import Game
 from toolbox.singleton import Singleton
+from views.map.events.message_event import MessageEvent
 from views.map.events.move_event import MoveEvent
+from views.map.events.pkmn_center_door_event import PkmnCenterDoorEvent
+from views.map.events.tall_grass_event import TallGrassEvent
+from views.map.events.teleport_event import TeleportEvent
+from views.map.events.wild_pokemon_event import WildPokemonEvent
 from views.map.map_scene import MapScene
 from views.map.player_action_enum import PlayerActionEnum
 from views.map.player_direction_enum import PlayerDirectionEnum
@@ -13,21 +25,120 @@ from views.map.player_layer import PlayerLayer
 
 
 class MapController(metaclass=Singleton):
-    """Manages the maps."""
+    """Manages the maps.
+
+    When a map is loaded, the objects of its layers named after a
+    ``PlayerActionEnum`` are indexed by tile. The objects set off by the
+    action button are those on the tile the player faces, the others those on
+    the tile the player stands on. Each property of an object is bound to the
+    class of its event, so that a map with an unknown event fails to load.
+    Its value is parsed into the payload of the event at the same time: a
+    ``TeleportModel``, an ``EncounterTableModel`` or the value itself (e.g.
+    the key of a message), so that setting off an event parses nothing.
+
+    Attributes:
+        - EVENTS: The class of the event of each object property.
+    """
+
+    EVENTS = {"message": MessageEvent, "pkmn_center_door": PkmnCenterDoorEvent, "tall_grass": TallGrassEvent,
+              "teleport": TeleportEvent, "wild_pokemon": WildPokemonEvent}
+
+    _FACING = {PlayerDirectionEnum.UP: (0, 1), PlayerDirectionEnum.RIGHT: (1, 0), PlayerDirectionEnum.LEFT: (-1, 0),
+               PlayerDirectionEnum.DOWN: (0, -1)}
+
+    def __init__(self) -> None:
+        """Create the controller of the maps."""
+
+        self.seed = random.getrandbits(32)
+
+    @property
+    def seed(self) -> int:
+        """Get the seed of the random number generator of the maps.
+
+        :return: The seed.
+        """
+
+        return self._seed
+
+    @seed.setter
+    def seed(self, seed: int) -> None:
+        """Set the seed of the random number generator of the maps and reset
+        the generator and the encounter scheduler.
+
+        :param seed: The seed.
+        """
+
+        self._seed = seed
+        self._rng = random.Random(seed)
+        self._encounters = EncounterSchedulerModel(self._rng)
+
+    @property
+    def rng(self) -> random.Random:
+        """Get the random number generator used by the events of the maps
+        (e.g. the wild pokemon encounters).
+
+        :return: A ``random.Random`` instance.
+        """
+
+        return self._rng
+
+    @property
+    def encounters(self) -> EncounterSchedulerModel:
+        """Get the scheduler of the wild pokemon encounters, which draws from
+        the random number generator of the maps.
+
+        :return: An ``EncounterSchedulerModel``.
+        """
+
+        return self._encounters
+
+    @property
+    def walkability(self) -> WalkabilityModel:
+        """Get the walkability grid of the current map.
+
+        :return: A ``WalkabilityModel``.
+        """
+
+        return self._walkability
 
     def load_map(self, map_file: str, players_position: typing.Tuple[int, int],
                  players_direction: PlayerDirectionEnum = PlayerDirectionEnum.DOWN):
-        """Load the map file.
+        """Load the map file, compile its walkability and index its events with
+        their payload.
+
+        The game state only moves to the map once it's loaded, so that a map
+        which fails to load isn't saved as the current one.
 
         :param: map_file: The name of the map.
         :param: players_position: The tile coordinates of the player's position.
         :param players_direction: The direction the player is facing.
+        :raise ValueError: If an event of the map is unknown or malformed.
         """
 
+        map = cocos.tiles.load(GameStateModel.MAP_PATH.format(map_file))
+        walkability = WalkabilityModel.from_layers(
+            layer for layer in map.contents.values() if isinstance(layer, cocos.tiles.RectMapLayer))
+        events = EventIndexModel(MapScene.TILE_SIZE)
+        for action in PlayerActionEnum:
+            if action.name in map.contents:
+                for object in map.get_resource(action.name).objects:
+                    for property in object.properties:
+                        if property not in MapController.EVENTS:
+                            raise ValueError("Unknown event {0} in the map {1}".format(property, map_file))
+                        try:
+                            payload = MapController._parse_payload(property, object.properties[property])
+                        except ValueError as error:
+                            raise ValueError("Invalid event {0} in the map {1}: {2}".format(property, map_file,
+                                                                                           error)) from error
+                        events.add(action, object.px, object.py, object.width, object.height,
+                                   (MapController.EVENTS[property], object, payload))
+
         Game().game_state.map = map_file
         Game().game_state.map_players_position = players_position
 
-        self._map = cocos.tiles.load(Game().game_state.map_path())
+        self._map = map
+        self._walkability = walkability
+        self._events = events
         self._map_scene = MapScene(self, self._map, Game().game_state.map_players_position, players_direction)
 
     def action(self, position: typing.Tuple[int, int], direction: PlayerDirectionEnum, action: PlayerActionEnum,
@@ -44,20 +155,31 @@ class MapController(metaclass=Singleton):
         y = position[1] - PlayerLayer.CHAR_HEIGHT / 2
 
         if action == PlayerActionEnum.PLAYER_WANT_MOVE:
-            MoveEvent(self._map_scene, x, y, direction, kwargs["new_direction"], self._map)
-
-        if action.name in self._map.contents:
-            resource = self._map.get_resource(action.name)
-            objects = resource.get_in_region(x - MapScene.TILE_SIZE,
-                                             y - MapScene.TILE_SIZE,
-                                             x + MapScene.TILE_SIZE * 2,
-                                             y + MapScene.TILE_SIZE * 2)
-            for object in objects:
-                for property, value in object.properties.items():
-                    class_name = property.replace("_", " ").title().replace(" ", "")
-                    event_class = getattr(
-                        importlib.import_module("views.map.events.{0}_event".format(property.lower())),
-                        "{0}Event".format(class_name)
-                    )
-
-                    event_class(self._map_scene, x, y, direction, object)
+            MoveEvent(self._map_scene, x, y, direction, kwargs["new_direction"], self._walkability)
+
+        i = int(x // MapScene.TILE_SIZE)
+        j = int(y // MapScene.TILE_SIZE)
+        if action == PlayerActionEnum.ACTION_BUTTON:
+            i += MapController._FACING[direction][0]
+            j += MapController._FACING[direction][1]
+
+        for event_class, object, payload in self._events.get(action, i, j):
+            event_class(self._map_scene, x, y, direction, object, payload)
+
+    @staticmethod
+    def _parse_payload(property: str, value: typing.Any) -> typing.Any:
+        """Parse the value of a property of an object into the payload of its
+        event.
+
+        :param property: The name of the property.
+        :param value: The value of the property.
+        :return: The payload of the event.
+        :raise ValueError: If the value is malformed.
+        """
+
+        if property == "teleport":
+            return TeleportModel.from_json(value, PlayerDirectionEnum.__members__)
+        if property == "wild_pokemon":
+            return EncounterTableModel.from_json(value, pokemons)
+
+        return value
@@ -0,0 +1,98 @@
+import argparse
+import random
+import sys
+import time
+import xml.etree.ElementTree
+
+from models.game_state_model import GameStateModel
+from models.map.encounter_scheduler_model import EncounterSchedulerModel
+from models.map.encounter_table_model import EncounterTableModel
+from toolbox.data.pokemon import pokemons
+
+"""This script simulates the steps of the player in each tall grass of a map
+to check the statistics of the wild pokemon encounters without running the
+game.
+
+The encounter tables are read from the ``wild_pokemon`` properties of the
+objects of the map and drawn from by the encounter scheduler with a seeded
+generator, as in the game. The rate of the encounters and the frequency of each
+species and level are compared to the expected ones.
+"""
+
+
+def read_tables(map_file: str) -> list:
+    """Read the encounter tables of a map.
+
+    :param map_file: The name of the map.
+    :return: A list of ``EncounterTableModel``.
+    """
+
+    tables = []
+    root = xml.etree.ElementTree.parse(GameStateModel.MAP_PATH.format(map_file)).getroot()
+    for property in root.iter("property"):
+        if property.get("name") == "wild_pokemon":
+            table = EncounterTableModel.from_json(property.get("value"), pokemons)
+            if table:
+                tables.append(table)
+
+    return tables
+
+
+def expected_frequencies(table: EncounterTableModel) -> dict:
+    """Get the probability of each species and level of a table.
+
+    :param table: The encounter table.
+    :return: A dictionary assigning its probability to each pair of species
+    and level.
+    """
+
+    total_weight = sum(table.weights)
+    frequencies = dict()
+    for id, weight, (level_min, level_max) in zip(table.species, table.weights, table.levels):
+        for level in range(level_min, level_max + 1):
+            frequencies[id, level] = weight / total_weight / (level_max - level_min + 1)
+
+    return frequencies
+
+
+def main() -> int:
+    """Simulate the steps with the options given on the command line.
+
+    :return: The exit status.
+    """
+
+    parser = argparse.ArgumentParser(description="Check the statistics of the wild pokemon encounters of a map.")
+    parser.add_argument("map", nargs="?", default="town", help="The name of the map.")
+    parser.add_argument("-n", "--steps", type=int, default=1000000, help="The number of steps in each tall grass.")
+    parser.add_argument("-p", "--probability", type=float, default=EncounterSchedulerModel.ENCOUNTER_PROBABILITY,
+                        help="The probability of an encounter on each step.")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="The seed of the generator.")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    encounters = EncounterSchedulerModel(rng, args.probability)
+    for table in read_tables(args.map):
+        counts = dict()
+        start = time.perf_counter()
+        for _ in range(args.steps):
+            if encounters.step():
+                outcome = table.draw(rng)
+                counts[outcome] = counts.get(outcome, 0) + 1
+        elapsed = time.perf_counter() - start
+
+        total = sum(counts.values())
+        print("{0}: {1} encounters in {2} steps ({3:.4f}, expected {4:.4f}) in {5:.2f}s."
+              .format(table.place, total, args.steps, total / args.steps if args.steps else 0,
+                      encounters.probability, elapsed))
+        if not total:
+            continue
+
+        for (id, level), frequency in sorted(expected_frequencies(table).items()):
+            print("    {0} level {1}: {2:.4f}, expected {3:.4f}".format(id, level, counts.get((id, level), 0) / total,
+                                                                         frequency))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,78 @@
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+
+from models.enumerations.stat_enum import StatEnum
+from models.learned_move_model import LearnedMoveModel
+from models.pokemon_model import PokemonModel
+from toolbox.data.pokemon import pokemons
+from toolbox.pokemon_factory import create_pokemons
+
+"""This script measures the memory used by the pokemon created the way wild
+pokemon are, to keep an eye on the footprint of the models.
+
+The pokemon get a random species, a random level, the last moves their
+species learns by leveling up until that level and random IV. The memory is
+traced while they are created, so that it includes their dictionaries and their
+learned moves.
+
+With ``--batch``, the pokemon are created all at once by the pokemon factory.
+"""
+
+
+def create_pokemon(rng: random.Random, species_ids: list, max_level: int) -> PokemonModel:
+    """Create a pokemon like a wild one.
+
+    :param rng: The random number generator.
+    :param species_ids: The ids of the species to pick from.
+    :param max_level: The highest possible level.
+    :return: A new ``PokemonModel``.
+    """
+
+    species = pokemons[rng.choice(species_ids)]
+    level = rng.randint(1, max_level)
+    learned_moves = [LearnedMoveModel(move, move.default_pp, move.default_pp) for move in species.get_last_moves(level)]
+
+    return PokemonModel(species, species.id, level, learned_moves,
+                        iv={stat: rng.randint(0, 31) for stat in StatEnum})
+
+
+def main() -> int:
+    """Create the pokemon and print the memory they use.
+
+    :return: The exit status.
+    """
+
+    parser = argparse.ArgumentParser(description="Measure the memory used by many pokemon.")
+    parser.add_argument("-n", "--pokemon", type=int, default=100000, help="The number of pokemon to create.")
+    parser.add_argument("-l", "--level", type=int, default=100, help="The highest level of the pokemon.")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="The seed of the random pokemon.")
+    parser.add_argument("--batch", action="store_true", help="Create the pokemon with the pokemon factory.")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    species_ids = sorted(pokemons)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    if args.batch:
+        party = create_pokemons(args.pokemon, [pokemons[species_id] for species_id in species_ids],
+                                [(1, args.level)] * len(species_ids), seed=args.seed)
+    else:
+        party = [create_pokemon(rng, species_ids, args.level) for _ in range(args.pokemon)]
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print("{0} pokemon created in {1:.2f}s ({2:.1f}us per pokemon).".format(len(party), elapsed,
+                                                                            elapsed / len(party) * 1e6))
+    print("Memory: {0:.1f} MiB retained, {1:.1f} MiB peak, {2:.0f} bytes per pokemon."
+          .format(current / 2 ** 20, peak / 2 ** 20, current / len(party)))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
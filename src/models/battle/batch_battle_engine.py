@@ -0,0 +1,333 @@
+import typing
+
+import numpy
+
+from models.battle import damage_calculator
+from models.enumerations.move_category_enum import MoveCategoryEnum
+from models.enumerations.staged_stat_enum import StagedStatEnum
+from models.enumerations.stat_enum import StatEnum
+from models.enumerations.type_enum import TypeEnum
+from models.pokemon_model import PokemonModel
+
+
+class BatchBattleEngine:
+    """Resolves many one-on-one battles at once.
+
+    The battles are stored as arrays (struct of arrays) rather than as models.
+    What changes during a battle (the HP, the stages and the PP of both
+    pokemon) is stored per battle. What doesn't (the stats and the moves) is
+    stored once per distinct pokemon, in flat tables indexed by
+    ``pokemon * MAX_MOVES + move``, so that the battles between the same
+    pokemon share it. Each step plays one round of all the battles still going
+    on with NumPy operations, using the same formulas as
+    ``FightActionModel.get_effects``. Both pokemon choose their moves randomly.
+
+    The per battle arrays are indexed first by side (0 for the player, 1 for
+    the opponent), then by battle. The stats follow the order of ``StatEnum``
+    and the stages the order of ``StagedStatEnum``.
+
+    The pokemon given to the engine are never modified.
+
+    Attributes:
+        - ONGOING, PLAYER_WON, PLAYER_LOST, DRAW: The outcomes of a battle.
+        - MAX_MOVES: The maximum number of moves of a pokemon.
+        - STAGE_MULTIPLIERS: The multiplier of each staged stat indexed by the
+            stage + 6.
+    """
+
+    ONGOING = 0
+    PLAYER_WON = 1
+    PLAYER_LOST = 2
+    DRAW = 3
+
+    MAX_MOVES = 4
+
+    _STATS = tuple(StatEnum)
+    _STAGED_STATS = tuple(StagedStatEnum)
+    STAGE_MULTIPLIERS = numpy.array([staged_stat.multipliers for staged_stat in _STAGED_STATS])
+    _FLAT_MULTIPLIERS = STAGE_MULTIPLIERS.ravel()
+    _STAGES = STAGE_MULTIPLIERS.shape[1]
+    _DAMAGE_ROLLS = numpy.array(damage_calculator.DAMAGE_ROLLS)
+
+    _SPEED = _STATS.index(StatEnum.SPEED)
+    _SPEED_STAGE = _STAGED_STATS.index(StagedStatEnum.SPEED)
+    _ACCURACY_STAGE = _STAGED_STATS.index(StagedStatEnum.ACCURACY)
+
+    def __init__(self, players_pokemons: typing.List[PokemonModel], opponent_pokemons: typing.List[PokemonModel],
+                 seed: int = None) -> None:
+        """Create a new batch of battles.
+
+        The battle ``i`` opposes ``players_pokemons[i]`` to
+        ``opponent_pokemons[i]``. The same pokemon can take part in many
+        battles.
+
+        :param players_pokemons: The pokemon playing the role of the player in
+        each battle.
+        :param opponent_pokemons: The opponent pokemon in each battle.
+        :param seed: The seed of the random number generator. If None, it is
+        randomly generated.
+        """
+
+        if len(players_pokemons) != len(opponent_pokemons):
+            raise ValueError("Both sides must have one pokemon per battle.")
+
+        self._rng = numpy.random.RandomState(seed)
+        self._size = len(players_pokemons)
+
+        pokemons = []
+        indices = dict()
+        slots = numpy.empty((2, self._size), dtype=numpy.intp)
+        for side, side_pokemons in enumerate((players_pokemons, opponent_pokemons)):
+            for battle, pokemon in enumerate(side_pokemons):
+                if id(pokemon) not in indices:
+                    indices[id(pokemon)] = len(pokemons)
+                    pokemons.append(pokemon)
+                slots[side, battle] = indices[id(pokemon)]
+
+        self._slots = slots.ravel()
+        self._prepare_pokemons(pokemons)
+        self._pairs, self._effectiveness = self._pairs_effectiveness(pokemons, slots)
+
+        self._hp = numpy.array([pokemon.hp for pokemon in pokemons], dtype=numpy.int32)[slots]
+        self._stages = numpy.frombuffer(b"".join(pokemon.staged_stats.tobytes() for pokemon in pokemons),
+                                        dtype=PokemonModel.STAGES_TYPECODE).reshape(len(pokemons), -1).astype(
+            numpy.int8)[slots]
+        self._pp = numpy.array([[learned_move.current_pp for learned_move in pokemon.moves]
+                                + [0] * (BatchBattleEngine.MAX_MOVES - len(pokemon.moves))
+                                for pokemon in pokemons], dtype=numpy.int32)[slots]
+
+        self._outcomes = numpy.full(self._size, BatchBattleEngine.ONGOING, dtype=numpy.int8)
+        self._outcomes[self._hp[1] == 0] = BatchBattleEngine.PLAYER_WON
+        self._outcomes[self._hp[0] == 0] = BatchBattleEngine.PLAYER_LOST
+        self._rounds = numpy.zeros(self._size, dtype=numpy.int32)
+        self._active = numpy.flatnonzero(self._outcomes == BatchBattleEngine.ONGOING)
+
+    def _prepare_pokemons(self, pokemons: typing.List[PokemonModel]) -> None:
+        """Build the tables of the stats and of the moves of the distinct
+        pokemon.
+
+        The part of the damage formula which only depends on the attacker and
+        the move, ``(2 * level / 5 + 2) * power``, is calculated once.
+
+        :param pokemons: The distinct pokemon taking part in the battles.
+        """
+
+        size = len(pokemons) * BatchBattleEngine.MAX_MOVES
+        self._stats = numpy.frombuffer(b"".join(pokemon.stats.tobytes() for pokemon in pokemons),
+                                       dtype=PokemonModel.STATS_TYPECODE).astype(int)
+        self._move_count = numpy.array([len(pokemon.moves) for pokemon in pokemons])
+        self._base_damage = numpy.zeros(size)
+        self._accuracy = numpy.zeros(size)
+        self._damaging = numpy.zeros(size, dtype=bool)
+        self._attack = numpy.zeros(size)
+        self._attack_stage = numpy.zeros(size, dtype=numpy.intp)
+        self._defense_stat = numpy.zeros(size, dtype=numpy.intp)
+        self._defense_stage = numpy.zeros(size, dtype=numpy.intp)
+        self._effects = numpy.zeros((size, len(BatchBattleEngine._STAGED_STATS)), dtype=numpy.int8)
+
+        for index, pokemon in enumerate(pokemons):
+            for slot, learned_move in enumerate(pokemon.moves):
+                move = learned_move.move
+                row = index * BatchBattleEngine.MAX_MOVES + slot
+                self._accuracy[row] = move.accuracy if move.accuracy else 0
+                if damage_calculator.is_damaging(move):
+                    self._damaging[row] = True
+                    self._base_damage[row] = (2 * pokemon.level / 5 + 2) * move.power
+                if move.category == MoveCategoryEnum.PHYSICAL:
+                    attack_stat, attack_stage = StatEnum.ATTACK, StagedStatEnum.ATTACK
+                    defense_stat, defense_stage = StatEnum.DEFENSE, StagedStatEnum.DEFENSE
+                else:
+                    attack_stat, attack_stage = StatEnum.SPECIAL_ATTACK, StagedStatEnum.SPECIAL_ATTACK
+                    defense_stat, defense_stage = StatEnum.SPECIAL_ATTACK, StagedStatEnum.SPECIAL_DEFENSE
+                self._attack[row] = pokemon.stats[attack_stat]
+                self._attack_stage[row] = BatchBattleEngine._STAGED_STATS.index(attack_stage)
+                self._defense_stat[row] = BatchBattleEngine._STATS.index(defense_stat)
+                self._defense_stage[row] = BatchBattleEngine._STAGED_STATS.index(defense_stage)
+                if move.effects:
+                    for staged_stat, value in move.effects.staged_stats.items():
+                        self._effects[row, BatchBattleEngine._STAGED_STATS.index(staged_stat)] = value
+
+        self._has_effects = self._effects.any(axis=1)
+
+    @staticmethod
+    def _pairs_effectiveness(pokemons: typing.List[PokemonModel],
+                             slots: numpy.ndarray) -> typing.Tuple[numpy.ndarray, numpy.ndarray]:
+        """Get the effectiveness of every move against the other pokemon of
+        each battle.
+
+        It is only calculated once per pair of pokemon.
+
+        :param pokemons: The distinct pokemon taking part in the battles.
+        :param slots: The index of the pokemon of each side of each battle.
+        :return: The index of the pair of each battle and the flat table of
+        the multipliers indexed by ``(pair * 2 + side) * MAX_MOVES + move``.
+        """
+
+        move_types = numpy.full((len(pokemons), BatchBattleEngine.MAX_MOVES), TypeEnum.NORMAL.index)
+        defense_types = numpy.empty((len(pokemons), 2), dtype=int)
+        for index, pokemon in enumerate(pokemons):
+            move_types[index, :len(pokemon.moves)] = [learned_move.move.type.index for learned_move in pokemon.moves]
+            defense_types[index] = TypeEnum.combination_indexes(pokemon.species.type)
+
+        pairs, inverse = numpy.unique(slots[0] * len(pokemons) + slots[1], return_inverse=True)
+        fighters = numpy.stack([pairs // len(pokemons), pairs % len(pokemons)], axis=1)
+        effectiveness = TypeEnum.batch_effectiveness(move_types[fighters], defense_types[fighters[:, ::-1], None])
+
+        return inverse, effectiveness.ravel()
+
+    @property
+    def hp(self) -> numpy.ndarray:
+        """Get the HP of both pokemon of every battle.
+
+        :return: An array indexed by side and battle.
+        """
+
+        return self._hp
+
+    @property
+    def stages(self) -> numpy.ndarray:
+        """Get the stages of both pokemon of every battle.
+
+        :return: An array indexed by side, battle and staged stat.
+        """
+
+        return self._stages
+
+    @property
+    def pp(self) -> numpy.ndarray:
+        """Get the current PP of the moves of both pokemon of every battle.
+
+        :return: An array indexed by side, battle and move.
+        """
+
+        return self._pp
+
+    @property
+    def outcomes(self) -> numpy.ndarray:
+        """Get the outcome of every battle.
+
+        :return: An array of ``ONGOING``, ``PLAYER_WON``, ``PLAYER_LOST`` or
+        ``DRAW``.
+        """
+
+        return self._outcomes
+
+    @property
+    def rounds(self) -> numpy.ndarray:
+        """Get the number of rounds played by every battle.
+
+        :return: An array of numbers of rounds.
+        """
+
+        return self._rounds
+
+    def run(self, max_rounds: int) -> None:
+        """Play all the battles until they are over.
+
+        The battles still going on after ``max_rounds`` rounds are stopped and
+        considered as draws.
+
+        :param max_rounds: The number of rounds after which the battles are
+        stopped.
+        """
+
+        for _ in range(max_rounds):
+            if not self.step():
+                return
+
+        self._outcomes[self._active] = BatchBattleEngine.DRAW
+        self._active = self._active[:0]
+
+    def step(self) -> int:
+        """Play one round of all the battles still going on.
+
+        :return: The number of battles which played the round.
+        """
+
+        battles = self._active
+        if not battles.size:
+            return 0
+
+        rows = numpy.stack((battles, battles + self._size))
+        pokemons = self._slots[rows]
+        moves = (self._rng.random_sample(rows.shape) * self._move_count[pokemons]).astype(numpy.intp)
+
+        stages = self._stages.reshape(-1, len(BatchBattleEngine._STAGED_STATS))
+        speed = self._stats[pokemons * len(BatchBattleEngine._STATS) + BatchBattleEngine._SPEED] \
+            * BatchBattleEngine._FLAT_MULTIPLIERS[BatchBattleEngine._SPEED_STAGE * BatchBattleEngine._STAGES
+                                                  + stages[rows, BatchBattleEngine._SPEED_STAGE] + 6]
+        first = numpy.where(speed[0] > speed[1], 0, 1)
+        positions = numpy.arange(battles.size)
+        self._use_moves(battles, first, moves[first, positions])
+
+        second = 1 - first
+        hp = self._hp.ravel()
+        conscious = hp[rows[second, positions]] > 0
+        self._use_moves(battles[conscious], second[conscious], moves[second[conscious], positions[conscious]])
+
+        self._rounds[battles] += 1
+        player_won = hp[rows[1]] == 0
+        player_lost = hp[rows[0]] == 0
+        self._outcomes[battles[player_won]] = BatchBattleEngine.PLAYER_WON
+        self._outcomes[battles[player_lost]] = BatchBattleEngine.PLAYER_LOST
+        self._active = battles[~(player_won | player_lost)]
+
+        return battles.size
+
+    def _use_moves(self, battles: numpy.ndarray, attackers: numpy.ndarray, moves: numpy.ndarray) -> None:
+        """Apply the effects of a move in some battles.
+
+        :param battles: The indices of the battles.
+        :param attackers: The side of the attacking pokemon in each battle.
+        :param moves: The index of the move used in each battle.
+        """
+
+        multipliers = BatchBattleEngine._FLAT_MULTIPLIERS
+        staged_stats = len(BatchBattleEngine._STAGED_STATS)
+        hp = self._hp.ravel()
+        stages = self._stages.ravel()
+
+        attacker_rows = attackers * self._size + battles
+        defender_rows = (1 - attackers) * self._size + battles
+        attacker = self._slots[attacker_rows]
+        defender = self._slots[defender_rows]
+        move_rows = attacker * BatchBattleEngine.MAX_MOVES + moves
+
+        accuracy = self._accuracy[move_rows]
+        threshold = accuracy * multipliers[BatchBattleEngine._ACCURACY_STAGE * BatchBattleEngine._STAGES + stages[
+            attacker_rows * staged_stats + BatchBattleEngine._ACCURACY_STAGE] + 6]
+        hit = (accuracy == 0) | (self._rng.randint(1, damage_calculator.ACCURACY_ROLLS + 1, battles.size) <= threshold)
+
+        attack_stage = self._attack_stage[move_rows]
+        attack = self._attack[move_rows] * multipliers[
+            attack_stage * BatchBattleEngine._STAGES + stages[attacker_rows * staged_stats + attack_stage] + 6]
+        defense_stage = self._defense_stage[move_rows]
+        defense = self._stats[defender * len(BatchBattleEngine._STATS) + self._defense_stat[move_rows]] * multipliers[
+            defense_stage * BatchBattleEngine._STAGES + stages[defender_rows * staged_stats + defense_stage] + 6]
+
+        critical = self._stats[attacker * len(BatchBattleEngine._STATS) + BatchBattleEngine._SPEED] * multipliers[
+            BatchBattleEngine._SPEED_STAGE * BatchBattleEngine._STAGES + stages[
+                attacker_rows * staged_stats + BatchBattleEngine._SPEED_STAGE] + 6] / 2
+        critical_multiplier = numpy.where(
+            self._rng.randint(1, damage_calculator.CRITICAL_ROLLS + 1, battles.size) <= critical,
+            damage_calculator.CRITICAL_MULTIPLIER, 1)
+        roll = BatchBattleEngine._DAMAGE_ROLLS[self._rng.randint(0, len(BatchBattleEngine._DAMAGE_ROLLS),
+                                                                 battles.size)]
+        effectiveness = self._effectiveness[(self._pairs[battles] * 2 + attackers) * BatchBattleEngine.MAX_MOVES
+                                            + moves]
+        modifier = critical_multiplier * effectiveness * roll / 100
+
+        damage = numpy.maximum(1, numpy.round((self._base_damage[move_rows] * attack / defense / 50 + 5) * modifier))
+        damage = numpy.where(hit & self._damaging[move_rows], damage, 0).astype(hp.dtype)
+        hp[defender_rows] = numpy.maximum(0, hp[defender_rows] - damage)
+
+        effective = hit & self._has_effects[move_rows]
+        if effective.any():
+            stages = self._stages.reshape(-1, staged_stats)
+            effects = self._effects[move_rows[effective]]
+            raised, lowered = attacker_rows[effective], defender_rows[effective]
+            stages[raised] = numpy.minimum(6, stages[raised] + numpy.maximum(effects, 0))
+            stages[lowered] = numpy.maximum(-6, stages[lowered] + numpy.minimum(effects, 0))
+
+        pp = self._pp.reshape(-1, BatchBattleEngine.MAX_MOVES)
+        pp[attacker_rows, moves] = numpy.maximum(0, pp[attacker_rows, moves] - 1)
@@ -0,0 +1,173 @@
+import typing
+
+from models.battle.battle_model import BattleModel
+from models.battle.battle_recorder import BattleRecorder
+from models.battle.expectimax_ai import ExpectimaxAI
+from models.battle.fight_action_model import FightActionModel
+from models.battle.ko_result_model import KoResultModel
+from models.battle.round_result_model import RoundResultModel
+from models.battle.run_action_model import RunActionModel
+from models.battle.shift_action_model import ShiftActionModel
+from models.enumerations.battle_outcome_enum import BattleOutcomeEnum
+from models.enumerations.staged_stat_enum import StagedStatEnum
+from models.enumerations.stat_enum import StatEnum
+from models.pokemon_model import PokemonModel
+
+
+class BattleEngine:
+    """Resolves the rounds of a battle.
+
+    The engine only works on the models: it doesn't need any scene, director
+    or game state, so that a battle can be played headlessly (e.g. to
+    simulate battles). The views only render the results it returns.
+    """
+
+    def __init__(self, battle: BattleModel, ai: ExpectimaxAI = None, recorder: BattleRecorder = None) -> None:
+        """Create a new battle engine.
+
+        :param battle: The data of the battle.
+        :param ai: The AI choosing the moves of the opponent. If None, they are
+        chosen randomly.
+        :param recorder: The recorder logging the rounds and the shifts. If
+        None, the battle isn't recorded.
+        """
+
+        self._battle = battle
+        self._ai = ai
+        self._recorder = recorder
+
+    @property
+    def battle(self) -> BattleModel:
+        """Get the battle resolved by the engine.
+
+        :return: The ``BattleModel``.
+        """
+
+        return self._battle
+
+    def opponent_action(self) -> FightActionModel:
+        """Choose the action of the opponent for the round.
+
+        :return: The ``FightActionModel`` played by the opponent.
+        """
+
+        if self._ai:
+            return FightActionModel(self._battle, False, self._ai.choose_move())
+
+        return FightActionModel(self._battle, False, self._battle.opponent_rng.choice(self._battle.opponent_pokemon.moves))
+
+    def round(self, players_action: typing.Union[FightActionModel, RunActionModel, ShiftActionModel],
+              opponent_action: FightActionModel = None) -> RoundResultModel:
+        """Play a round of the battle.
+
+        :param players_action: The action chosen by the player.
+        :param opponent_action: The action chosen by the opponent. If None, it
+        is chosen by the engine.
+        :return: A ``RoundResultModel`` with the actions in the order they have
+        been played.
+        """
+
+        if opponent_action is None:
+            opponent_action = self.opponent_action()
+
+        if isinstance(players_action, (RunActionModel, ShiftActionModel)):
+            first_action, second_action = players_action, opponent_action
+        else:
+            if self._battle.players_pokemon.effective_stats[StagedStatEnum.SPEED] > \
+                    self._battle.opponent_pokemon.effective_stats[StagedStatEnum.SPEED]:
+                first_action, second_action = players_action, opponent_action
+            else:
+                first_action, second_action = opponent_action, players_action
+
+        fainted_pokemon = None
+        if isinstance(first_action, FightActionModel):
+            fainted_pokemon = self.fight_action(first_action)
+        elif isinstance(first_action, ShiftActionModel):
+            first_action.shift(self._battle)
+
+        if isinstance(second_action, FightActionModel) and second_action.attacker.hp > 0:
+            if not isinstance(first_action, RunActionModel) or (
+                    isinstance(first_action, RunActionModel) and not first_action.is_run_successful()):
+                fainted_pokemon = self.fight_action(second_action)
+
+        round_result = RoundResultModel(first_action, second_action, fainted_pokemon)
+        if self._recorder:
+            self._recorder.record_round(players_action, opponent_action, round_result)
+
+        return round_result
+
+    def shift(self, shift_action: ShiftActionModel) -> None:
+        """Shift the player's pokemon outside of a round (i.e. after a KO).
+
+        :param shift_action: The ``ShiftActionModel``.
+        """
+
+        shift_action.shift(self._battle)
+        if self._recorder:
+            self._recorder.record_shift(shift_action)
+
+    def fight_action(self, fight_action: FightActionModel) -> typing.Union[PokemonModel, None]:
+        """A move has been chosen as an action. Apply its effects.
+
+        :param fight_action: The ``FightActionModel`` containing all the
+        information about the move.
+        :return: The defending pokemon if they fainted, None otherwise.
+        """
+
+        move_effects = fight_action.get_effects()
+
+        fight_action.defender.hp = fight_action.defender.hp + move_effects.hp
+        if fight_action.defender.hp < 0:
+            fight_action.defender.hp = 0
+        elif fight_action.defender.hp > fight_action.defender.stats[StatEnum.HP]:
+            fight_action.defender.hp = fight_action.defender.stats[StatEnum.HP]
+
+        if move_effects.staged_stats:
+            attacker_stages = dict(fight_action.attacker.staged_stats)
+            defender_stages = dict(fight_action.defender.staged_stats)
+            for staged_stat, value in move_effects.staged_stats.items():
+                if value > 0:
+                    attacker_stages[staged_stat] = min(6, attacker_stages[staged_stat] + value)
+                elif value < 0:
+                    defender_stages[staged_stat] = max(-6, defender_stages[staged_stat] + value)
+            fight_action.attacker.staged_stats = attacker_stages
+            fight_action.defender.staged_stats = defender_stages
+
+        fight_action.move.current_pp = fight_action.move.current_pp - 1 if fight_action.move.current_pp > 0 else 0
+
+        return fight_action.defender if fight_action.defender.hp == 0 else None
+
+    def pokemon_ko(self, pokemon_ko: PokemonModel) -> KoResultModel:
+        """A pokemon got defeated.
+
+        The player's pokemon gains some XP if he is the one who won.
+
+        :param pokemon_ko: The pokemon who is KO.
+        :return: A ``KoResultModel`` telling what happens next.
+        """
+
+        if pokemon_ko == self._battle.players_pokemon:
+            if self.has_conscious_pokemon(self._battle.players_pokemons):
+                return KoResultModel(BattleOutcomeEnum.PLAYER_SHIFT)
+
+            return KoResultModel(BattleOutcomeEnum.PLAYER_LOST)
+
+        wild_pokemon = 1 if self._battle.is_wild_pokemon() else 1.5
+        experience_gained = (wild_pokemon * pokemon_ko.species.base_experience * pokemon_ko.level) // 7
+        gained_levels = self._battle.players_pokemon.gain_experience(experience_gained)
+
+        return KoResultModel(BattleOutcomeEnum.PLAYER_WON, experience_gained, gained_levels)
+
+    @staticmethod
+    def has_conscious_pokemon(pokemons: typing.List[PokemonModel]) -> bool:
+        """Get whether at least one of the pokemon has more than 0 HP.
+
+        :param pokemons: A list of ``PokemonModel``.
+        :return: True if at least one pokemon is conscious.
+        """
+
+        for pokemon in pokemons:
+            if pokemon.hp > 0:
+                return True
+
+        return False
@@ -1,20 +1,33 @@
+import random
 import typing
 
 from models.pokemon_model import PokemonModel
-from toolbox.game import Game
 
 
 class BattleModel:
     """The data representing a battle."""
 
-    def __init__(self, opponent_pokemons: typing.List[PokemonModel], place: str) -> None:
+    __slots__ = ("_seed", "_rng", "_opponent_rng", "_players_pokemons", "_opponent_pokemons", "_players_pokemon",
+                 "_opponent_pokemon", "_place")
+
+    def __init__(self, players_pokemons: typing.List[PokemonModel], opponent_pokemons: typing.List[PokemonModel],
+                 place: str, seed: int = None) -> None:
         """Create a new battle.
 
+        :param players_pokemons: The list of the player's pokemon.
         :param opponent_pokemons: The list of opponent fighting pokemon.
         :param place: The place where the battle takes place (i.e. the background).
+        :param seed: The seed of the random number generator of the battle. If
+        None, it is randomly generated.
         """
 
-        self._players_pokemon = self._first_players_pokemon_available(Game().game_state.player.pokemons)
+        self._seed = seed if seed is not None else random.getrandbits(32)
+        self._rng = random.Random(self._seed)
+        self._opponent_rng = random.Random("{0}:opponent".format(self._seed))
+
+        self._players_pokemons = players_pokemons
+        self._opponent_pokemons = opponent_pokemons
+        self._players_pokemon = self._first_players_pokemon_available(players_pokemons)
         self._opponent_pokemon = self._first_players_pokemon_available(opponent_pokemons)
         self._place = place
 
@@ -28,6 +41,24 @@ class BattleModel:
             if pokemon.hp > 0:
                 return pokemon
 
+    @property
+    def players_pokemons(self) -> typing.List[PokemonModel]:
+        """Get the list of the player's pokemon.
+
+        :return: A list of ``PokemonModel``.
+        """
+
+        return self._players_pokemons
+
+    @property
+    def opponent_pokemons(self) -> typing.List[PokemonModel]:
+        """Get the list of the opponent pokemon.
+
+        :return: A list of ``PokemonModel``.
+        """
+
+        return self._opponent_pokemons
+
     @property
     def players_pokemon(self) -> PokemonModel:
         """Get the player's fighting pokemon."""
@@ -66,6 +97,53 @@ class BattleModel:
 
         return self._place
 
+    @property
+    def seed(self) -> int:
+        """Get the seed of the random number generator of the battle.
+
+        Playing the same actions in a battle created with the same seed gives
+        the same results.
+        :return: The seed.
+        """
+
+        return self._seed
+
+    @property
+    def rng(self) -> random.Random:
+        """Get the random number generator of the battle.
+
+        All the random draws of the battle must be made from it.
+        :return: A ``random.Random`` instance.
+        """
+
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng: random.Random) -> None:
+        """Set the random number generator of the battle.
+
+        It must be set before the first round and be seeded with the seed of
+        the battle (e.g. to record the random draws).
+
+        :param rng: A ``random.Random`` instance.
+        """
+
+        self._rng = rng
+
+    @property
+    def opponent_rng(self) -> random.Random:
+        """Get the random number generator used to choose the actions of the
+        opponent.
+
+        It is derived from the seed of the battle but kept apart from ``rng``,
+        so that a round can be played again from the recorded actions
+        whatever the way the opponent chose them.
+
+        :return: A ``random.Random`` instance.
+        """
+
+        return self._opponent_rng
+
     def shift_players_pokemon(self, players_pokemon: PokemonModel) -> PokemonModel:
         """Shift the player's pokemon with the specified one and return the
         previously fighting pokemon.
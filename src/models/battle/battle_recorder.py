@@ -0,0 +1,194 @@
+import struct
+import typing
+
+from models.battle.battle_model import BattleModel
+from models.battle.fight_action_model import FightActionModel
+from models.battle.recording_random import RecordingRandom
+from models.battle.round_result_model import RoundResultModel
+from models.battle.run_action_model import RunActionModel
+from models.battle.shift_action_model import ShiftActionModel
+from models.battle.used_move_effects_model import UsedMoveEffectsModel
+from models.enumerations.move_effectiveness_enum import MoveEffectivenessEnum
+from models.enumerations.staged_stat_enum import StagedStatEnum
+from models.enumerations.stat_enum import StatEnum
+from models.pokemon_model import PokemonModel
+
+
+class BattleRecorder:
+    """Records a battle into a compact append-only binary log.
+
+    The log starts with a header containing the seed of the battle, its place
+    and both parties. Then a record is appended for every round, with the
+    chosen actions, the random draws of the round and the effects of the
+    moves, and for every shift happening outside of a round. The file is
+    flushed after each record so that a log is usable even if the game
+    crashed.
+
+    All the numbers are little-endian. The strings are prefixed by their
+    length in bytes.
+
+    Attributes:
+        - MAGIC: The bytes starting every log.
+        - VERSION: The version of the format of the log.
+        - ROUND_RECORD: The type of the record of a round.
+        - SHIFT_RECORD: The type of the record of a shift outside of a round.
+        - FIGHT_ACTION, RUN_ACTION, SHIFT_ACTION: The types of the actions of
+            the player.
+        - NO_EFFECTIVENESS: The code of an effectiveness which doesn't apply.
+    """
+
+    MAGIC = b"PYMONLOG"
+    VERSION = 1
+
+    ROUND_RECORD = 1
+    SHIFT_RECORD = 2
+
+    FIGHT_ACTION = 0
+    RUN_ACTION = 1
+    SHIFT_ACTION = 2
+
+    NO_EFFECTIVENESS = 255
+
+    STAGED_STATS = tuple(StagedStatEnum)
+    STATS = tuple(StatEnum)
+    EFFECTIVENESS = tuple(MoveEffectivenessEnum)
+
+    HEADER = struct.Struct("<8sBQ")
+    POKEMON = struct.Struct("<BHI6B6bB")
+    LEARNED_MOVE = struct.Struct("<BB")
+    ROUND = struct.Struct("<BBBH")
+    DRAW = struct.Struct("<Q")
+    EFFECTS = struct.Struct("<BBhBBB")
+    STAGED_STAT = struct.Struct("<Bb")
+    BYTE = struct.Struct("<B")
+
+    def __init__(self, battle: BattleModel, path: str) -> None:
+        """Start recording a battle.
+
+        The random number generator of the battle is replaced by one recording
+        its draws, so the recorder must be created before the first round.
+
+        :param battle: The battle to record.
+        :param path: The path of the log file. It is overwritten.
+        """
+
+        self._battle = battle
+        battle.rng = RecordingRandom(battle.seed)
+
+        self._file = open(path, "wb")
+        self._file.write(BattleRecorder.HEADER.pack(BattleRecorder.MAGIC, BattleRecorder.VERSION, battle.seed))
+        self._file.write(BattleRecorder.pack_string(battle.place))
+        for party in (battle.players_pokemons, battle.opponent_pokemons):
+            self._file.write(BattleRecorder.BYTE.pack(len(party)))
+            for pokemon in party:
+                self._file.write(BattleRecorder.pack_pokemon(pokemon))
+        self._file.flush()
+
+    def record_round(self, players_action: typing.Union[FightActionModel, RunActionModel, ShiftActionModel],
+                     opponent_action: FightActionModel, round_result: RoundResultModel) -> None:
+        """Append the record of a round.
+
+        :param players_action: The action chosen by the player.
+        :param opponent_action: The action chosen by the opponent.
+        :param round_result: The result of the round.
+        """
+
+        if isinstance(players_action, FightActionModel):
+            action_type = BattleRecorder.FIGHT_ACTION
+            argument = players_action.attacker.moves.index(players_action.move)
+        elif isinstance(players_action, ShiftActionModel):
+            action_type = BattleRecorder.SHIFT_ACTION
+            argument = self._battle.players_pokemons.index(players_action.pokemon)
+        else:
+            action_type = BattleRecorder.RUN_ACTION
+            argument = 0
+
+        draws = self._battle.rng.pop_draws()
+        effects = [(action.attacker is self._battle.players_pokemon, action.effects)
+                   for action in (round_result.first_action, round_result.second_action)
+                   if isinstance(action, FightActionModel) and action.effects is not None]
+
+        record = bytearray(BattleRecorder.BYTE.pack(BattleRecorder.ROUND_RECORD))
+        record += BattleRecorder.ROUND.pack(action_type, argument,
+                                            opponent_action.attacker.moves.index(opponent_action.move), len(draws))
+        for draw in draws:
+            record += BattleRecorder.DRAW.pack(draw)
+        record += BattleRecorder.BYTE.pack(len(effects))
+        for attacker_is_player, used_move_effects in effects:
+            record += BattleRecorder.pack_effects(attacker_is_player, used_move_effects)
+        record += BattleRecorder.BYTE.pack(round_result.run_successful)
+
+        self._write(record)
+
+    def record_shift(self, shift_action: ShiftActionModel) -> None:
+        """Append the record of a shift happening outside of a round.
+
+        :param shift_action: The ``ShiftActionModel``.
+        """
+
+        self._write(BattleRecorder.BYTE.pack(BattleRecorder.SHIFT_RECORD)
+                    + BattleRecorder.BYTE.pack(self._battle.players_pokemons.index(shift_action.pokemon)))
+
+    def close(self) -> None:
+        """Stop recording."""
+
+        self._file.close()
+
+    def _write(self, record: bytes) -> None:
+        """Append a record to the log.
+
+        :param record: The bytes of the record.
+        """
+
+        self._file.write(record)
+        self._file.flush()
+
+    @staticmethod
+    def pack_string(string: str) -> bytes:
+        """Encode a string.
+
+        :param string: The string.
+        :return: The bytes of the string prefixed by its length.
+        """
+
+        encoded = string.encode("utf-8")
+
+        return BattleRecorder.BYTE.pack(len(encoded)) + encoded
+
+    @staticmethod
+    def pack_pokemon(pokemon: PokemonModel) -> bytes:
+        """Encode a pokemon.
+
+        :param pokemon: The ``PokemonModel``.
+        :return: The bytes of the pokemon.
+        """
+
+        data = BattleRecorder.pack_string(pokemon.species.id) + BattleRecorder.pack_string(pokemon.nickname)
+        data += BattleRecorder.POKEMON.pack(pokemon.level, pokemon.hp, pokemon.experience,
+                                            *(pokemon.iv[stat] for stat in BattleRecorder.STATS),
+                                            *(pokemon.staged_stats[stat] for stat in BattleRecorder.STAGED_STATS),
+                                            len(pokemon.moves))
+        for learned_move in pokemon.moves:
+            data += BattleRecorder.pack_string(learned_move.move.id)
+            data += BattleRecorder.LEARNED_MOVE.pack(learned_move.pp, learned_move.current_pp)
+
+        return data
+
+    @staticmethod
+    def pack_effects(attacker_is_player: bool, effects: UsedMoveEffectsModel) -> bytes:
+        """Encode the effects of a used move.
+
+        :param attacker_is_player: Whether the move was used by the player's
+        pokemon.
+        :param effects: The ``UsedMoveEffectsModel``.
+        :return: The bytes of the effects.
+        """
+
+        effectiveness = BattleRecorder.EFFECTIVENESS.index(effects.effectiveness) \
+            if effects.effectiveness is not None else BattleRecorder.NO_EFFECTIVENESS
+        data = BattleRecorder.EFFECTS.pack(attacker_is_player, effects.failed, effects.hp, effectiveness,
+                                           effects.critical_hit, len(effects.staged_stats))
+        for staged_stat, value in effects.staged_stats.items():
+            data += BattleRecorder.STAGED_STAT.pack(BattleRecorder.STAGED_STATS.index(staged_stat), value)
+
+        return data
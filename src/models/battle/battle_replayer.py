@@ -0,0 +1,217 @@
+import struct
+import typing
+
+from models.battle.battle_engine import BattleEngine
+from models.battle.battle_model import BattleModel
+from models.battle.battle_recorder import BattleRecorder
+from models.battle.fight_action_model import FightActionModel
+from models.battle.recording_random import RecordingRandom
+from models.battle.replay_mismatch_error import ReplayMismatchError
+from models.battle.round_result_model import RoundResultModel
+from models.battle.run_action_model import RunActionModel
+from models.battle.shift_action_model import ShiftActionModel
+from models.learned_move_model import LearnedMoveModel
+from models.pokemon_model import PokemonModel
+from toolbox.data.moves import moves
+from toolbox.data.pokemon import pokemons
+
+
+class BattleReplayer:
+    """Plays a battle again from the log written by a ``BattleRecorder``.
+
+    The parties are rebuilt from the header of the log and every record is
+    executed again by a ``BattleEngine``, with the actions which have been
+    recorded. The random draws and the effects of the moves are compared to
+    the recorded ones, so that any change of the engine altering the course of
+    the battle is detected.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Load a battle log.
+
+        :param path: The path of the log file.
+        """
+
+        with open(path, "rb") as file:
+            self._data = file.read()
+        self._offset = 0
+
+        magic, version, seed = self._unpack(BattleRecorder.HEADER)
+        if magic != BattleRecorder.MAGIC or version != BattleRecorder.VERSION:
+            raise ValueError("{0} is not a battle log of version {1}.".format(path, BattleRecorder.VERSION))
+
+        place = self._unpack_string()
+        parties = [[self._unpack_pokemon() for _ in range(self._unpack(BattleRecorder.BYTE)[0])]
+                   for _ in range(2)]
+
+        self._battle = BattleModel(parties[0], parties[1], place, seed)
+        self._battle.rng = RecordingRandom(seed)
+        self._engine = BattleEngine(self._battle)
+        self._records_offset = self._offset
+
+    @property
+    def battle(self) -> BattleModel:
+        """Get the replayed battle.
+
+        :return: The ``BattleModel``.
+        """
+
+        return self._battle
+
+    @property
+    def engine(self) -> BattleEngine:
+        """Get the engine replaying the battle.
+
+        :return: The ``BattleEngine``.
+        """
+
+        return self._engine
+
+    def steps(self) -> typing.Generator[typing.Union[RoundResultModel, ShiftActionModel], None, None]:
+        """Execute the records of the log one by one.
+
+        The KO are left to the caller, who is expected to call
+        ``engine.pokemon_ko`` like the battle controller does.
+
+        :return: A generator of the ``RoundResultModel`` of each round and of
+        the ``ShiftActionModel`` of each shift happening outside of a round.
+        """
+
+        self._offset = self._records_offset
+        round_number = 0
+
+        while self._offset < len(self._data):
+            record_type, = self._unpack(BattleRecorder.BYTE)
+
+            if record_type == BattleRecorder.SHIFT_RECORD:
+                shift_action = ShiftActionModel(self._battle.players_pokemons[self._unpack(BattleRecorder.BYTE)[0]])
+                self._engine.shift(shift_action)
+                yield shift_action
+            elif record_type == BattleRecorder.ROUND_RECORD:
+                round_number += 1
+                yield self._replay_round(round_number)
+            else:
+                raise ValueError("Unknown record type {0} at offset {1}.".format(record_type, self._offset - 1))
+
+    def replay(self) -> int:
+        """Replay the whole battle at full speed.
+
+        :return: The number of rounds played.
+        """
+
+        rounds = 0
+        for step in self.steps():
+            if isinstance(step, RoundResultModel):
+                rounds += 1
+                if step.fainted_pokemon:
+                    self._engine.pokemon_ko(step.fainted_pokemon)
+
+        return rounds
+
+    def _replay_round(self, round_number: int) -> RoundResultModel:
+        """Execute a round record and check its outcome.
+
+        :param round_number: The number of the round, starting from 1.
+        :return: The ``RoundResultModel`` of the round.
+        """
+
+        action_type, argument, opponent_move, draws_count = self._unpack(BattleRecorder.ROUND)
+        recorded_draws = list(struct.unpack_from("<{0}Q".format(draws_count), self._data, self._offset))
+        self._offset += draws_count * BattleRecorder.DRAW.size
+
+        if action_type == BattleRecorder.FIGHT_ACTION:
+            players_action = FightActionModel(self._battle, True, self._battle.players_pokemon.moves[argument])
+        elif action_type == BattleRecorder.SHIFT_ACTION:
+            players_action = ShiftActionModel(self._battle.players_pokemons[argument])
+        else:
+            players_action = RunActionModel(self._battle.players_pokemon, self._battle.opponent_pokemon,
+                                            self._battle.rng)
+        opponent_action = FightActionModel(self._battle, False, self._battle.opponent_pokemon.moves[opponent_move])
+
+        round_result = self._engine.round(players_action, opponent_action)
+
+        if self._battle.rng.pop_draws() != recorded_draws:
+            raise ReplayMismatchError(round_number, "the random draws differ.")
+
+        effects = [BattleRecorder.pack_effects(action.attacker is self._battle.players_pokemon, action.effects)
+                   for action in (round_result.first_action, round_result.second_action)
+                   if isinstance(action, FightActionModel) and action.effects is not None]
+        recorded_effects = [self._unpack_effects() for _ in range(self._unpack(BattleRecorder.BYTE)[0])]
+        if effects != recorded_effects:
+            raise ReplayMismatchError(round_number, "the effects of the moves differ.")
+
+        if round_result.run_successful != bool(self._unpack(BattleRecorder.BYTE)[0]):
+            raise ReplayMismatchError(round_number, "the outcome of the run differs.")
+
+        return round_result
+
+    def _unpack(self, structure: struct.Struct) -> typing.Tuple:
+        """Read the next values of the log.
+
+        :param structure: The ``struct.Struct`` of the values.
+        :return: The tuple of the values.
+        """
+
+        values = structure.unpack_from(self._data, self._offset)
+        self._offset += structure.size
+
+        return values
+
+    def _unpack_bytes(self, size: int) -> bytes:
+        """Read the next bytes of the log.
+
+        :param size: The number of bytes.
+        :return: The bytes.
+        """
+
+        data = self._data[self._offset:self._offset + size]
+        self._offset += size
+
+        return data
+
+    def _unpack_string(self) -> str:
+        """Read the next string of the log.
+
+        :return: The string.
+        """
+
+        return self._unpack_bytes(self._unpack(BattleRecorder.BYTE)[0]).decode("utf-8")
+
+    def _unpack_pokemon(self) -> PokemonModel:
+        """Read the next pokemon of the log.
+
+        :return: A new ``PokemonModel``.
+        """
+
+        species = pokemons[self._unpack_string()]
+        nickname = self._unpack_string()
+        values = self._unpack(BattleRecorder.POKEMON)
+        level, hp, experience = values[:3]
+        iv = dict(zip(BattleRecorder.STATS, values[3:9]))
+        staged_stats = dict(zip(BattleRecorder.STAGED_STATS, values[9:15]))
+
+        learned_moves = []
+        for _ in range(values[15]):
+            move = moves[self._unpack_string()]
+            pp, current_pp = self._unpack(BattleRecorder.LEARNED_MOVE)
+            learned_move = LearnedMoveModel(move, pp)
+            learned_move.current_pp = current_pp
+            learned_moves.append(learned_move)
+
+        pokemon = PokemonModel(species, nickname, level, learned_moves, hp, experience, iv)
+        pokemon.staged_stats = staged_stats
+
+        return pokemon
+
+    def _unpack_effects(self) -> bytes:
+        """Read the next effects of a used move of the log.
+
+        :return: The encoded effects, as written by
+        ``BattleRecorder.pack_effects``.
+        """
+
+        start = self._offset
+        staged_stats = self._unpack(BattleRecorder.EFFECTS)[-1]
+        self._offset += staged_stats * BattleRecorder.STAGED_STAT.size
+
+        return self._data[start:self._offset]
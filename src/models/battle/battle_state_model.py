@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import typing
+
+from models.battle.battle_model import BattleModel
+from models.enumerations.staged_stat_enum import StagedStatEnum
+from models.pokemon_model import PokemonModel
+
+
+class BattleStateModel:
+    """A compact and immutable snapshot of the state of a battle.
+
+    It only contains what changes during a battle: the HP, the current PP of
+    each learned move and the staged stats of every pokemon of both parties,
+    as well as the index of the fighting pokemon in each party. The species and
+    the moves are never copied, so that taking a snapshot and restoring it is
+    cheap enough to be done many times per round (e.g. for a search or a
+    rewind).
+
+    The values are stored in tuples indexed first by side (0 for the player,
+    1 for the opponent) then by the index of the pokemon in the party. The
+    staged stats follow the order of ``StagedStatEnum``.
+    """
+
+    __slots__ = ("_hp", "_pp", "_staged_stats", "_slots")
+
+    _STAGED_STATS = tuple(StagedStatEnum)
+
+    def __init__(self, hp: typing.Tuple[typing.Tuple[int, ...], ...],
+                 pp: typing.Tuple[typing.Tuple[typing.Tuple[int, ...], ...], ...],
+                 staged_stats: typing.Tuple[typing.Tuple[typing.Tuple[int, ...], ...], ...],
+                 slots: typing.Tuple[int, int]) -> None:
+        """Create a new battle state.
+
+        :param hp: The HP of each pokemon.
+        :param pp: The current PP of each learned move of each pokemon.
+        :param staged_stats: The staged stats of each pokemon.
+        :param slots: The index of the fighting pokemon in each party.
+        """
+
+        self._hp = hp
+        self._pp = pp
+        self._staged_stats = staged_stats
+        self._slots = slots
+
+    @classmethod
+    def from_battle(cls, battle: BattleModel) -> BattleStateModel:
+        """Take a snapshot of a battle.
+
+        :param battle: The ``BattleModel``.
+        :return: A new ``BattleStateModel``.
+        """
+
+        parties = (battle.players_pokemons, battle.opponent_pokemons)
+
+        return cls(tuple(tuple(pokemon.hp for pokemon in party) for party in parties),
+                   tuple(tuple(tuple(learned_move.current_pp for learned_move in pokemon.moves)
+                               for pokemon in party) for party in parties),
+                   tuple(tuple(tuple(pokemon.staged_stats[stat] for stat in cls._STAGED_STATS)
+                               for pokemon in party) for party in parties),
+                   (cls._slot(battle.players_pokemons, battle.players_pokemon),
+                    cls._slot(battle.opponent_pokemons, battle.opponent_pokemon)))
+
+    def to_battle(self, battle: BattleModel) -> None:
+        """Restore the snapshot into a battle.
+
+        The battle must have the same parties, with the same moves, as the
+        battle the snapshot was taken from.
+
+        :param battle: The ``BattleModel``.
+        """
+
+        parties = (battle.players_pokemons, battle.opponent_pokemons)
+
+        for side, party in enumerate(parties):
+            for index, pokemon in enumerate(party):
+                pokemon.hp = self._hp[side][index]
+                for learned_move, current_pp in zip(pokemon.moves, self._pp[side][index]):
+                    learned_move.current_pp = current_pp
+                pokemon.staged_stats = dict(zip(BattleStateModel._STAGED_STATS, self._staged_stats[side][index]))
+
+        battle.players_pokemon = battle.players_pokemons[self._slots[0]]
+        battle.opponent_pokemon = battle.opponent_pokemons[self._slots[1]]
+
+    @staticmethod
+    def _slot(party: typing.List[PokemonModel], pokemon: PokemonModel) -> int:
+        """Get the index of a pokemon in their party.
+
+        :param party: A list of ``PokemonModel``.
+        :param pokemon: The ``PokemonModel``.
+        :return: The index of the pokemon.
+        """
+
+        for index, member in enumerate(party):
+            if member is pokemon:
+                return index
+
+        raise ValueError("The pokemon is not part of the party.")
+
+    @property
+    def hp(self) -> typing.Tuple[typing.Tuple[int, ...], ...]:
+        """Get the HP of each pokemon.
+
+        :return: A tuple of HP per party.
+        """
+
+        return self._hp
+
+    @property
+    def pp(self) -> typing.Tuple[typing.Tuple[typing.Tuple[int, ...], ...], ...]:
+        """Get the current PP of each learned move of each pokemon.
+
+        :return: A tuple of PP per pokemon per party.
+        """
+
+        return self._pp
+
+    @property
+    def staged_stats(self) -> typing.Tuple[typing.Tuple[typing.Tuple[int, ...], ...], ...]:
+        """Get the staged stats of each pokemon.
+
+        :return: A tuple of staged stats per pokemon per party.
+        """
+
+        return self._staged_stats
+
+    @property
+    def slots(self) -> typing.Tuple[int, int]:
+        """Get the index of the fighting pokemon in each party.
+
+        :return: The index in the player's party and in the opponent's.
+        """
+
+        return self._slots
+
+    def __eq__(self, other: typing.Any) -> bool:
+        """Get whether two snapshots describe the same state.
+
+        :param other: The other object.
+        :return: True if both states are equal.
+        """
+
+        return isinstance(other, BattleStateModel) and self._key() == other._key()
+
+    def __hash__(self) -> int:
+        """Get the hash of the state, so that it can be used as a key.
+
+        :return: The hash.
+        """
+
+        return hash(self._key())
+
+    def _key(self) -> typing.Tuple:
+        """Get the tuple of all the values of the state.
+
+        :return: A tuple.
+        """
+
+        return self._hp, self._pp, self._staged_stats, self._slots
@@ -0,0 +1,199 @@
+import functools
+import typing
+
+import numpy
+
+from models.battle.damage_distribution_model import DamageDistributionModel
+from models.enumerations.move_category_enum import MoveCategoryEnum
+from models.enumerations.staged_stat_enum import StagedStatEnum
+from models.enumerations.stat_enum import StatEnum
+from models.move_model import MoveModel
+from models.pokemon_model import PokemonModel
+
+"""This module is meant to calculate the damage inflicted by a move.
+
+The same formulas are used to draw the damage of a move during a battle and to
+calculate the exact distribution of the damage. The distributions are cached
+by the values which influence them, so that the AI and the simulations can
+read them as often as needed.
+"""
+
+CRITICAL_MULTIPLIER = 1.5
+DAMAGE_ROLLS = tuple(range(85, 101))
+ACCURACY_ROLLS = 100
+CRITICAL_ROLLS = 256
+DISTRIBUTION_CACHE_SIZE = 4096
+
+
+def is_damaging(move: MoveModel) -> bool:
+    """Get whether the move inflicts damage.
+
+    :param move: The ``MoveModel``.
+    :return: True if the move is physical or special.
+    """
+
+    return move.category in [MoveCategoryEnum.PHYSICAL, MoveCategoryEnum.SPECIAL]
+
+
+def accuracy_threshold(attacker: PokemonModel, move: MoveModel) -> typing.Union[float, None]:
+    """Get the highest roll out of ``ACCURACY_ROLLS`` for which the move hits.
+
+    :param attacker: The attacking pokemon.
+    :param move: The used move.
+    :return: The threshold or None if the move can't miss.
+    """
+
+    return move.accuracy * attacker.effective_stats[StagedStatEnum.ACCURACY] if move.accuracy else None
+
+
+def staged_accuracy_threshold(accuracy: typing.Union[int, None], stage: int) -> typing.Union[float, None]:
+    """Get the highest roll out of ``ACCURACY_ROLLS`` for which a move hits.
+
+    :param accuracy: The accuracy of the move or None if it can't miss.
+    :param stage: The accuracy stage of the attacking pokemon.
+    :return: The threshold or None if the move can't miss.
+    """
+
+    return accuracy * StagedStatEnum.ACCURACY.get_multiplier(stage) if accuracy else None
+
+
+def critical_threshold(attacker: PokemonModel) -> float:
+    """Get the highest roll out of ``CRITICAL_ROLLS`` for which the move is a
+    critical hit.
+
+    :param attacker: The attacking pokemon.
+    :return: The threshold.
+    """
+
+    return attacker.effective_stats[StagedStatEnum.SPEED] / 2
+
+
+def staged_critical_threshold(speed: int, stage: int) -> float:
+    """Get the highest roll out of ``CRITICAL_ROLLS`` for which a move is a
+    critical hit.
+
+    :param speed: The speed of the attacking pokemon.
+    :param stage: The speed stage of the attacking pokemon.
+    :return: The threshold.
+    """
+
+    return speed * StagedStatEnum.SPEED.get_multiplier(stage) / 2
+
+
+def attack_and_defense(attacker: PokemonModel, defender: PokemonModel,
+                       move: MoveModel) -> typing.Tuple[float, float]:
+    """Get the staged attack of the attacker and the staged defense of the
+    defender relevant to the category of the move.
+
+    :param attacker: The attacking pokemon.
+    :param defender: The defending pokemon.
+    :param move: The used move.
+    :return: The attack and the defense.
+    """
+
+    if move.category == MoveCategoryEnum.PHYSICAL:
+        return attacker.effective_stats[StagedStatEnum.ATTACK], defender.effective_stats[StagedStatEnum.DEFENSE]
+
+    # The special defense is staged from the special attack, as in staged_attack_and_defense.
+    defense = defender.stats[StatEnum.SPECIAL_ATTACK] * StagedStatEnum.SPECIAL_DEFENSE.get_multiplier(
+        defender.staged_stats[StagedStatEnum.SPECIAL_DEFENSE])
+
+    return attacker.effective_stats[StagedStatEnum.SPECIAL_ATTACK], defense
+
+
+def staged_attack_and_defense(category: MoveCategoryEnum, attacker_stats: typing.Mapping[StatEnum, int],
+                              attacker_stages: typing.Mapping[StagedStatEnum, int],
+                              defender_stats: typing.Mapping[StatEnum, int],
+                              defender_stages: typing.Mapping[StagedStatEnum, int]) -> typing.Tuple[float, float]:
+    """Get the staged attack and defense relevant to the category of a move.
+
+    :param category: The category of the move.
+    :param attacker_stats: The stats of the attacking pokemon.
+    :param attacker_stages: The staged stats of the attacking pokemon.
+    :param defender_stats: The stats of the defending pokemon.
+    :param defender_stages: The staged stats of the defending pokemon.
+    :return: The attack and the defense.
+    """
+
+    if category == MoveCategoryEnum.PHYSICAL:
+        attack = attacker_stats[StatEnum.ATTACK] * StagedStatEnum.ATTACK.get_multiplier(
+            attacker_stages[StagedStatEnum.ATTACK])
+        defense = defender_stats[StatEnum.DEFENSE] * StagedStatEnum.DEFENSE.get_multiplier(
+            defender_stages[StagedStatEnum.DEFENSE])
+    else:
+        attack = attacker_stats[StatEnum.SPECIAL_ATTACK] * StagedStatEnum.SPECIAL_ATTACK.get_multiplier(
+            attacker_stages[StagedStatEnum.SPECIAL_ATTACK])
+        defense = defender_stats[StatEnum.SPECIAL_ATTACK] * StagedStatEnum.SPECIAL_DEFENSE.get_multiplier(
+            defender_stages[StagedStatEnum.SPECIAL_DEFENSE])
+
+    return attack, defense
+
+
+def damage(level: int, power: int, attack: float, defense: float, modifier: float) -> int:
+    """Calculate the damage inflicted by a move.
+
+    :param level: The level of the attacking pokemon.
+    :param power: The power of the move.
+    :param attack: The staged attack of the attacking pokemon.
+    :param defense: The staged defense of the defending pokemon.
+    :param modifier: The product of the critical hit multiplier, the
+    effectiveness and the damage roll.
+    :return: The number of HP lost by the defender (at least 1).
+    """
+
+    return max(1, round(((2 * level / 5 + 2) * power * attack / defense / 50 + 5) * modifier))
+
+
+def damage_distribution(attacker: PokemonModel, defender: PokemonModel, move: MoveModel) -> DamageDistributionModel:
+    """Get the exact distribution of the damage inflicted by a move given the
+    current stats and staged stats of both pokemon.
+
+    :param attacker: The attacking pokemon.
+    :param defender: The defending pokemon.
+    :param move: The used move.
+    :return: A ``DamageDistributionModel``.
+    """
+
+    if not is_damaging(move):
+        return cached_damage_distribution(0, 0, 0, 1, 0, accuracy_threshold(attacker, move), 0)
+
+    attack, defense = attack_and_defense(attacker, defender, move)
+
+    return cached_damage_distribution(attacker.level, move.power, attack, defense,
+                                      move.type.effectiveness(defender.species.type).value,
+                                      accuracy_threshold(attacker, move), critical_threshold(attacker))
+
+
+@functools.lru_cache(maxsize=DISTRIBUTION_CACHE_SIZE)
+def cached_damage_distribution(level: int, power: int, attack: float, defense: float, effectiveness: float,
+                               accuracy: typing.Union[float, None], critical: float) -> DamageDistributionModel:
+    """Calculate the exact distribution of the damage of a move.
+
+    A power of 0 stands for a move inflicting no damage.
+
+    :param level: The level of the attacking pokemon.
+    :param power: The power of the move.
+    :param attack: The staged attack of the attacking pokemon.
+    :param defense: The staged defense of the defending pokemon.
+    :param effectiveness: The multiplier of the effectiveness of the move.
+    :param accuracy: The accuracy threshold of the move or None if it can't
+    miss.
+    :param critical: The critical hit threshold of the attacker.
+    :return: A ``DamageDistributionModel``.
+    """
+
+    hit_probability = min(ACCURACY_ROLLS, int(accuracy)) / ACCURACY_ROLLS if accuracy is not None else 1
+    critical_probability = min(CRITICAL_ROLLS, int(critical)) / CRITICAL_ROLLS
+
+    damages = numpy.zeros((2, len(DAMAGE_ROLLS)), dtype=numpy.int32)
+    if power:
+        for critical_hit, critical_multiplier in enumerate((1, CRITICAL_MULTIPLIER)):
+            for index, roll in enumerate(DAMAGE_ROLLS):
+                damages[critical_hit, index] = damage(level, power, attack, defense,
+                                                      critical_multiplier * effectiveness * roll / 100)
+
+    probabilities = numpy.empty((2, len(DAMAGE_ROLLS)))
+    probabilities[0] = hit_probability * (1 - critical_probability) / len(DAMAGE_ROLLS)
+    probabilities[1] = hit_probability * critical_probability / len(DAMAGE_ROLLS)
+
+    return DamageDistributionModel(damages, probabilities, 1 - hit_probability)
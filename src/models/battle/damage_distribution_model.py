@@ -0,0 +1,75 @@
+import numpy
+
+
+class DamageDistributionModel:
+    """The exact distribution of the damage a move can inflict.
+
+    The damage is indexed by ``[critical_hit, damage_roll]``: the first row
+    contains the damage of the 16 damage rolls without a critical hit, the
+    second row with a critical hit. The probabilities have the same layout and
+    sum to the probability of the move hitting its target.
+
+    The arrays are read-only since a distribution is shared by everyone asking
+    for the same matchup.
+    """
+
+    def __init__(self, damages: numpy.ndarray, probabilities: numpy.ndarray, miss_probability: float) -> None:
+        """Create a new damage distribution.
+
+        :param damages: A 2x16 array of damage.
+        :param probabilities: A 2x16 array with the probability of each
+        damage.
+        :param miss_probability: The probability of the move missing.
+        """
+
+        damages.setflags(write=False)
+        probabilities.setflags(write=False)
+        self._damages = damages
+        self._probabilities = probabilities
+        self._miss_probability = miss_probability
+
+    @property
+    def damages(self) -> numpy.ndarray:
+        """Get the damage of each outcome of the move when it hits.
+
+        :return: A 2x16 array of damage.
+        """
+
+        return self._damages
+
+    @property
+    def probabilities(self) -> numpy.ndarray:
+        """Get the probability of each outcome of the move when it hits.
+
+        :return: A 2x16 array of probabilities.
+        """
+
+        return self._probabilities
+
+    @property
+    def miss_probability(self) -> float:
+        """Get the probability of the move missing its target.
+
+        :return: A value between 0 and 1.
+        """
+
+        return self._miss_probability
+
+    @property
+    def expected_damage(self) -> float:
+        """Get the average damage of the move, misses included.
+
+        :return: The expected damage.
+        """
+
+        return float((self._damages * self._probabilities).sum())
+
+    def ko_probability(self, hp: int) -> float:
+        """Get the probability of the move making a pokemon with the given HP
+        faint.
+
+        :param hp: The current HP of the defending pokemon.
+        :return: A value between 0 and 1.
+        """
+
+        return float(self._probabilities[self._damages >= hp].sum())
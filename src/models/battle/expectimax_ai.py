@@ -0,0 +1,337 @@
+import time
+import typing
+
+from models.battle import damage_calculator
+from models.battle.battle_model import BattleModel
+from models.enumerations.difficulty_enum import DifficultyEnum
+from models.enumerations.staged_stat_enum import StagedStatEnum
+from models.enumerations.stat_enum import StatEnum
+from models.learned_move_model import LearnedMoveModel
+from models.pokemon_model import PokemonModel
+
+
+class _SearchTimeout(Exception):
+    """Raised when the AI has spent all of its time budget."""
+
+
+class ExpectimaxAI:
+    """Chooses the moves of the opponent by searching the possible outcomes of
+    the next rounds.
+
+    The player is expected to choose their moves randomly and every move has
+    chance outcomes (miss, critical hit, damage roll). The AI chooses the move
+    with the best expected evaluation, deepening the search one round at a
+    time until its time budget is spent.
+
+    A battle state is the tuple ``(opponent HP, player HP, opponent stages,
+    player stages)``. The PP are left out since they don't restrict the moves
+    in the battle engine. The value of the states already searched is kept in a
+    transposition table as long as the same two pokemon fight.
+
+    Attributes:
+        - CHANCE_BUCKETS: The maximum number of damage outcomes of a move
+            (KO excluded). Close outcomes are merged to keep the search
+            narrow.
+        - STAGE_WEIGHT: The value of one stage in the evaluation.
+        - WIN_VALUE: The value of a state where the player's pokemon is KO.
+    """
+
+    CHANCE_BUCKETS = 3
+    STAGE_WEIGHT = 0.01
+    WIN_VALUE = 10
+    _STAGED_STATS = tuple(StagedStatEnum)
+
+    def __init__(self, battle: BattleModel, difficulty: DifficultyEnum = DifficultyEnum.NORMAL,
+                 budget: float = None) -> None:
+        """Create a new AI.
+
+        :param battle: The data of the battle.
+        :param difficulty: The difficulty level of the AI.
+        :param budget: The time the AI can spend choosing a move in
+        milliseconds. If None, it is the budget of the difficulty level.
+        """
+
+        self._battle = battle
+        self._difficulty = difficulty
+        self._budget = budget if budget is not None else difficulty.budget
+        self._pokemons = None
+        self._transpositions = dict()
+        self._outcomes = dict()
+        self._deadline = None
+        self._depth = 0
+
+    @property
+    def difficulty(self) -> DifficultyEnum:
+        """Get the difficulty level of the AI.
+
+        :return: A ``DifficultyEnum``.
+        """
+
+        return self._difficulty
+
+    @property
+    def depth(self) -> int:
+        """Get the number of rounds the last search completely looked ahead.
+
+        :return: The depth of the last search.
+        """
+
+        return self._depth
+
+    def choose_move(self) -> LearnedMoveModel:
+        """Choose the move of the opponent pokemon for the round.
+
+        :return: The ``LearnedMoveModel`` to use.
+        """
+
+        moves = self._battle.opponent_pokemon.moves
+        if self._difficulty.max_depth == 0 or len(moves) == 1:
+            return self._battle.opponent_rng.choice(moves)
+
+        self._prepare()
+        state = self._state(self._battle.opponent_pokemon, self._battle.players_pokemon)
+        self._deadline = time.perf_counter() + self._budget / 1000
+        best_move = 0
+        self._depth = 0
+
+        for depth in range(1, self._difficulty.max_depth + 1):
+            try:
+                best_move = self._best_move(state, depth)
+                self._depth = depth
+            except _SearchTimeout:
+                break
+
+        return moves[best_move]
+
+    def _prepare(self) -> None:
+        """Gather the data needed by the search about the fighting pokemon.
+
+        The transposition table is emptied when one of the pokemon changed.
+        """
+
+        pokemons = (self._battle.opponent_pokemon, self._battle.players_pokemon)
+        if self._pokemons == pokemons:
+            return
+
+        self._pokemons = pokemons
+        self._transpositions.clear()
+        self._outcomes.clear()
+        self._sides = (self._side(pokemons[0], pokemons[1]), self._side(pokemons[1], pokemons[0]))
+
+    @staticmethod
+    def _side(pokemon: PokemonModel, other: PokemonModel) -> typing.Tuple:
+        """Get the data of a pokemon used by the search.
+
+        :param pokemon: The pokemon.
+        :param other: The pokemon they fight.
+        :return: A tuple with the pokemon, their maximum HP and, for each move,
+        the move and its effectiveness against the other pokemon.
+        """
+
+        moves = tuple((learned_move.move, learned_move.move.type.effectiveness(other.species.type).value)
+                      for learned_move in pokemon.moves)
+
+        return pokemon, pokemon.stats[StatEnum.HP], moves
+
+    def _state(self, opponent: PokemonModel, player: PokemonModel) -> typing.Tuple:
+        """Get the compact state of the battle.
+
+        :param opponent: The opponent pokemon.
+        :param player: The player's pokemon.
+        :return: The state tuple.
+        """
+
+        return (opponent.hp, player.hp, tuple(opponent.staged_stats[stat] for stat in ExpectimaxAI._STAGED_STATS),
+                tuple(player.staged_stats[stat] for stat in ExpectimaxAI._STAGED_STATS))
+
+    def _best_move(self, state: typing.Tuple, depth: int) -> int:
+        """Search the best move of the opponent.
+
+        :param state: The current state.
+        :param depth: The number of rounds to look ahead.
+        :return: The index of the best move.
+        """
+
+        values = [self._move_value(state, move, depth) for move in range(len(self._sides[0][2]))]
+
+        return values.index(max(values))
+
+    def _value(self, state: typing.Tuple, depth: int) -> float:
+        """Get the expected value of a state for the opponent.
+
+        :param state: The state.
+        :param depth: The number of rounds left to look ahead.
+        :return: The value of the state.
+        """
+
+        if depth == 0:
+            return self._evaluate(state)
+
+        key = (state, depth)
+        if key in self._transpositions:
+            return self._transpositions[key]
+
+        if time.perf_counter() > self._deadline:
+            raise _SearchTimeout()
+
+        value = max(self._move_value(state, move, depth) for move in range(len(self._sides[0][2])))
+        self._transpositions[key] = value
+
+        return value
+
+    def _move_value(self, state: typing.Tuple, move: int, depth: int) -> float:
+        """Get the expected value of a move of the opponent, averaged over the
+        moves of the player.
+
+        :param state: The state.
+        :param move: The index of the move of the opponent.
+        :param depth: The number of rounds left to look ahead.
+        :return: The value of the move.
+        """
+
+        players_moves = len(self._sides[1][2])
+        return sum(self._round_value(state, move, players_move, depth)
+                   for players_move in range(players_moves)) / players_moves
+
+    def _round_value(self, state: typing.Tuple, move: int, players_move: int, depth: int) -> float:
+        """Get the expected value of a round.
+
+        :param state: The state at the beginning of the round.
+        :param move: The index of the move of the opponent.
+        :param players_move: The index of the move of the player.
+        :param depth: The number of rounds left to look ahead.
+        :return: The value of the round.
+        """
+
+        if self._speed(1, state) > self._speed(0, state):
+            first, second = (1, players_move), (0, move)
+        else:
+            first, second = (0, move), (1, players_move)
+
+        value = 0
+        for first_probability, first_state in self._move_outcomes(state, *first):
+            if first_state[0] == 0 or first_state[1] == 0:
+                value += first_probability * self._evaluate(first_state)
+                continue
+
+            for second_probability, second_state in self._move_outcomes(first_state, *second):
+                if second_state[0] == 0 or second_state[1] == 0:
+                    next_value = self._evaluate(second_state)
+                else:
+                    next_value = self._value(second_state, depth - 1)
+                value += first_probability * second_probability * next_value
+
+        return value
+
+    def _speed(self, side: int, state: typing.Tuple) -> float:
+        """Get the staged speed of a pokemon.
+
+        :param side: 0 for the opponent, 1 for the player.
+        :param state: The state.
+        :return: The staged speed.
+        """
+
+        return self._sides[side][0].stats[StatEnum.SPEED] * StagedStatEnum.SPEED.get_multiplier(
+            state[2 + side][ExpectimaxAI._STAGED_STATS.index(StagedStatEnum.SPEED)])
+
+    def _move_outcomes(self, state: typing.Tuple, side: int, move: int) -> typing.List[typing.Tuple[float, typing.Tuple]]:
+        """Get the states a move can lead to with their probability.
+
+        :param state: The state before the move.
+        :param side: 0 if the opponent uses the move, 1 for the player.
+        :param move: The index of the move.
+        :return: A list of probabilities and states.
+        """
+
+        key = (state, side, move)
+        if key in self._outcomes:
+            return self._outcomes[key]
+
+        attacker, _, moves = self._sides[side]
+        defender, _, _ = self._sides[1 - side]
+        used_move, effectiveness = moves[move]
+        attacker_stages = dict(zip(ExpectimaxAI._STAGED_STATS, state[2 + side]))
+        defender_stages = dict(zip(ExpectimaxAI._STAGED_STATS, state[3 - side]))
+
+        accuracy = damage_calculator.staged_accuracy_threshold(used_move.accuracy,
+                                                               attacker_stages[StagedStatEnum.ACCURACY])
+        if damage_calculator.is_damaging(used_move):
+            attack, defense = damage_calculator.staged_attack_and_defense(used_move.category, attacker.stats,
+                                                                         attacker_stages, defender.stats,
+                                                                         defender_stages)
+            critical = damage_calculator.staged_critical_threshold(attacker.stats[StatEnum.SPEED],
+                                                                   attacker_stages[StagedStatEnum.SPEED])
+            distribution = damage_calculator.cached_damage_distribution(attacker.level, used_move.power, attack,
+                                                                        defense, effectiveness, accuracy, critical)
+        else:
+            distribution = damage_calculator.cached_damage_distribution(0, 0, 0, 1, 0, accuracy, 0)
+
+        stages = [list(state[2]), list(state[3])]
+        if used_move.effects:
+            for staged_stat, value in used_move.effects.staged_stats.items():
+                index = ExpectimaxAI._STAGED_STATS.index(staged_stat)
+                if value > 0:
+                    stages[side][index] = min(6, stages[side][index] + value)
+                elif value < 0:
+                    stages[1 - side][index] = max(-6, stages[1 - side][index] + value)
+        stages = (tuple(stages[0]), tuple(stages[1]))
+
+        defender_hp = state[1 - side]
+        hp_outcomes = dict()
+        for damage, probability in zip(distribution.damages.ravel().tolist(),
+                                       distribution.probabilities.ravel().tolist()):
+            if probability > 0:
+                hp = max(0, defender_hp - damage)
+                hp_outcomes[hp] = hp_outcomes.get(hp, 0) + probability
+
+        outcomes = []
+        if distribution.miss_probability > 0:
+            outcomes.append((distribution.miss_probability, state))
+        for probability, hp in self._buckets(hp_outcomes):
+            hps = (state[0], hp) if side == 0 else (hp, state[1])
+            outcomes.append((probability, hps + stages))
+
+        self._outcomes[key] = outcomes
+
+        return outcomes
+
+    @staticmethod
+    def _buckets(hp_outcomes: typing.Dict[int, float]) -> typing.List[typing.Tuple[float, int]]:
+        """Merge the possible remaining HP into at most ``CHANCE_BUCKETS``
+        buckets of similar probability, plus the KO.
+
+        :param hp_outcomes: The probability of each remaining HP.
+        :return: A list of probabilities and HP.
+        """
+
+        buckets = []
+        if 0 in hp_outcomes:
+            buckets.append((hp_outcomes.pop(0), 0))
+
+        total = sum(hp_outcomes.values())
+        bucket_probability = bucket_hp = 0
+        for hp in sorted(hp_outcomes):
+            bucket_probability += hp_outcomes[hp]
+            bucket_hp += hp * hp_outcomes[hp]
+            if bucket_probability >= total / ExpectimaxAI.CHANCE_BUCKETS * (1 - 1e-9):
+                buckets.append((bucket_probability, round(bucket_hp / bucket_probability)))
+                bucket_probability = bucket_hp = 0
+        if bucket_probability > 0:
+            buckets.append((bucket_probability, round(bucket_hp / bucket_probability)))
+
+        return buckets
+
+    def _evaluate(self, state: typing.Tuple) -> float:
+        """Evaluate a state from the point of view of the opponent.
+
+        :param state: The state.
+        :return: The value of the state.
+        """
+
+        if state[1] == 0:
+            return ExpectimaxAI.WIN_VALUE
+        if state[0] == 0:
+            return -ExpectimaxAI.WIN_VALUE
+
+        return (state[0] / self._sides[0][1] - state[1] / self._sides[1][1]
+                + ExpectimaxAI.STAGE_WEIGHT * (sum(state[2]) - sum(state[3])))
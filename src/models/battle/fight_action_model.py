@@ -1,10 +1,8 @@
-import random
+import typing
 
+from models.battle import damage_calculator
 from models.battle.battle_model import BattleModel
 from models.battle.used_move_effects_model import UsedMoveEffectsModel
-from models.enumerations.move_category_enum import MoveCategoryEnum
-from models.enumerations.staged_stat_enum import StagedStatEnum
-from models.enumerations.stat_enum import StatEnum
 from models.learned_move_model import LearnedMoveModel
 from models.pokemon_model import PokemonModel
 
@@ -12,6 +10,8 @@ from models.pokemon_model import PokemonModel
 class FightActionModel:
     """Represents the use of a move during a battle."""
 
+    __slots__ = ("_battle", "_attacker_is_player", "_move", "_effects")
+
     def __init__(self, battle: BattleModel, attacker_is_player: bool, move: LearnedMoveModel) -> None:
         """Create a new fight action.
 
@@ -52,6 +52,16 @@ class FightActionModel:
 
         return self._move
 
+    @property
+    def effects(self) -> typing.Union[UsedMoveEffectsModel, None]:
+        """Get the effects of the move if it has already been used.
+
+        :return: A ``UsedMoveEffectsModel`` or None if the move hasn't been
+        used.
+        """
+
+        return self._effects
+
     def get_effects(self) -> UsedMoveEffectsModel:
         """Apply the effects of the move based on the attacked who used the
          move and the defender.
@@ -60,41 +70,29 @@ class FightActionModel:
          """
 
         if self._effects is None:
-            failed = random.randint(1, 100) > self._move.move.accuracy * StagedStatEnum.ACCURACY.get_multiplier(
-                self.attacker.staged_stats[StagedStatEnum.ACCURACY]) if self._move.move.accuracy else False
+            move = self._move.move
+            threshold = damage_calculator.accuracy_threshold(self.attacker, move)
+            failed = self._battle.rng.randint(1, damage_calculator.ACCURACY_ROLLS) > threshold \
+                if threshold is not None else False
             effectiveness = None
             critical_multiplier = None
             staged_stats = dict()
             damage = 0
 
             if not failed:
-                if self._move.move.category in [MoveCategoryEnum.PHYSICAL, MoveCategoryEnum.SPECIAL]:
-                    if self._move.move.category == MoveCategoryEnum.PHYSICAL:
-                        attack = self.attacker.stats[StatEnum.ATTACK] * StagedStatEnum.ATTACK.get_multiplier(
-                            self.attacker.staged_stats[StagedStatEnum.ATTACK])
-                        defense = self.defender.stats[StatEnum.DEFENSE] * StagedStatEnum.DEFENSE.get_multiplier(
-                            self.defender.staged_stats[StagedStatEnum.DEFENSE])
-                    else:
-                        attack = self.attacker.stats[
-                                     StatEnum.SPECIAL_ATTACK] * StagedStatEnum.SPECIAL_ATTACK.get_multiplier(
-                            self.attacker.staged_stats[StagedStatEnum.SPECIAL_ATTACK])
-                        defense = self.defender.stats[
-                                      StatEnum.SPECIAL_ATTACK] * StagedStatEnum.SPECIAL_DEFENSE.get_multiplier(
-                            self.defender.staged_stats[StagedStatEnum.SPECIAL_DEFENSE])
-
-                    effectiveness = self._move.move.type.effectiveness(self.defender.species.type)
-                    critical_multiplier = 1.5 if random.randint(1, 256) <= self.attacker.stats[
-                        StatEnum.SPEED] * StagedStatEnum.SPEED.get_multiplier(
-                        self.attacker.staged_stats[StagedStatEnum.SPEED]) / 2 else 1
-                    modifier = critical_multiplier * effectiveness.value * random.uniform(0.85, 1)
-                    damage = round(
-                        ((
-                                 2 * self.attacker.level / 5 + 2) * self._move.move.power * attack / defense / 50 + 5) * modifier)
-                    damage = max(1, damage) * -1
-
-                staged_stats = self._move.move.effects.staged_stats if self._move.move.effects else dict()
+                if damage_calculator.is_damaging(move):
+                    attack, defense = damage_calculator.attack_and_defense(self.attacker, self.defender, move)
+                    effectiveness = move.type.effectiveness(self.defender.species.type)
+                    critical_multiplier = damage_calculator.CRITICAL_MULTIPLIER if self._battle.rng.randint(
+                        1, damage_calculator.CRITICAL_ROLLS) <= damage_calculator.critical_threshold(
+                        self.attacker) else 1
+                    roll = self._battle.rng.choice(damage_calculator.DAMAGE_ROLLS)
+                    modifier = critical_multiplier * effectiveness.value * roll / 100
+                    damage = damage_calculator.damage(self.attacker.level, move.power, attack, defense, modifier) * -1
+
+                staged_stats = move.effects.staged_stats if move.effects else dict()
 
             self._effects = UsedMoveEffectsModel(failed, damage, staged_stats, effectiveness,
-                                                 critical_multiplier == 1.5)
+                                                 critical_multiplier == damage_calculator.CRITICAL_MULTIPLIER)
 
         return self._effects
@@ -0,0 +1,51 @@
+import typing
+
+from models.enumerations.battle_outcome_enum import BattleOutcomeEnum
+from models.enumerations.stat_enum import StatEnum
+
+
+class KoResultModel:
+    """The consequences of a pokemon being KO."""
+
+    def __init__(self, outcome: BattleOutcomeEnum, experience_gained: int = 0,
+                 gained_levels: typing.Dict[int, typing.Dict[StatEnum, int]] = None) -> None:
+        """Create a new KO result.
+
+        :param outcome: What happens next in the battle.
+        :param experience_gained: The number of experience points gained by
+        the player's pokemon.
+        :param gained_levels: A dictionary with the gained levels as well as
+        the stats increase for each level and the new moves.
+        """
+
+        self._outcome = outcome
+        self._experience_gained = experience_gained
+        self._gained_levels = gained_levels if gained_levels is not None else dict()
+
+    @property
+    def outcome(self) -> BattleOutcomeEnum:
+        """Get what happens next in the battle.
+
+        :return: A ``BattleOutcomeEnum``.
+        """
+
+        return self._outcome
+
+    @property
+    def experience_gained(self) -> int:
+        """Get the number of experience points gained by the player's pokemon.
+
+        :return: The number of experience points gained.
+        """
+
+        return self._experience_gained
+
+    @property
+    def gained_levels(self) -> typing.Dict[int, typing.Dict[StatEnum, int]]:
+        """Get the levels gained by the player's pokemon.
+
+        :return: A dictionary with the gained levels as well as the stats
+        increase for each level and the new moves.
+        """
+
+        return self._gained_levels
@@ -0,0 +1,417 @@
+import typing
+
+import numpy
+
+from models.battle import damage_calculator
+from models.battle.damage_distribution_model import DamageDistributionModel
+from models.battle.win_probability_model import WinProbabilityModel
+from models.enumerations.move_category_enum import MoveCategoryEnum
+from models.enumerations.staged_stat_enum import StagedStatEnum
+from models.enumerations.stat_enum import StatEnum
+from models.pokemon_model import PokemonModel
+
+
+class MarkovSolver:
+    """Calculates the outcome of a one-on-one battle where both pokemon choose
+    their moves randomly.
+
+    By default the HP are bucketed and the outcome is approximate. Only
+    ``hp_buckets=None`` solves every HP, and gives the exact outcome.
+
+    The battle is a Markov chain whose states are the HP of both pokemon, their
+    stages and whose turn it is: the beginning of a round, or the second
+    pokemon about to move. The PP are left out since they don't restrict the
+    moves in the battle engine, and only the stages which some move of the
+    battle changes and which influence the damage, the accuracy or the order
+    of the pokemon are part of the state. The transitions are built from the
+    damage distributions of ``damage_calculator``, which follow
+    ``FightActionModel.get_effects``.
+
+    The HP of each pokemon are counted in buckets of equal size: a damage is
+    split between the two nearest numbers of buckets, keeping its expected
+    value, and the HP between two buckets are interpolated. A pokemon with no
+    more HP than buckets has buckets of 1 HP, which are exact. With the default
+    ``HP_BUCKETS``, the win probabilities of the species at levels 5 to 100 are
+    off by 0.02 at most and the expected numbers of rounds by 3.5%, solved in
+    about 20ms instead of seconds at level 50.
+
+    The stages and the turn are encoded into a single integer, the state
+    index, and the values of the states are stored in arrays indexed by
+    ``[players_bucket, opponent_bucket, state_index]``. The HP never increase
+    and the transitions which don't inflict damage don't depend on the HP, so
+    the states of equal HP form the same small linear system everywhere: it is
+    inverted once, then the HP are solved by diagonals of equal total HP, from
+    the lowest to the highest, all the pairs of HP of a diagonal at once. The
+    arrays are kept, so that the solver can be queried again as the battle
+    goes on.
+
+    Attributes:
+        - MAX_STAGE: The highest stage of a staged stat.
+        - HP_BUCKETS: The default number of buckets of the HP of a pokemon.
+        - DRAW_TOLERANCE: The probability of a never-ending battle under which
+            it is considered to always end.
+    """
+
+    MAX_STAGE = 6
+    HP_BUCKETS = 24
+    DRAW_TOLERANCE = 1e-9
+
+    _STAGED_STATS = tuple(StagedStatEnum)
+    _STAGE_BASE = 2 * MAX_STAGE + 1
+    _PHASES = 3
+
+    def __init__(self, players_pokemon: PokemonModel, opponent_pokemon: PokemonModel,
+                 stage_cutoff: int = MAX_STAGE, hp_buckets: typing.Optional[int] = HP_BUCKETS) -> None:
+        """Create a new solver for a battle between two pokemon.
+
+        :param players_pokemon: The player's pokemon.
+        :param opponent_pokemon: The opponent pokemon.
+        :param stage_cutoff: The highest absolute stage kept in the states.
+        Stages beyond are clamped, which makes the solution approximate but
+        the state space smaller.
+        :param hp_buckets: The number of buckets of the HP of each pokemon, or
+        None to solve every HP exactly.
+        """
+
+        self._pokemons = (players_pokemon, opponent_pokemon)
+        self._stage_cutoff = stage_cutoff
+        self._buckets = tuple(pokemon.stats[StatEnum.HP] if hp_buckets is None
+                              else min(pokemon.stats[StatEnum.HP], hp_buckets) for pokemon in self._pokemons)
+        self._hp_units = tuple(pokemon.stats[StatEnum.HP] / buckets
+                               for pokemon, buckets in zip(self._pokemons, self._buckets))
+
+        relevant = set()
+        for side, pokemon in enumerate(self._pokemons):
+            relevant.add((side, StagedStatEnum.SPEED))
+            for learned_move in pokemon.moves:
+                if learned_move.move.category == MoveCategoryEnum.PHYSICAL:
+                    relevant.update([(side, StagedStatEnum.ATTACK), (1 - side, StagedStatEnum.DEFENSE)])
+                elif learned_move.move.category == MoveCategoryEnum.SPECIAL:
+                    relevant.update([(side, StagedStatEnum.SPECIAL_ATTACK), (1 - side, StagedStatEnum.SPECIAL_DEFENSE)])
+                if learned_move.move.accuracy:
+                    relevant.add((side, StagedStatEnum.ACCURACY))
+
+        slots = set()
+        self._moves = ([], [])
+        for side, pokemon in enumerate(self._pokemons):
+            for learned_move in pokemon.moves:
+                move = learned_move.move
+                effects = []
+                if move.effects:
+                    for staged_stat, value in move.effects.staged_stats.items():
+                        target = side if value > 0 else 1 - side
+                        if value and (target, staged_stat) in relevant:
+                            slot = (target, MarkovSolver._STAGED_STATS.index(staged_stat))
+                            effects.append((slot, value))
+                            slots.add(slot)
+                effectiveness = move.type.effectiveness(self._pokemons[1 - side].species.type).value
+                self._moves[side].append((move, effectiveness, effects))
+
+        self._slots = sorted(slots)
+        self._outcomes = dict()
+        self._distributions = dict()
+        self._tables = []
+
+    def solve(self) -> WinProbabilityModel:
+        """Solve the battle from the current HP and stages of the pokemon.
+
+        :return: A ``WinProbabilityModel``.
+        """
+
+        players_hp, opponent_hp = self._pokemons[0].hp, self._pokemons[1].hp
+        if players_hp <= 0 or opponent_hp <= 0:
+            return WinProbabilityModel(1.0 if opponent_hp <= 0 else 0.0, 1.0 if opponent_hp > 0 else 0.0, 0.0)
+
+        stages = [[pokemon.staged_stats[stat] for stat in MarkovSolver._STAGED_STATS] for pokemon in self._pokemons]
+        stage_code = self._encode_stages(stages)
+        for index, values in self._tables:
+            if stage_code in index:
+                break
+        else:
+            index, values = self._solve_stages(stage_code)
+            self._tables.append((index, values))
+
+        state = index[stage_code] * MarkovSolver._PHASES
+
+        result = numpy.zeros(3)
+        (players_bucket, players_weights), (opponent_bucket, opponent_weights) = (
+            self._bucket_weights(hp, side) for side, hp in enumerate((players_hp, opponent_hp)))
+        for players_offset, players_weight in enumerate(players_weights):
+            for opponent_offset, opponent_weight in enumerate(opponent_weights):
+                if players_weight * opponent_weight:
+                    result += players_weight * opponent_weight * values[:, players_bucket + players_offset,
+                                                                        opponent_bucket + opponent_offset, state]
+
+        return WinProbabilityModel(*result.tolist())
+
+    @property
+    def states(self) -> int:
+        """Get the number of states solved so far.
+
+        :return: The number of states.
+        """
+
+        return sum((values.shape[1] - 1) * (values.shape[2] - 1) * values.shape[3] for _, values in self._tables)
+
+    def _bucket_weights(self, hp: int, side: int) -> typing.Tuple[int, typing.Tuple[float, float]]:
+        """Get the buckets between which the HP of a pokemon are interpolated.
+
+        A pokemon which isn't KO has at least 1 bucket.
+
+        :param hp: The HP of the pokemon, above 0.
+        :param side: 0 for the player's pokemon, 1 for the opponent pokemon.
+        :return: The lower bucket and the weights of the lower and the upper
+        bucket.
+        """
+
+        buckets = min(max(1.0, hp / self._hp_units[side]), self._buckets[side])
+        bucket = min(int(buckets), self._buckets[side])
+        fraction = buckets - bucket
+
+        return bucket, (1 - fraction, fraction)
+
+    def _encode_stages(self, stages: typing.List[typing.List[int]]) -> int:
+        """Encode the stages which are part of the state.
+
+        :param stages: The stages of both pokemon.
+        :return: The stage code.
+        """
+
+        stage_code = 0
+        for side, index in reversed(self._slots):
+            stage = max(-self._stage_cutoff, min(self._stage_cutoff, stages[side][index]))
+            stage_code = stage_code * MarkovSolver._STAGE_BASE + stage + MarkovSolver.MAX_STAGE
+
+        return stage_code
+
+    def _decode_stages(self, stage_code: int) -> typing.List[typing.List[int]]:
+        """Decode the stages of both pokemon.
+
+        The stages which aren't part of the state keep the current value of
+        the pokemon.
+
+        :param stage_code: The stage code.
+        :return: The stages of both pokemon.
+        """
+
+        stages = [[pokemon.staged_stats[stat] for stat in MarkovSolver._STAGED_STATS] for pokemon in self._pokemons]
+        for side, index in self._slots:
+            stage_code, stage = divmod(stage_code, MarkovSolver._STAGE_BASE)
+            stages[side][index] = stage - MarkovSolver.MAX_STAGE
+
+        return stages
+
+    def _first_side(self, stages: typing.List[typing.List[int]]) -> int:
+        """Get the side of the pokemon moving first.
+
+        :param stages: The stages of both pokemon.
+        :return: 0 for the player's pokemon, 1 for the opponent pokemon.
+        """
+
+        speed_stage = MarkovSolver._STAGED_STATS.index(StagedStatEnum.SPEED)
+        speeds = [pokemon.stats[StatEnum.SPEED] * StagedStatEnum.SPEED.get_multiplier(stages[side][speed_stage])
+                  for side, pokemon in enumerate(self._pokemons)]
+
+        return 0 if speeds[0] > speeds[1] else 1
+
+    def _move_outcomes(self, stage_code: int, side: int) -> typing.Tuple[int, numpy.ndarray, numpy.ndarray,
+                                                                        numpy.ndarray]:
+        """Get the outcomes of the move of a pokemon, chosen randomly.
+
+        :param stage_code: The stage code before the move.
+        :param side: 0 for the player's pokemon, 1 for the opponent pokemon.
+        :return: The side moving first from these stages and the arrays of
+        the probabilities, the damage and the stage codes after the move of
+        the outcomes.
+        """
+
+        key = stage_code * 2 + side
+        if key in self._outcomes:
+            return self._outcomes[key]
+
+        stages = self._decode_stages(stage_code)
+        attacker, defender = self._pokemons[side], self._pokemons[1 - side]
+        attacker_stages = dict(zip(MarkovSolver._STAGED_STATS, stages[side]))
+        defender_stages = dict(zip(MarkovSolver._STAGED_STATS, stages[1 - side]))
+        weight = 1 / len(self._moves[side])
+
+        probabilities, damages, next_stage_codes = [], [], []
+        for move, effectiveness, effects in self._moves[side]:
+            accuracy = damage_calculator.staged_accuracy_threshold(move.accuracy,
+                                                                   attacker_stages[StagedStatEnum.ACCURACY])
+            if damage_calculator.is_damaging(move):
+                attack, defense = damage_calculator.staged_attack_and_defense(move.category, attacker.stats,
+                                                                             attacker_stages, defender.stats,
+                                                                             defender_stages)
+                critical = damage_calculator.staged_critical_threshold(attacker.stats[StatEnum.SPEED],
+                                                                       attacker_stages[StagedStatEnum.SPEED])
+                distribution = damage_calculator.cached_damage_distribution(attacker.level, move.power, attack,
+                                                                            defense, effectiveness, accuracy,
+                                                                            critical)
+            else:
+                distribution = damage_calculator.cached_damage_distribution(0, 0, 0, 1, 0, accuracy, 0)
+
+            hit_stages = [list(stages[0]), list(stages[1])]
+            for (target, index), value in effects:
+                if value > 0:
+                    hit_stages[target][index] = min(MarkovSolver.MAX_STAGE, hit_stages[target][index] + value)
+                else:
+                    hit_stages[target][index] = max(-MarkovSolver.MAX_STAGE, hit_stages[target][index] + value)
+            hit_stage_code = self._encode_stages(hit_stages)
+
+            if distribution.miss_probability > 0:
+                probabilities.append([weight * distribution.miss_probability])
+                damages.append([0])
+                next_stage_codes.append([stage_code])
+            hit_damages, hit_probabilities = self._hits(distribution)
+            probabilities.append(weight * hit_probabilities)
+            damages.append(hit_damages)
+            next_stage_codes.append(numpy.full(len(hit_damages), hit_stage_code))
+
+        result = (self._first_side(stages), numpy.concatenate(probabilities), numpy.concatenate(damages),
+                  numpy.concatenate(next_stage_codes))
+        self._outcomes[key] = result
+
+        return result
+
+    def _hits(self, distribution: DamageDistributionModel) -> typing.Tuple[numpy.ndarray, numpy.ndarray]:
+        """Get the distinct damage of the hits of a damage distribution.
+
+        :param distribution: The damage distribution.
+        :return: The arrays of the damage and of their probabilities.
+        """
+
+        if distribution not in self._distributions:
+            hit = distribution.probabilities > 0
+            damages, inverse = numpy.unique(distribution.damages[hit], return_inverse=True)
+            self._distributions[distribution] = damages, numpy.bincount(inverse, distribution.probabilities[hit])
+
+        return self._distributions[distribution]
+
+    def _solve_stages(self, root: int) -> typing.Tuple[typing.Dict[int, int], numpy.ndarray]:
+        """Solve every HP of the stages reachable from a stage code.
+
+        :param root: The stage code.
+        :return: A dictionary assigning a position to each reachable stage
+        code and an array of the win probability, the loss probability and
+        the expected number of rounds, indexed by ``[value, players_bucket,
+        opponent_bucket, position * 3 + phase]``. The phase is 0 at the
+        beginning of a round, 1 if the player's pokemon moves second and is
+        about to move, 2 for the opponent pokemon.
+        """
+
+        index = {root: 0}
+        stack = [root]
+        while stack:
+            stage_code = stack.pop()
+            for side in range(2):
+                for next_stage_code in set(self._move_outcomes(stage_code, side)[3].tolist()):
+                    if next_stage_code not in index:
+                        index[next_stage_code] = len(index)
+                        stack.append(next_stage_code)
+
+        states, targets, next_phases, lengths = [], [], [], []
+        probabilities, damages, next_positions = [], [], []
+        for stage_code, position in index.items():
+            first_side = self._move_outcomes(stage_code, 0)[0]
+            for phase, side, next_phase in ((0, first_side, 2 - first_side), (1, 0, 0), (2, 1, 0)):
+                _, move_probabilities, move_damages, next_stage_codes = self._move_outcomes(stage_code, side)
+                states.append(position * MarkovSolver._PHASES + phase)
+                targets.append(1 - side)
+                next_phases.append(next_phase)
+                lengths.append(len(move_probabilities))
+                probabilities.append(move_probabilities)
+                damages.append(move_damages / self._hp_units[1 - side])
+                next_positions.extend(index[next_stage_code] for next_stage_code in next_stage_codes.tolist())
+        states, targets, next_phases = (numpy.repeat(column, lengths) for column in (states, targets, next_phases))
+        probabilities, damages = numpy.concatenate(probabilities), numpy.concatenate(damages)
+        next_states = numpy.array(next_positions) * MarkovSolver._PHASES + next_phases
+
+        # The damage is split between the two nearest numbers of buckets, so
+        # that the expected damage is kept.
+        buckets = numpy.floor(damages)
+        fractions = damages - buckets
+        states, targets, next_states = (numpy.tile(column, 2) for column in (states, targets, next_states))
+        damages = numpy.concatenate((buckets, buckets + 1)).astype(int)
+        probabilities = numpy.concatenate((probabilities * (1 - fractions), probabilities * fractions))
+
+        size = len(index) * MarkovSolver._PHASES
+        stay = numpy.zeros((size, size))
+        missed = (damages == 0) & (probabilities > 0)
+        numpy.add.at(stay, (states[missed], next_states[missed]), probabilities[missed])
+
+        # The exits to the same HP and state are merged, and sorted by state.
+        hit = (damages > 0) & (probabilities > 0)
+        damage_base = int(damages.max()) + 1
+        keys, inverse = numpy.unique(((states[hit] * 2 + targets[hit]) * damage_base + damages[hit]) * size
+                                     + next_states[hit], return_inverse=True)
+        probabilities = numpy.bincount(inverse, probabilities[hit])
+        keys, next_states = numpy.divmod(keys, size)
+        keys, damages = numpy.divmod(keys, damage_base)
+        states, targets = numpy.divmod(keys, 2)
+        players_damage, opponent_damage = damages * (targets == 0), damages * (targets == 1)
+
+        players_max_hp, opponent_max_hp = self._buckets
+        if not len(states):
+            values = numpy.empty((3, players_max_hp + 1, opponent_max_hp + 1, size))
+            values[:, 1:, 1:] = numpy.array((0.0, 0.0, numpy.inf))[:, None, None, None]
+            values[:, 0] = numpy.array((0.0, 1.0, 0.0))[:, None, None]
+            values[:, :, 0] = numpy.array((1.0, 0.0, 0.0))[:, None, None]
+            return index, values
+
+        # Only the states from which some damage can be inflicted may end.
+        predecessors = [numpy.flatnonzero(column) for column in stay.T]
+        live = numpy.zeros(size, dtype=bool)
+        stack = numpy.unique(states).tolist()
+        live[stack] = True
+        while stack:
+            for state in predecessors[stack.pop()]:
+                if not live[state]:
+                    live[state] = True
+                    stack.append(state)
+        live_states = numpy.flatnonzero(live)
+
+        sources, starts = numpy.unique((numpy.cumsum(live) - 1)[states], return_index=True)
+
+        # The HP below 0 are kept as margins of KO values, so that the HP
+        # reached by each exit are at a constant offset in the flat array.
+        players_margin, opponent_margin = int(players_damage.max()), int(opponent_damage.max())
+        width = opponent_margin + opponent_max_hp + 1
+        padded = numpy.empty((3, players_margin + players_max_hp + 1, width, size))
+        padded[:, players_margin + 1:, opponent_margin + 1:] = numpy.array((0.0, 0.0, numpy.inf))[:, None, None, None]
+        padded[:, :players_margin + 1] = numpy.array((0.0, 1.0, 0.0))[:, None, None, None]
+        padded[:, :, :opponent_margin + 1] = numpy.array((1.0, 0.0, 0.0))[:, None, None, None]
+        flat_values = padded.reshape(3, -1)
+        offsets = next_states - (players_damage * width + opponent_damage) * size
+
+        stay = stay[live_states]
+        inverse = numpy.ascontiguousarray(numpy.linalg.inv(numpy.identity(len(live_states)) - stay[:, live_states]).T)
+        never_ending = (stay[:, ~live] > 0).any(axis=1)
+        stay = stay[:, live_states].T > 0
+        rewards = (live_states % MarkovSolver._PHASES == 0).astype(float)
+
+        known = numpy.zeros((3, max(players_max_hp, opponent_max_hp), len(live_states)))
+        for total_hp in range(2, players_max_hp + opponent_max_hp + 1):
+            players_hp = numpy.arange(max(1, total_hp - opponent_max_hp), min(players_max_hp, total_hp - 1) + 1)
+            cells = ((players_hp + players_margin) * width + total_hp - players_hp + opponent_margin) * size
+
+            reached = flat_values.take(cells[:, None] + offsets, axis=1)
+            reached *= probabilities
+            diagonal = known[:, :len(players_hp)]
+            diagonal[:, :, sources] = numpy.add.reduceat(reached, starts, axis=2)
+
+            # The battles which may never end last forever on average.
+            infinite = numpy.isinf(diagonal[2])
+            diagonal[2][infinite] = 0
+            diagonal[2] += rewards
+            solved = numpy.matmul(diagonal, inverse)
+            infinite |= never_ending | (1 - solved[0] - solved[1] >= MarkovSolver.DRAW_TOLERANCE)
+            if infinite.any():
+                spread = infinite | numpy.matmul(infinite, stay)
+                while (spread != infinite).any():
+                    infinite, spread = spread, spread | numpy.matmul(spread, stay)
+                solved[2][infinite] = numpy.inf
+
+            flat_values[:, cells[:, None] + live_states] = solved
+
+        return index, padded[:, players_margin:, opponent_margin:]
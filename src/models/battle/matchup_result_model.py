@@ -0,0 +1,110 @@
+import typing
+from math import sqrt
+
+
+class MatchupResultModel:
+    """The statistics of many battles simulated between the same two parties.
+
+    Attributes:
+        - Z_95: The quantile of the normal distribution used for the 95%
+            confidence interval.
+    """
+
+    Z_95 = 1.959963984540054
+
+    def __init__(self, battles: int, wins: int, draws: int, rounds: int) -> None:
+        """Create a new matchup result.
+
+        :param battles: The number of simulated battles.
+        :param wins: The number of battles won by the first party.
+        :param draws: The number of battles stopped before either party was
+        out of usable pokemon.
+        :param rounds: The total number of rounds played over all the battles.
+        """
+
+        self._battles = battles
+        self._wins = wins
+        self._draws = draws
+        self._rounds = rounds
+
+    @property
+    def battles(self) -> int:
+        """Get the number of simulated battles.
+
+        :return: The number of simulated battles.
+        """
+
+        return self._battles
+
+    @property
+    def wins(self) -> int:
+        """Get the number of battles won by the first party.
+
+        :return: The number of battles won.
+        """
+
+        return self._wins
+
+    @property
+    def draws(self) -> int:
+        """Get the number of battles which reached the maximum number of rounds.
+
+        :return: The number of draws.
+        """
+
+        return self._draws
+
+    @property
+    def rounds(self) -> int:
+        """Get the total number of rounds played over all the battles.
+
+        :return: The number of rounds.
+        """
+
+        return self._rounds
+
+    @property
+    def win_rate(self) -> float:
+        """Get the ratio of battles won by the first party.
+
+        :return: A value between 0 and 1.
+        """
+
+        return self._wins / self._battles if self._battles else 0
+
+    @property
+    def mean_rounds(self) -> float:
+        """Get the average number of rounds of a battle.
+
+        :return: The average number of rounds.
+        """
+
+        return self._rounds / self._battles if self._battles else 0
+
+    def confidence_interval(self, z: float = Z_95) -> typing.Tuple[float, float]:
+        """Get the Wilson score interval of the win rate.
+
+        :param z: The quantile of the normal distribution matching the wanted
+        confidence level. The default value gives a 95% interval.
+        :return: The lower and upper bounds of the win rate.
+        """
+
+        if not self._battles:
+            return 0, 1
+
+        n = self._battles
+        p = self.win_rate
+        center = (p + z * z / (2 * n)) / (1 + z * z / n)
+        margin = z * sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+
+        return max(0, center - margin), min(1, center + margin)
+
+    def __add__(self, other: "MatchupResultModel") -> "MatchupResultModel":
+        """Merge the statistics of two simulations of the same matchup.
+
+        :param other: Another ``MatchupResultModel``.
+        :return: A new ``MatchupResultModel``.
+        """
+
+        return MatchupResultModel(self._battles + other.battles, self._wins + other.wins,
+                                  self._draws + other.draws, self._rounds + other._rounds)
@@ -0,0 +1,43 @@
+import random
+import typing
+
+
+class RecordingRandom(random.Random):
+    """A random number generator keeping track of the random bits it draws.
+
+    Every method of ``random.Random`` used by the battles (``randint``,
+    ``choice``...) draws its bits through ``getrandbits``, so recording them
+    is enough to check that a battle played again takes the same course.
+    """
+
+    def __init__(self, seed: int = None) -> None:
+        """Create a new recording random number generator.
+
+        :param seed: The seed of the generator.
+        """
+
+        self._draws = []
+        super().__init__(seed)
+
+    def getrandbits(self, k: int) -> int:
+        """Draw ``k`` random bits and record them.
+
+        :param k: The number of bits.
+        :return: An integer with ``k`` random bits.
+        """
+
+        bits = super().getrandbits(k)
+        self._draws.append(bits)
+
+        return bits
+
+    def pop_draws(self) -> typing.List[int]:
+        """Get the bits drawn since the last call and forget them.
+
+        :return: The list of the drawn integers.
+        """
+
+        draws = self._draws
+        self._draws = []
+
+        return draws
@@ -0,0 +1,23 @@
+class ReplayMismatchError(Exception):
+    """Raised when a replayed battle doesn't take the same course as the
+    recorded one."""
+
+    def __init__(self, round_number: int, message: str) -> None:
+        """Create a new replay mismatch error.
+
+        :param round_number: The number of the round which diverged, starting
+        from 1.
+        :param message: What diverged.
+        """
+
+        super().__init__("Round {0}: {1}".format(round_number, message))
+        self._round_number = round_number
+
+    @property
+    def round_number(self) -> int:
+        """Get the number of the round which diverged.
+
+        :return: The number of the round, starting from 1.
+        """
+
+        return self._round_number
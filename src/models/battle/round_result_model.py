@@ -0,0 +1,62 @@
+import typing
+
+from models.battle.fight_action_model import FightActionModel
+from models.battle.run_action_model import RunActionModel
+from models.battle.shift_action_model import ShiftActionModel
+from models.pokemon_model import PokemonModel
+
+
+class RoundResultModel:
+    """The result of a round of a battle once both actions have been
+    resolved."""
+
+    def __init__(self, first_action: typing.Union[FightActionModel, RunActionModel, ShiftActionModel],
+                 second_action: typing.Union[FightActionModel, RunActionModel, ShiftActionModel],
+                 fainted_pokemon: PokemonModel = None) -> None:
+        """Create a new round result.
+
+        :param first_action: The action played first.
+        :param second_action: The action played second.
+        :param fainted_pokemon: The pokemon who fainted during the round if
+        any.
+        """
+
+        self._first_action = first_action
+        self._second_action = second_action
+        self._fainted_pokemon = fainted_pokemon
+
+    @property
+    def first_action(self) -> typing.Union[FightActionModel, RunActionModel, ShiftActionModel]:
+        """Get the action played first.
+
+        :return: The first action of the round.
+        """
+
+        return self._first_action
+
+    @property
+    def second_action(self) -> typing.Union[FightActionModel, RunActionModel, ShiftActionModel]:
+        """Get the action played second.
+
+        :return: The second action of the round.
+        """
+
+        return self._second_action
+
+    @property
+    def fainted_pokemon(self) -> typing.Union[PokemonModel, None]:
+        """Get the pokemon who fainted during the round.
+
+        :return: The ``PokemonModel`` who fainted or None.
+        """
+
+        return self._fainted_pokemon
+
+    @property
+    def run_successful(self) -> bool:
+        """Get whether the player escaped from the battle during the round.
+
+        :return: True if the player escaped.
+        """
+
+        return isinstance(self._first_action, RunActionModel) and self._first_action.is_run_successful()
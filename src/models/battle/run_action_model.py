@@ -7,15 +7,20 @@ from models.pokemon_model import PokemonModel
 class RunActionModel:
     """Represents the attempt to run from a battle."""
 
-    def __init__(self, pokemon: PokemonModel, opponent_pokemon: PokemonModel) -> None:
+    __slots__ = ("_pokemon", "_opponent_pokemon", "_rng", "_is_run_successful")
+
+    def __init__(self, pokemon: PokemonModel, opponent_pokemon: PokemonModel, rng: random.Random = None) -> None:
         """Create a new run action.
 
         :param pokemon: The pokemon trying to escape.
         :param opponent_pokemon: The other pokemon.
+        :param rng: The random number generator of the battle. If None, a new
+        one is created.
         """
 
         self._pokemon = pokemon
         self._opponent_pokemon = opponent_pokemon
+        self._rng = rng if rng else random.Random()
         self._is_run_successful = None
 
     def is_run_successful(self) -> None:
@@ -28,6 +33,6 @@ class RunActionModel:
             F = ((self._pokemon.stats[StatEnum.SPEED] * 128) / self._opponent_pokemon.stats[
                 StatEnum.SPEED] + 30) % 256
 
-            self._is_run_successful = F > random.randint(0, 255)
+            self._is_run_successful = F > self._rng.randint(0, 255)
 
         return self._is_run_successful
@@ -5,6 +5,8 @@ from models.pokemon_model import PokemonModel
 class ShiftActionModel:
     """Represents the shift of a pokemon by another."""
 
+    __slots__ = ("_pokemon", "_previous_pokemon")
+
     def __init__(self, pokemon: PokemonModel) -> None:
         """Create a new shift action.
 
@@ -7,6 +7,8 @@ from models.enumerations.staged_stat_enum import StagedStatEnum
 class UsedMoveEffectsModel:
     """The effects of the move when used in a battle."""
 
+    __slots__ = ("_failed", "_hp", "_staged_stats", "_effectiveness", "_critical_hit")
+
     def __init__(self, failed: bool, hp: int, staged_stats: typing.Dict[StagedStatEnum, int],
                  effectiveness: MoveEffectivenessEnum, critical_hit: bool) -> None:
         """Create a new used move effects.
@@ -0,0 +1,55 @@
+class WinProbabilityModel:
+    """The outcome of a one-on-one battle, as solved by the ``MarkovSolver``."""
+
+    def __init__(self, win_probability: float, loss_probability: float, expected_rounds: float) -> None:
+        """Create a new win probability.
+
+        :param win_probability: The probability that the player's pokemon
+        wins.
+        :param loss_probability: The probability that the player's pokemon
+        loses.
+        :param expected_rounds: The expected number of rounds of the battle.
+        Infinite if the battle may never end.
+        """
+
+        self._win_probability = win_probability
+        self._loss_probability = loss_probability
+        self._expected_rounds = expected_rounds
+
+    @property
+    def win_probability(self) -> float:
+        """Get the probability that the player's pokemon wins.
+
+        :return: A value between 0 and 1.
+        """
+
+        return self._win_probability
+
+    @property
+    def loss_probability(self) -> float:
+        """Get the probability that the player's pokemon loses.
+
+        :return: A value between 0 and 1.
+        """
+
+        return self._loss_probability
+
+    @property
+    def draw_probability(self) -> float:
+        """Get the probability that the battle never ends (e.g. when neither
+        pokemon can inflict damage).
+
+        :return: A value between 0 and 1.
+        """
+
+        return max(0.0, 1 - self._win_probability - self._loss_probability)
+
+    @property
+    def expected_rounds(self) -> float:
+        """Get the expected number of rounds of the battle.
+
+        :return: The expected number of rounds. Infinite if the battle may
+        never end.
+        """
+
+        return self._expected_rounds
@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class BattleOutcomeEnum(Enum):
+    """What happens once a pokemon is KO:
+    - PLAYER_SHIFT: The player's pokemon fainted but the player has other
+        pokemon able to fight. The player must send one of them.
+    - PLAYER_LOST: The player's pokemon fainted and the player is out of
+        usable pokemon.
+    - PLAYER_WON: The opponent pokemon fainted. The player won the battle.
+    """
+
+    PLAYER_SHIFT = "Player shift"
+    PLAYER_LOST = "Player lost"
+    PLAYER_WON = "Player won"
@@ -0,0 +1,48 @@
+from enum import Enum
+
+
+class DifficultyEnum(Enum):
+    """The difficulty levels of the opponent AI.
+
+    Each level defines how many rounds ahead the AI can look and how much time
+    it can spend searching, in milliseconds:
+    - EASY: The AI chooses its moves randomly.
+    - NORMAL: The AI only looks at the current round.
+    - HARD: The AI looks as far as it can within its time budget.
+    """
+
+    EASY = "Easy", 0, 0
+    NORMAL = "Normal", 1, 4
+    HARD = "Hard", 8, 12
+
+    def __init__(self, value: str, max_depth: int, budget: float) -> None:
+        """Create a new difficulty level.
+
+        :param value: The textual value of the enumeration.
+        :param max_depth: The maximum number of rounds the AI looks ahead.
+        :param budget: The time the AI can spend choosing a move in
+        milliseconds.
+        """
+
+        super().__init__()
+        self._value = value
+        self._max_depth = max_depth
+        self._budget = budget
+
+    @property
+    def max_depth(self) -> int:
+        """Get the maximum number of rounds the AI looks ahead.
+
+        :return: The maximum depth of the search.
+        """
+
+        return self._max_depth
+
+    @property
+    def budget(self) -> float:
+        """Get the time the AI can spend choosing a move.
+
+        :return: The time budget in milliseconds.
+        """
+
+        return self._budget
@@ -1,3 +1,5 @@
+import bisect
+import typing
 from enum import Enum
 from math import floor
 
@@ -7,6 +9,10 @@ class ExperienceFunctionEnum(Enum):
 
     The amount of experience for a pokemon to reach a certain level is based on
     its level and one of these functions.
+
+    The thresholds of the levels 1 to 101 are compiled into a table by
+    ``compile_tables``, so that the level matching an amount of experience can
+    be found by bisection. The levels beyond fall back to the function.
     """
 
     FAST = "FAST"
@@ -23,6 +29,17 @@ class ExperienceFunctionEnum(Enum):
         super().__init__()
         self._value = value
         self._function = None
+        self._table = ()
+
+    @property
+    def table(self) -> typing.Tuple[int, ...]:
+        """Get the number of points of experience necessary to reach each
+        level.
+
+        :return: A tuple of thresholds indexed by ``level - 1``.
+        """
+
+        return self._table
 
     def get_xp_for_level(self, level: int) -> int:
         """Get the number of points of experience necessary to reach the
@@ -33,7 +50,47 @@ class ExperienceFunctionEnum(Enum):
         level.
         """
 
-        return self._function(level)
+        if 0 < level <= len(self._table):
+            return self._table[level - 1]
+
+        return floor(self._function(level))
+
+    def get_level_for_xp(self, experience: int) -> int:
+        """Get the highest level reached with the specified number of points
+        of experience.
+
+        :param experience: The number of points of experience.
+        :return: The level, at least 1.
+        """
+
+        level = max(1, bisect.bisect_right(self._table, experience))
+        if level == len(self._table):
+            while self.get_xp_for_level(level + 1) <= experience:
+                level += 1
+
+        return level
+
+    def get_xp_to_next_level(self, experience: int) -> int:
+        """Get the number of points of experience missing to reach the level
+        after the one reached with the specified experience.
+
+        :param experience: The number of points of experience.
+        :return: The number of points of experience to gain.
+        """
+
+        return self.get_xp_for_level(self.get_level_for_xp(experience) + 1) - experience
+
+    @classmethod
+    def compile_tables(cls, max_level: int = 100) -> None:
+        """Compute the thresholds of the levels of every learning curve.
+
+        :param max_level: The highest level a pokemon can reach. The table
+        goes one level further for the experience needed after it.
+        """
+
+        for experience_function in cls:
+            experience_function._table = tuple(floor(experience_function._function(level))
+                                               for level in range(1, max_level + 2))
 
 
 ExperienceFunctionEnum.FAST._function = lambda level: floor(4 * level ** 3 / 5)
@@ -41,3 +98,5 @@ ExperienceFunctionEnum.MEDIUM_FAST._function = lambda level: floor(level ** 3)
 ExperienceFunctionEnum.MEDIUM_SLOW._function = lambda level: floor(
     6 / 5 * level ** 3 - 15 * level ** 2 + 100 * level - 140)
 ExperienceFunctionEnum.SLOW._function = lambda level: floor(5 * level ** 3 / 4)
+
+ExperienceFunctionEnum.compile_tables()
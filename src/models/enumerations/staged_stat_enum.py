@@ -8,6 +8,8 @@ class StagedStatEnum(Enum):
 
     The stage of a stat is a multiplier increasing or decreasing the value of
     a stat. It can take a value between -6 and +6.
+
+    The multipliers are kept in a tuple indexed by ``stage + 6``.
     """
 
     ATTACK = "attack", {-6: 2 / 8, -5: 2 / 7, -4: 2 / 6, -3: 2 / 5, -2: 2 / 4, -1: 2 / 3, 0: 2 / 2, 1: 3 / 2, 2: 4 / 2,
@@ -38,7 +40,16 @@ class StagedStatEnum(Enum):
 
         super().__init__()
         self._value = value
-        self._multipliers = multipliers
+        self._multipliers = tuple(multipliers[stage] for stage in range(-6, 7))
+
+    @property
+    def multipliers(self) -> typing.Tuple[float, ...]:
+        """Get the multipliers of all the stages.
+
+        :return: A tuple of multipliers indexed by ``stage + 6``.
+        """
+
+        return self._multipliers
 
     def get_multiplier(self, stage: int) -> float:
         """Get the multiplier for the given stage.
@@ -46,4 +57,25 @@ class StagedStatEnum(Enum):
         :param stage: The stage of the stat.
         """
 
-        return self._multipliers[stage]
+        return self._multipliers[stage + 6]
+
+    @property
+    def index(self) -> int:
+        """Get the position of the staged stat in the enumeration, at which its value
+        is stored in the arrays of ``PokemonModel``.
+
+        :return: The index of the staged stat.
+        """
+
+        return self._index
+
+    @classmethod
+    def compile_indexes(cls) -> None:
+        """Number the staged stats in the order of the enumeration.
+        """
+
+        for index, staged_stat in enumerate(cls):
+            staged_stat._index = index
+
+
+StagedStatEnum.compile_indexes()
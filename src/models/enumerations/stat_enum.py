@@ -1,12 +1,17 @@
 from enum import Enum
 from math import floor
 
+import numpy
+
 
 class StatEnum(Enum):
     """Defines the types of pokemon stats and how to calculate them.
 
     The stats are calculated based on the base stat (same for all the pokemon
     of a species), the IV (depends on each pokemon) and their level.
+
+    The formulas are written without rounding so that they also apply to
+    NumPy arrays, in ``get_stats``.
     """
 
     HP = "HP"
@@ -25,9 +30,9 @@ class StatEnum(Enum):
         super().__init__()
         self._value = value
         if value == "HP":
-            self._function = lambda level, base_stat, iv: floor((2 * base_stat + iv) * level / 100 + level + 10)
+            self._function = lambda level, base_stat, iv: (2 * base_stat + iv) * level / 100 + level + 10
         else:
-            self._function = lambda level, base_stat, iv: floor(((2 * base_stat + iv) * level / 100 + 5) * 0.9)
+            self._function = lambda level, base_stat, iv: ((2 * base_stat + iv) * level / 100 + 5) * 0.9
 
     def get_stat(self, level: int, base_stat: int, iv: int) -> int:
         """Get the value of the stat for the indicated level based on the base stat
@@ -39,4 +44,43 @@ class StatEnum(Enum):
         :return: The stat.
         """
 
-        return self._function(level, base_stat, iv)
+        return floor(self._function(level, base_stat, iv))
+
+    @classmethod
+    def get_stats(cls, levels: numpy.ndarray, base_stats: numpy.ndarray, iv: numpy.ndarray) -> numpy.ndarray:
+        """Get all the stats of many pokemon at once.
+
+        :param levels: An array of the levels of the N pokemon.
+        :param base_stats: An N x 6 array of the base stats of their species, in
+        the order of the enumeration.
+        :param iv: An N x 6 array of their IV, in the same order.
+        :return: An N x 6 array of integer stats, equal to those given by
+        ``get_stat``.
+        """
+
+        stats = numpy.empty(numpy.shape(iv), dtype=int)
+        for stat in cls:
+            stats[:, stat.index] = numpy.floor(stat._function(levels, base_stats[:, stat.index], iv[:, stat.index]))
+
+        return stats
+
+    @property
+    def index(self) -> int:
+        """Get the position of the stat in the enumeration, at which its value
+        is stored in the arrays of ``PokemonModel``.
+
+        :return: The index of the stat.
+        """
+
+        return self._index
+
+    @classmethod
+    def compile_indexes(cls) -> None:
+        """Number the stats in the order of the enumeration.
+        """
+
+        for index, stat in enumerate(cls):
+            stat._index = index
+
+
+StatEnum.compile_indexes()
@@ -3,6 +3,8 @@ from __future__ import annotations
 import typing
 from enum import Enum
 
+import numpy
+
 from .move_effectiveness_enum import MoveEffectivenessEnum
 
 
@@ -33,6 +35,11 @@ class TypeEnum(Enum):
     - If the type of move is completely ineffective against one of the
         opponent's types, then the move does no damage, even if the opponent has a
         second type that would be vulnerable to it.
+
+    Once set, the chart is compiled by ``compile_chart`` into a matrix of the
+    multipliers of every type against every type, and into a table of the
+    effectiveness of every type against every combination of one or two
+    types. It must be compiled again whenever it is changed.
     """
 
     NORMAL = "Normal"
@@ -123,6 +130,15 @@ class TypeEnum(Enum):
 
         self._super_effective = super_effective
 
+    @property
+    def index(self) -> int:
+        """Get the position of the type in the compiled chart.
+
+        :return: The index of the type.
+        """
+
+        return self._index
+
     def effectiveness(self, defense_types: typing.List[TypeEnum]) -> MoveEffectivenessEnum:
         """Determines the effectiveness of a move of this type against
             one or several of the defending type.
@@ -131,17 +147,80 @@ class TypeEnum(Enum):
         :return: The multiplier of the move.
         """
 
-        multiplier = 1
-        for type in defense_types:
-            if type in self._no_effect:
-                multiplier = 0
-                break
-            elif type in self._not_effective:
-                multiplier *= 1 / 2
-            elif type in self._super_effective:
-                multiplier *= 2
+        if len(defense_types) == 1:
+            return self._combinations[defense_types[0]._index][-1]
+        if len(defense_types) == 2:
+            return self._combinations[defense_types[0]._index][defense_types[1]._index]
 
-        return MoveEffectivenessEnum(multiplier)
+        return MoveEffectivenessEnum(
+            float(numpy.prod(TypeEnum._matrix[self._index, [type._index for type in defense_types]])))
+
+    @staticmethod
+    def combination_indexes(defense_types: typing.List[TypeEnum]) -> typing.Tuple[int, int]:
+        """Get the indexes of the types of a defender for
+        ``batch_effectiveness``.
+
+        :param defense_types: A list of one or two types.
+        :return: The index of both types, the second being -1 if there is only
+        one.
+        """
+
+        return defense_types[0]._index, defense_types[1]._index if len(defense_types) > 1 else -1
+
+    @classmethod
+    def effectiveness_matrix(cls) -> numpy.ndarray:
+        """Get the multipliers of every type against every single type.
+
+        :return: A read-only array indexed by the index of the type of the
+        move and the index of the type of the defender.
+        """
+
+        return cls._matrix
+
+    @classmethod
+    def batch_effectiveness(cls, move_types: numpy.ndarray, defense_types: numpy.ndarray) -> numpy.ndarray:
+        """Get the multipliers of many moves against many defenders at once.
+
+        :param move_types: An array of the indexes of the types of the moves.
+        :param defense_types: An array of the indexes of the types of the
+        defenders, with the shape of ``move_types`` and a last axis of 2 as
+        given by ``combination_indexes``.
+        :return: An array of multipliers with the shape of ``move_types``.
+        """
+
+        return cls._dual_matrix[move_types, defense_types[..., 0], defense_types[..., 1]]
+
+    @classmethod
+    def compile_chart(cls) -> None:
+        """Compile the chart into the effectiveness matrix and the table of
+        the effectiveness against each combination of types.
+
+        The combinations are indexed by the index of both types, the last row
+        and column standing for the absence of a second type.
+        """
+
+        types = list(cls)
+        for index, type in enumerate(types):
+            type._index = index
+
+        matrix = numpy.ones((len(types), len(types)))
+        for type in types:
+            matrix[type.index, [defense_type.index for defense_type in type.super_effective]] = 2
+            matrix[type.index, [defense_type.index for defense_type in type.not_effective]] = 1 / 2
+            matrix[type.index, [defense_type.index for defense_type in type.no_effect]] = 0
+
+        dual_matrix = numpy.ones((len(types), len(types) + 1, len(types) + 1))
+        dual_matrix[:, :-1, :-1] = matrix[:, :, None] * matrix[:, None, :]
+        dual_matrix[:, :-1, -1] = matrix
+        dual_matrix[:, -1, :-1] = matrix
+        matrix.setflags(write=False)
+        dual_matrix.setflags(write=False)
+        cls._matrix = matrix
+        cls._dual_matrix = dual_matrix
+
+        for type in types:
+            type._combinations = [[MoveEffectivenessEnum(multiplier) for multiplier in row]
+                                  for row in dual_matrix[type.index].tolist()]
 
 
 TypeEnum.NORMAL.no_effect = [TypeEnum.GHOST]
@@ -208,3 +287,5 @@ TypeEnum.STEEL.not_effective = [TypeEnum.STEEL, TypeEnum.FIRE, TypeEnum.WATER,
 TypeEnum.STEEL.super_effective = [TypeEnum.ROCK, TypeEnum.ICE, TypeEnum.FAIRY]
 TypeEnum.FAIRY.not_effective = [TypeEnum.POISON, TypeEnum.STEEL, TypeEnum.FIRE]
 TypeEnum.FAIRY.super_effective = [TypeEnum.FIGHT, TypeEnum.DRAGON, TypeEnum.DARK]
+
+TypeEnum.compile_chart()
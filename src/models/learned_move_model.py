@@ -1,9 +1,14 @@
+import typing
+
 from models.move_model import MoveModel
+from toolbox.slots_state import set_slots_state
 
 
 class LearnedMoveModel:
     """A move learned by a pokemon."""
 
+    __slots__ = ("_move", "_pp", "_current_pp")
+
     def __init__(self, move: MoveModel, pp: int = None, current_pp: int = None) -> None:
         """Create a new learned move.
 
@@ -60,3 +65,18 @@ class LearnedMoveModel:
         """
 
         self._current_pp = current_pp
+
+    def __setstate__(self, state: typing.Union[dict, tuple]) -> None:
+        """Restore the learned move from its pickled state, which is its
+        ``__dict__`` if it was saved before the learned moves had slots. In
+        that case, its move is a copy, which is replaced by the move of the
+        catalog.
+
+        :param state: The pickled state.
+        """
+
+        if set_slots_state(self, state):
+            from toolbox.data.moves import moves
+
+            if self._move.id in moves:
+                self._move = moves[self._move.id]
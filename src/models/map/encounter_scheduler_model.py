@@ -0,0 +1,83 @@
+import math
+import random
+
+
+class EncounterSchedulerModel:
+    """Decides on which steps in the tall grass a wild pokemon is encountered.
+
+    Each step has the same probability of setting off an encounter. Instead
+    of drawing a random number on every step, the number of steps until the
+    next encounter is drawn from the matching geometric distribution, so that
+    a step only counts down until it reaches the encounter. As the
+    distribution is memoryless, the countdown carries over from one tall
+    grass to another.
+
+    Attributes:
+        - ENCOUNTER_PROBABILITY: The default probability of an encounter on
+        each step.
+    """
+
+    __slots__ = ("_probability", "_rng", "_log_miss", "_steps")
+
+    ENCOUNTER_PROBABILITY = 0.2
+
+    def __init__(self, rng: random.Random, probability: float = ENCOUNTER_PROBABILITY) -> None:
+        """Create a new encounter scheduler.
+
+        :param rng: The random number generator.
+        :param probability: The probability of an encounter on each step,
+        greater than 0 and at most 1.
+        """
+
+        if not 0 < probability <= 1:
+            raise ValueError("Invalid encounter probability {0}".format(probability))
+
+        self._probability = probability
+        self._rng = rng
+        self._log_miss = math.log(1 - probability) if probability < 1 else None
+        self._steps = self._draw_steps()
+
+    @property
+    def probability(self) -> float:
+        """Get the probability of an encounter on each step.
+
+        :return: The probability.
+        """
+
+        return self._probability
+
+    @property
+    def steps(self) -> int:
+        """Get the number of steps until the next encounter, that step
+        included.
+
+        :return: The number of steps, at least 1.
+        """
+
+        return self._steps
+
+    def step(self) -> bool:
+        """Count a step of the player and get whether it sets off an
+        encounter.
+
+        :return: True if a wild pokemon is encountered.
+        """
+
+        self._steps -= 1
+        if self._steps:
+            return False
+
+        self._steps = self._draw_steps()
+        return True
+
+    def _draw_steps(self) -> int:
+        """Draw the number of steps until the next encounter by inverting the
+        geometric distribution.
+
+        :return: The number of steps, at least 1.
+        """
+
+        if self._log_miss is None:
+            return 1
+
+        return int(math.log(1.0 - self._rng.random()) / self._log_miss) + 1
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import json
+import math
+import random
+import typing
+
+
+class EncounterTableModel:
+    """The wild pokemon which can be encountered in a region of a map.
+
+    Each species has a weight, the probability of encountering it being its
+    weight divided by the total weight of the table, and the range of the
+    levels of the pokemon encountered, all equally likely.
+
+    The table is compiled once into an alias table (Vose's method) over every
+    pair of species and level, so that drawing a pokemon takes two random
+    numbers whatever the size of the table. The weights of the pairs are
+    scaled to integers, so that the probabilities of the alias table are
+    exact.
+    """
+
+    __slots__ = ("_place", "_species", "_weights", "_levels", "_outcomes", "_thresholds", "_aliases", "_total")
+
+    def __init__(self, place: str, species: typing.Tuple[str, ...], weights: typing.Tuple[int, ...],
+                 levels: typing.Tuple[typing.Tuple[int, int], ...]) -> None:
+        """Create a new encounter table.
+
+        :param place: The name of the place of the battles, i.e. their
+        background.
+        :param species: The id of each species.
+        :param weights: The weight of each species.
+        :param levels: The lowest and the highest level of each species.
+        """
+
+        self._place = place
+        self._species = species
+        self._weights = weights
+        self._levels = levels
+        self._compile()
+
+    @classmethod
+    def from_json(cls, text: str, species: typing.Container[str]) -> typing.Optional[EncounterTableModel]:
+        """Parse the ``wild_pokemon`` property of an object of a map, e.g.
+        ``{"place": "meadow", "pokemons": {"bulbasaur": {"probability": 90,
+        "level_min": 2, "level_max": 5}}}``.
+
+        :param text: The JSON value of the property.
+        :param species: The ids of the species which exist.
+        :return: A new ``EncounterTableModel``, or None if the value is empty.
+        :raise ValueError: If the value is malformed or refers to a species
+        which doesn't exist.
+        """
+
+        try:
+            data = json.loads(text)
+            if not data:
+                return None
+
+            place = data["place"]
+            ids, weights, levels = [], [], []
+            for name, infos in data["pokemons"].items():
+                ids.append(name.upper())
+                weights.append(infos["probability"])
+                levels.append((infos["level_min"], infos["level_max"]))
+        except (TypeError, KeyError, AttributeError) as error:
+            raise ValueError("Invalid wild pokemon {0}".format(text)) from error
+
+        if not isinstance(place, str) or not ids:
+            raise ValueError("Invalid wild pokemon {0}".format(text))
+        for id, weight, (level_min, level_max) in zip(ids, weights, levels):
+            if id not in species:
+                raise ValueError("Unknown species {0} in the wild pokemon {1}".format(id, text))
+            if not isinstance(weight, int) or weight <= 0 or not isinstance(level_min, int) \
+                    or not isinstance(level_max, int) or not 1 <= level_min <= level_max <= 100:
+                raise ValueError("Invalid wild pokemon {0} in {1}".format(id, text))
+
+        return cls(place, tuple(ids), tuple(weights), tuple(levels))
+
+    @property
+    def place(self) -> str:
+        """Get the place of the battles against the wild pokemon.
+
+        :return: The name of the place.
+        """
+
+        return self._place
+
+    @property
+    def species(self) -> typing.Tuple[str, ...]:
+        """Get the species which can be encountered.
+
+        :return: The id of each species.
+        """
+
+        return self._species
+
+    @property
+    def weights(self) -> typing.Tuple[int, ...]:
+        """Get the weight of each species.
+
+        :return: The weights, in the order of the species.
+        """
+
+        return self._weights
+
+    @property
+    def levels(self) -> typing.Tuple[typing.Tuple[int, int], ...]:
+        """Get the range of the levels of each species.
+
+        :return: The lowest and the highest level, in the order of the
+        species.
+        """
+
+        return self._levels
+
+    def draw(self, rng: random.Random) -> typing.Tuple[str, int]:
+        """Draw the species and the level of a wild pokemon.
+
+        :param rng: The random number generator.
+        :return: The id of the species and the level.
+        """
+
+        index = rng.randrange(len(self._outcomes))
+        if rng.randrange(self._total) >= self._thresholds[index]:
+            index = self._aliases[index]
+
+        return self._outcomes[index]
+
+    def _compile(self) -> None:
+        """Build the alias table of the pairs of species and level.
+
+        The weight of a species is split evenly between its levels. The
+        weights of the pairs are multiplied by the least common multiple of the
+        numbers of levels and by the number of pairs to remain integers.
+        """
+
+        spans = [level_max - level_min + 1 for level_min, level_max in self._levels]
+        multiple = 1
+        for span in spans:
+            multiple = multiple * span // math.gcd(multiple, span)
+
+        outcomes, scaled_weights = [], []
+        for id, weight, (level_min, level_max), span in zip(self._species, self._weights, self._levels, spans):
+            for level in range(level_min, level_max + 1):
+                outcomes.append((id, level))
+                scaled_weights.append(weight * multiple // span)
+
+        self._outcomes = tuple(outcomes)
+        self._total = sum(scaled_weights)
+        scaled_weights = [weight * len(outcomes) for weight in scaled_weights]
+
+        thresholds = [self._total] * len(outcomes)
+        aliases = list(range(len(outcomes)))
+        small = [index for index, weight in enumerate(scaled_weights) if weight < self._total]
+        large = [index for index, weight in enumerate(scaled_weights) if weight >= self._total]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            thresholds[less] = scaled_weights[less]
+            aliases[less] = more
+            scaled_weights[more] -= self._total - scaled_weights[less]
+            (small if scaled_weights[more] < self._total else large).append(more)
+
+        self._thresholds = tuple(thresholds)
+        self._aliases = tuple(aliases)
@@ -0,0 +1,59 @@
+import math
+import typing
+
+
+class EventIndexModel:
+    """The triggers of the events of a map, indexed by tile for each action of
+    the player.
+
+    A trigger is added on every tile whose bottom-left corner is inside its
+    rectangle, so that finding the triggers of the tile the player stands on
+    (or faces) is a single dictionary lookup whatever the number of events of
+    the map.
+    """
+
+    __slots__ = ("_tile_size", "_triggers")
+
+    def __init__(self, tile_size: int) -> None:
+        """Create a new empty index.
+
+        :param tile_size: The width and height of a tile in pixels.
+        """
+
+        self._tile_size = tile_size
+        self._triggers = dict()
+
+    def add(self, action: typing.Hashable, x: float, y: float, width: float, height: float,
+            trigger: typing.Any) -> None:
+        """Add a trigger on the tiles covered by a rectangle.
+
+        A tile is covered when its bottom-left corner lies inside the
+        rectangle, its left and bottom edges included. A partial row or column
+        of tiles, e.g. of a rectangle 34 pixels high, therefore counts when
+        the bottom-left corners of its tiles fall inside, as a player whose
+        bottom-left point is inside the rectangle stands on it.
+
+        :param action: The action of the player setting off the trigger.
+        :param x: The x coordinate of the bottom-left corner of the rectangle
+        in pixels.
+        :param y: The y coordinate of the bottom-left corner of the rectangle
+        in pixels.
+        :param width: The width of the rectangle in pixels.
+        :param height: The height of the rectangle in pixels.
+        :param trigger: The trigger.
+        """
+
+        for i in range(math.ceil(x / self._tile_size), math.ceil((x + width) / self._tile_size)):
+            for j in range(math.ceil(y / self._tile_size), math.ceil((y + height) / self._tile_size)):
+                self._triggers[action, i, j] = self._triggers.get((action, i, j), ()) + (trigger,)
+
+    def get(self, action: typing.Hashable, i: int, j: int) -> typing.Tuple[typing.Any, ...]:
+        """Get the triggers set off by an action on a tile.
+
+        :param action: The action of the player.
+        :param i: The column of the tile.
+        :param j: The row of the tile.
+        :return: The triggers, in the order they were added.
+        """
+
+        return self._triggers.get((action, i, j), ())
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import enum
+import json
+import typing
+
+
+class TeleportModel:
+    """The target of a teleport of a map.
+
+    The player is teleported to the map at the position when they walk on the
+    teleport facing the direction.
+    """
+
+    __slots__ = ("_map", "_position", "_direction")
+
+    def __init__(self, map: str, position: typing.Tuple[int, int], direction: enum.Enum) -> None:
+        """Create a new teleport target.
+
+        :param map: The name of the map the player is teleported to.
+        :param position: The tile coordinates of the player on that map.
+        :param direction: The direction the player must face to be
+        teleported.
+        """
+
+        self._map = map
+        self._position = position
+        self._direction = direction
+
+    @classmethod
+    def from_json(cls, text: str, directions: typing.Mapping[str, enum.Enum]) -> TeleportModel:
+        """Parse the ``teleport`` property of an object of a map, e.g.
+        ``{"map": "route_1", "x": 22, "y": 1, "direction": "UP"}``.
+
+        :param text: The JSON value of the property.
+        :param directions: The directions by name.
+        :return: A new ``TeleportModel``.
+        :raise ValueError: If the value is malformed.
+        """
+
+        try:
+            data = json.loads(text)
+            map, i, j = data["map"], data["x"], data["y"]
+            direction = directions[data["direction"]]
+        except (TypeError, KeyError) as error:
+            raise ValueError("Invalid teleport {0}".format(text)) from error
+
+        if not isinstance(map, str) or not isinstance(i, int) or not isinstance(j, int):
+            raise ValueError("Invalid teleport {0}".format(text))
+
+        return cls(map, (i, j), direction)
+
+    @property
+    def map(self) -> str:
+        """Get the map the player is teleported to.
+
+        :return: The name of the map.
+        """
+
+        return self._map
+
+    @property
+    def position(self) -> typing.Tuple[int, int]:
+        """Get the position of the player on the map they're teleported to.
+
+        :return: The tile coordinates of the player.
+        """
+
+        return self._position
+
+    @property
+    def direction(self) -> enum.Enum:
+        """Get the direction the player must face to be teleported.
+
+        :return: The direction.
+        """
+
+        return self._direction
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import typing
+
+import numpy
+
+
+class WalkabilityModel:
+    """The tiles of a map the player can walk on.
+
+    The walkability is compiled once per map into a grid of booleans indexed
+    by the tile coordinates ``[i, j]``, ``i`` being the column from the left
+    and ``j`` the row from the bottom, as in the cells of the layers of the
+    map. A tile is walkable if it's walkable in every layer: either the layer
+    has no tile there, or the tile has a ``walkable`` property which isn't
+    false. The tiles outside the map aren't walkable.
+
+    The grid doesn't depend on the display, so that it can be used for path
+    finding or to simulate the overworld headlessly.
+    """
+
+    __slots__ = ("_grid",)
+
+    def __init__(self, grid: numpy.ndarray) -> None:
+        """Create a new walkability grid.
+
+        :param grid: A 2D array of booleans indexed by the tile coordinates.
+        """
+
+        self._grid = numpy.array(grid, dtype=bool)
+        self._grid.setflags(write=False)
+
+    @classmethod
+    def from_layers(cls, layers: typing.Iterable[typing.Any]) -> WalkabilityModel:
+        """Compile the walkability of the tile layers of a map.
+
+        :param layers: The tile layers, e.g. the ``cocos.tiles.RectMapLayer``
+        of the map. Each of them has ``cells`` indexed by the tile
+        coordinates, and each cell has a ``tile`` which is None or has
+        ``properties``.
+        :return: A new ``WalkabilityModel``.
+        """
+
+        layers = [layer.cells for layer in layers]
+        width = max((len(cells) for cells in layers), default=0)
+        height = max((len(column) for cells in layers for column in cells), default=0)
+
+        grid = numpy.zeros((width, height), dtype=bool)
+        if layers:
+            grid[:min(len(cells) for cells in layers), :min(len(column) for cells in layers for column in cells)] = True
+        for cells in layers:
+            for i, column in enumerate(cells):
+                for j, cell in enumerate(column):
+                    if cell.tile and cell.tile.properties.get("walkable", None) in ("false", "False", None):
+                        grid[i, j] = False
+
+        return cls(grid)
+
+    @property
+    def grid(self) -> numpy.ndarray:
+        """Get the walkability grid.
+
+        :return: A read-only 2D array of booleans indexed by the tile
+        coordinates.
+        """
+
+        return self._grid
+
+    @property
+    def width(self) -> int:
+        """Get the number of columns of the map.
+
+        :return: The width in tiles.
+        """
+
+        return self._grid.shape[0]
+
+    @property
+    def height(self) -> int:
+        """Get the number of rows of the map.
+
+        :return: The height in tiles.
+        """
+
+        return self._grid.shape[1]
+
+    def is_walkable(self, i: int, j: int) -> bool:
+        """Get whether the player can walk on a tile.
+
+        :param i: The column of the tile.
+        :param j: The row of the tile.
+        :return: True if the tile is in the map and walkable.
+        """
+
+        return 0 <= i < self._grid.shape[0] and 0 <= j < self._grid.shape[1] and bool(self._grid[i, j])
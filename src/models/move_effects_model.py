@@ -2,11 +2,14 @@ import typing
 
 from models.enumerations.staged_stat_enum import StagedStatEnum
 from models.enumerations.status_enum import StatusEnum
+from toolbox.slots_state import set_slots_state
 
 
 class MoveEffectsModel:
     """The effects of a move."""
 
+    __slots__ = ("_staged_stats", "_status")
+
     def __init__(self, staged_stats: typing.Dict[StagedStatEnum, int], status: typing.Dict[StatusEnum, int]) -> None:
         """Create a new move effects.
 
@@ -35,3 +38,12 @@ class MoveEffectsModel:
         """
 
         return self._status
+
+    def __setstate__(self, state: typing.Union[dict, tuple]) -> None:
+        """Restore the effects from their pickled state, which is their
+        ``__dict__`` if they were saved before the effects had slots.
+
+        :param state: The pickled state.
+        """
+
+        set_slots_state(self, state)
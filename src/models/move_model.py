@@ -1,11 +1,20 @@
+import typing
+
 from models.enumerations.move_category_enum import MoveCategoryEnum
 from models.enumerations.type_enum import TypeEnum
 from models.move_effects_model import MoveEffectsModel
 from toolbox.i18n import I18n
+from toolbox.slots_state import set_slots_state
 
 
 class MoveModel:
-    """A move in the game."""
+    """A move in the game.
+
+    The moves of the catalog are pickled by id, so that the pokemon of a
+    loaded save share the moves of the catalog instead of copies.
+    """
+
+    __slots__ = ("_id", "_type", "_category", "_power", "_accuracy", "_default_pp", "_effects")
 
     def __init__(self, id: str, move_type: TypeEnum, category: MoveCategoryEnum, power: int, accuracy: int,
                  default_pp: int,
@@ -108,3 +117,28 @@ class MoveModel:
         """
 
         return self._effects
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        """Pickle the move by id if it's the move of the catalog.
+
+        :param protocol: The pickle protocol.
+        :return: The function getting the move from the catalog and the id, or
+        the default state of the move if it isn't in the catalog.
+        """
+
+        from toolbox.data.moves import get_move, moves
+
+        if moves.get_loaded(self._id) is self:
+            return get_move, (self._id,)
+
+        return super().__reduce_ex__(protocol)
+
+    def __setstate__(self, state: typing.Union[dict, tuple]) -> None:
+        """Restore the move from its pickled state, which is its ``__dict__``
+        if it was saved before the moves had slots. The learned moves then
+        refer to the move of the catalog instead.
+
+        :param state: The pickled state.
+        """
+
+        set_slots_state(self, state)
@@ -1,4 +1,5 @@
 import typing
+from array import array
 from math import floor
 from random import randint
 
@@ -6,6 +7,8 @@ from models.enumerations.staged_stat_enum import StagedStatEnum
 from models.enumerations.stat_enum import StatEnum
 from models.learned_move_model import LearnedMoveModel
 from models.pokemon_species_model import PokemonSpeciesModel
+from toolbox.enum_array_view import EnumArrayView
+from toolbox.slots_state import set_slots_state
 
 
 class PokemonModel:
@@ -16,8 +19,28 @@ class PokemonModel:
     full).
     On the other hand, the ``current stats`` are based on the stats but may
     vary depending on the situation.
+
+    The ``effective stats`` are the stats multiplied by their stage. They are
+    cached, and updated whenever the stats or the staged stats are set, which
+    is why the staged stats can't be modified in place.
+
+    The stats, the IV and the staged stats are stored in arrays indexed by the
+    ``index`` of the stats and exposed as read-only mappings.
+
+    Attributes:
+        - STATS_TYPECODE: The type code of the arrays of the stats and the IV.
+        - STAGES_TYPECODE: The type code of the array of the staged stats.
     """
 
+    __slots__ = ("_species", "_nickname", "_level", "_moves", "_experience", "_experience_for_next_level", "_iv",
+                 "_stats", "_hp", "_staged_stats", "_effective_stats")
+
+    STATS_TYPECODE = "h"
+    STAGES_TYPECODE = "b"
+
+    _EFFECTIVE_STATS = tuple((staged_stat, StatEnum[staged_stat.name].index if staged_stat.name in StatEnum.__members__
+                              else None) for staged_stat in StagedStatEnum)
+
     def __init__(self, species: PokemonSpeciesModel, nickname: str, level: int, moves: [LearnedMoveModel],
                  hp: int = None,
                  experience: int = None, iv: typing.Dict[StatEnum, int] = None) -> None:
@@ -43,19 +66,51 @@ class PokemonModel:
         self._update_experience_for_next_level()
 
         if iv:
-            self._iv = iv
+            self._iv = array(PokemonModel.STATS_TYPECODE, (iv[stat] for stat in StatEnum))
         else:
-            self._iv = dict()
-            for stat in StatEnum:
-                self._iv[stat] = randint(0, 31)
+            self._iv = array(PokemonModel.STATS_TYPECODE, (randint(0, 31) for _ in StatEnum))
 
-        self._stats = dict()
+        self._staged_stats = array(PokemonModel.STAGES_TYPECODE, bytes(len(StagedStatEnum)))
+
+        self._stats = None
+        self._hp = None
         self._update_stats()
-        self._hp = hp if hp is not None else self._stats[StatEnum.HP]
+        self._hp = hp if hp is not None else self._stats[StatEnum.HP.index]
 
-        self._staged_stats = dict()
-        for staged_stat in StagedStatEnum:
-            self._staged_stats[staged_stat] = 0
+    @classmethod
+    def from_arrays(cls, species: PokemonSpeciesModel, nickname: str, level: int, moves: [LearnedMoveModel],
+                    experience: int, experience_for_next_level: int, iv: array, stats: array) -> "PokemonModel":
+        """Create a new pokemon with full HP whose experience and stats are
+        already calculated, e.g. for many pokemon at once by
+        ``StatEnum.get_stats``.
+
+        :param species: The species of the pokemon.
+        :param nickname: The nickname of the pokemon.
+        :param level: The level of the pokemon.
+        :param moves: The moves the pokemon has learned.
+        :param experience: The experience points of the pokemon.
+        :param experience_for_next_level: The experience needed to reach the
+        next level.
+        :param iv: An array of type ``STATS_TYPECODE`` of the IV of the
+        pokemon, in the order of ``StatEnum``.
+        :param stats: An array of the same type of the stats of the pokemon.
+        :return: A new ``PokemonModel``.
+        """
+
+        pokemon = cls.__new__(cls)
+        pokemon._species = species
+        pokemon._nickname = nickname
+        pokemon._level = level
+        pokemon._moves = moves
+        pokemon._experience = experience
+        pokemon._experience_for_next_level = experience_for_next_level
+        pokemon._iv = iv
+        pokemon._staged_stats = array(PokemonModel.STAGES_TYPECODE, bytes(len(StagedStatEnum)))
+        pokemon._stats = stats
+        pokemon._hp = stats[StatEnum.HP.index]
+        pokemon._update_effective_stats()
+
+        return pokemon
 
     @property
     def species(self) -> PokemonSpeciesModel:
@@ -103,23 +158,36 @@ class PokemonModel:
         self._level = level
 
     @property
-    def staged_stats(self) -> typing.Dict[StagedStatEnum, int]:
+    def staged_stats(self) -> typing.Mapping[StagedStatEnum, int]:
         """Get the staged stats of the pokemon.
 
-        :return: A dictionary of all staged stats with their value.
+        :return: A read-only mapping of all staged stats with their value.
         """
 
-        return self._staged_stats
+        return EnumArrayView(StagedStatEnum, self._staged_stats)
 
     @staged_stats.setter
-    def staged_stats(self, staged_stats: typing.Dict[StagedStatEnum, int]) -> None:
-        """Set the stages stats of the pokemon.
+    def staged_stats(self, staged_stats: typing.Mapping[StagedStatEnum, int]) -> None:
+        """Set the stages stats of the pokemon and update their effective
+        stats.
 
-        :param staged_stats: A dictionary of all the staged stats with their
+        :param staged_stats: A mapping of all the staged stats with their
         value.
         """
 
-        self._staged_stats = staged_stats
+        self._staged_stats = array(PokemonModel.STAGES_TYPECODE,
+                                   (staged_stats[staged_stat] for staged_stat in StagedStatEnum))
+        self._update_effective_stats()
+
+    @property
+    def effective_stats(self) -> typing.Mapping[StagedStatEnum, float]:
+        """Get the stats of the pokemon multiplied by their stage.
+
+        :return: A dictionary of all staged stats with their effective value.
+        The accuracy has no stat, so its value is the multiplier alone.
+        """
+
+        return self._effective_stats
 
     @property
     def moves(self) -> typing.List[LearnedMoveModel]:
@@ -158,22 +226,32 @@ class PokemonModel:
         self._hp = hp
 
     @property
-    def stats(self) -> typing.Dict[StatEnum, int]:
+    def stats(self) -> typing.Mapping[StatEnum, int]:
         """Get the stats of the pokemon.
 
-        :return: A dictionary of all stats with their maximum value.
+        :return: A read-only mapping of all stats with their maximum value.
         """
 
-        return self._stats
+        return EnumArrayView(StatEnum, self._stats)
 
     @stats.setter
-    def stats(self, stats: typing.Dict[StatEnum, int]) -> None:
+    def stats(self, stats: typing.Mapping[StatEnum, int]) -> None:
         """Set the stats of the pokemon.
 
-        :param stats: A dictionary of all stats with their maximum value.
+        :param stats: A mapping of all stats with their maximum value.
+        """
+
+        self._stats = array(PokemonModel.STATS_TYPECODE, (stats[stat] for stat in StatEnum))
+        self._update_effective_stats()
+
+    @property
+    def iv(self) -> typing.Mapping[StatEnum, int]:
+        """Get the IV of the pokemon.
+
+        :return: A read-only mapping of all stats with their IV.
         """
 
-        self._stats = stats
+        return EnumArrayView(StatEnum, self._iv)
 
     @property
     def experience(self) -> int:
@@ -206,14 +284,16 @@ class PokemonModel:
         """Determine the experience needed to reach the next level.
         """
 
-        self._experience_for_next_level = floor(self.species.experience_function.get_xp_for_level(self.level + 1))
+        self._experience_for_next_level = self.species.experience_function.get_xp_for_level(self.level + 1)
 
     def gain_experience(self, experience_gained: int) -> typing.Dict[int, typing.Dict[StatEnum, int]]:
         """Increase the number of experience points of the pokemon and return
         for each level how many points the pokemon has gained in each stat.
 
         If the number of XP is higher than the amount necessary to reach the
-        next level, the pokemon levels up.
+        next level, the pokemon levels up. The new level is looked up in the
+        table of the learning curve, so the pokemon jumps straight to it and
+        their stats are only updated once.
 
         :param experience_gained: The number of experience points gained.
         :return A dictionary of levels with the stats increase and the moves
@@ -222,25 +302,28 @@ class PokemonModel:
 
         self.experience += experience_gained
         gained_levels = dict()
-        while self.experience >= self._experience_for_next_level:
-            old_stats = self._stats.copy()
-            self.level += 1
-            gained_levels[self.level] = dict()
-            self._update_stats()
-            self._update_experience_for_next_level()
+        if self.experience < self._experience_for_next_level:
+            return gained_levels
 
-            for stat in StatEnum:
-                gained_levels[self.level][stat] = self.stats[stat] - old_stats[stat]
+        old_stats = array(PokemonModel.STATS_TYPECODE, self._stats)
+        for level in range(self._level + 1, self.species.experience_function.get_level_for_xp(self.experience) + 1):
+            new_stats = self._get_stats(level)
+            gained_levels[level] = {stat: new_stat - old_stat
+                                    for stat, new_stat, old_stat in zip(StatEnum, new_stats, old_stats)}
+            old_stats = new_stats
 
-            gained_levels[self.level]["moves"] = self.species.moves_by_lvl_up[
-                self.level] if self.level in self.species.moves_by_lvl_up else []
+            gained_levels[level]["moves"] = self._species.get_moves_learned_between(level - 1, level)
 
             if len(self._moves) < 4:
-                for move in gained_levels[self.level]["moves"]:
+                for move in gained_levels[level]["moves"]:
                     self._moves.append(LearnedMoveModel(move, move.default_pp, move.default_pp))
                     if len(self._moves) >= 4:
                         break
 
+        self.level = level
+        self._update_stats()
+        self._update_experience_for_next_level()
+
         return gained_levels
 
     def _update_stats(self) -> None:
@@ -250,18 +333,59 @@ class PokemonModel:
         The HP increases proportionally to the old HP.
         """
 
-        old_hp_stat = self._stats[StatEnum.HP] if StatEnum.HP in self._stats else None
+        hp = StatEnum.HP.index
+        old_hp_stat = self._stats[hp] if self._stats else None
+        self._stats = self._get_stats(self._level)
+
+        self._hp = self._hp + (self._stats[hp] - old_hp_stat) if old_hp_stat and self._hp else self._stats[hp]
+        self._update_effective_stats()
+
+    def _get_stats(self, level: int) -> array:
+        """Calculate the stats of the pokemon at a level.
 
-        for stat in StatEnum:
-            self._stats[stat] = stat.get_stat(self._level, self._species.base_stats[stat], self._iv[stat])
+        :param level: The level of the pokemon.
+        :return: An array of the stats in the order of ``StatEnum``.
+        """
 
-        self._hp = self._hp + (self._stats[StatEnum.HP] - old_hp_stat) if old_hp_stat and self._hp else self._stats[
-            StatEnum.HP]
+        base_stats = self._species.base_stats
+
+        return array(PokemonModel.STATS_TYPECODE,
+                     (stat.get_stat(level, base_stats[stat], iv) for stat, iv in zip(StatEnum, self._iv)))
+
+    def _update_effective_stats(self) -> None:
+        """Multiply the stats by the multiplier of their stage.
+        """
+
+        self._effective_stats = {staged_stat: (self._stats[stat] if stat is not None else 1) * staged_stat.multipliers[
+            stage + 6] for (staged_stat, stat), stage in zip(PokemonModel._EFFECTIVE_STATS, self._staged_stats)}
 
     def heal(self) -> None:
         """Fully heal the pokemon. Set the HP to the max and reset the staged 
         stats.
         """
 
-        self._hp = self.stats[StatEnum.HP]
-        self._staged_stats = {stat: 0 for stat in StagedStatEnum}
+        self._hp = self._stats[StatEnum.HP.index]
+        self._staged_stats = array(PokemonModel.STAGES_TYPECODE, bytes(len(StagedStatEnum)))
+        self._update_effective_stats()
+
+    def __setstate__(self, state: typing.Union[dict, tuple]) -> None:
+        """Restore the pokemon from their pickled state.
+
+        If the pokemon was saved before the pokemon had slots, the state is
+        their ``__dict__``, whose stats, IV and staged stats are dictionaries
+        turned here into arrays. Their species is then a copy, which is
+        replaced by the species of the catalog.
+
+        :param state: The pickled state.
+        """
+
+        if set_slots_state(self, state):
+            from toolbox.data.pokemon import pokemons
+
+            if self._species.id in pokemons:
+                self._species = pokemons[self._species.id]
+            self._stats = array(PokemonModel.STATS_TYPECODE, (self._stats[stat] for stat in StatEnum))
+            self._iv = array(PokemonModel.STATS_TYPECODE, (self._iv[stat] for stat in StatEnum))
+            self._staged_stats = array(PokemonModel.STAGES_TYPECODE,
+                                       (self._staged_stats.get(staged_stat, 0) for staged_stat in StagedStatEnum))
+            self._update_effective_stats()
@@ -1,3 +1,4 @@
+import bisect
 import typing
 
 from models.enumerations.experience_function_enum import ExperienceFunctionEnum
@@ -5,10 +6,21 @@ from models.enumerations.stat_enum import StatEnum
 from models.enumerations.type_enum import TypeEnum
 from models.move_model import MoveModel
 from toolbox.i18n import I18n
+from toolbox.slots_state import set_slots_state
 
 
 class PokemonSpeciesModel:
-    """A species of pokemon."""
+    """A species of pokemon.
+
+    The moves learned by leveling up are also indexed as two parallel tuples
+    sorted by level, the levels and the moves, so that the moves learned up to
+    or between levels are found by bisection.
+
+    Like the moves, the species of the catalog are pickled by id.
+    """
+
+    __slots__ = ("_id", "_type", "_moves_by_lvl_up", "_base_stats", "_base_experience", "_experience_function",
+                 "_learnset_levels", "_learnset_moves")
 
     def __init__(self, id: str, type: typing.List[TypeEnum], moves_by_lvl_up: typing.Dict[int, typing.List[MoveModel]],
                  base_stats: typing.Dict[StatEnum, int], base_experience: int,
@@ -33,6 +45,7 @@ class PokemonSpeciesModel:
         self._base_stats = base_stats
         self._base_experience = base_experience
         self._experience_function = experience_function
+        self._index_learnset()
 
     @property
     def id(self) -> str:
@@ -95,3 +108,64 @@ class PokemonSpeciesModel:
         :return: An instance of ``ExperienceFunctionEnum``
         """
         return self._experience_function
+
+    def _index_learnset(self) -> None:
+        """Index the moves learned by leveling up by level.
+        """
+
+        learnset = [(level, move) for level in sorted(self._moves_by_lvl_up) for move in self._moves_by_lvl_up[level]]
+        self._learnset_levels = tuple(level for level, _ in learnset)
+        self._learnset_moves = tuple(move for _, move in learnset)
+
+    def get_last_moves(self, level: int, count: int = 4) -> typing.List[MoveModel]:
+        """Get the last moves learned by leveling up until a level, i.e. the
+        moves known by a pokemon of the species created at that level.
+
+        :param level: The level of the pokemon.
+        :param count: The maximum number of moves.
+        :return: A list of at most ``count`` moves, in the order they are
+        learned.
+        """
+
+        end = bisect.bisect_right(self._learnset_levels, level)
+
+        return list(self._learnset_moves[max(0, end - count):end])
+
+    def get_moves_learned_between(self, level_from: int, level_to: int) -> typing.List[MoveModel]:
+        """Get the moves learned by leveling up from a level to another.
+
+        :param level_from: The level before leveling up, whose moves are
+        excluded.
+        :param level_to: The level reached, whose moves are included.
+        :return: A list of moves, in the order they are learned.
+        """
+
+        return list(self._learnset_moves[bisect.bisect_right(self._learnset_levels, level_from):
+                                         bisect.bisect_right(self._learnset_levels, level_to)])
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        """Pickle the species by id if it's the species of the catalog.
+
+        :param protocol: The pickle protocol.
+        :return: The function getting the species from the catalog and the id,
+        or the default state of the species if it isn't in the catalog.
+        """
+
+        from toolbox.data.pokemon import get_species, pokemons
+
+        if pokemons.get_loaded(self._id) is self:
+            return get_species, (self._id,)
+
+        return super().__reduce_ex__(protocol)
+
+    def __setstate__(self, state: typing.Union[dict, tuple]) -> None:
+        """Restore the species from its pickled state, which is its
+        ``__dict__`` if it was saved before the species had slots, in which
+        case its moves learned by leveling up are indexed. The pokemon then
+        refer to the species of the catalog instead.
+
+        :param state: The pickled state.
+        """
+
+        if set_slots_state(self, state):
+            self._index_learnset()
@@ -0,0 +1,42 @@
+import argparse
+import sys
+import time
+
+from models.battle.battle_replayer import BattleReplayer
+from models.battle.replay_mismatch_error import ReplayMismatchError
+
+"""This script replays recorded battles headlessly to check that the battle
+engine still takes the same course.
+
+Each log is replayed at full speed. The battles which diverge are reported and
+the exit status is 1 if any of them did.
+"""
+
+
+def main() -> int:
+    """Replay the battle logs given on the command line.
+
+    :return: The exit status.
+    """
+
+    parser = argparse.ArgumentParser(description="Replay recorded battles and check their outcome.")
+    parser.add_argument("logs", nargs="+", help="The battle logs to replay.")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rounds = mismatches = 0
+    for path in args.logs:
+        try:
+            rounds += BattleReplayer(path).replay()
+        except ReplayMismatchError as error:
+            mismatches += 1
+            print("{0}: {1}".format(path, error))
+
+    print("{0} battles, {1} rounds replayed in {2:.2f}s, {3} mismatches.".format(
+        len(args.logs), rounds, time.perf_counter() - start, mismatches))
+
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,24 @@
+import typing
+
+
+class InvalidDataError(Exception):
+    """Raised when the JSON data of the moves or of the pokemon is malformed
+    or refers to something which doesn't exist."""
+
+    def __init__(self, errors: typing.List[str]) -> None:
+        """Create a new invalid data error.
+
+        :param errors: The description of each problem found in the data.
+        """
+
+        super().__init__("{0} error(s) in the data:\n{1}".format(len(errors), "\n".join(errors)))
+        self._errors = errors
+
+    @property
+    def errors(self) -> typing.List[str]:
+        """Get the problems found in the data.
+
+        :return: The description of each problem.
+        """
+
+        return self._errors
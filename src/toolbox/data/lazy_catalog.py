@@ -0,0 +1,58 @@
+import typing
+from collections.abc import Mapping
+
+
+class LazyCatalog(Mapping):
+    """A read-only mapping of models by id, each of them being created from its
+    record the first time it's accessed, and then kept.
+
+    The ids are known up front, so iterating over the catalog or checking that
+    it contains an id doesn't create any model.
+    """
+
+    __slots__ = ("_records", "_create", "_models")
+
+    def __init__(self, records: typing.Mapping[str, tuple], create: typing.Callable[[tuple], typing.Any]) -> None:
+        """Create a new lazy catalog.
+
+        :param records: The records of the models by id, e.g. ``PackRecords``.
+        :param create: The function creating a model from its record.
+        """
+
+        self._records = records
+        self._create = create
+        self._models = dict()
+
+    @property
+    def loaded(self) -> int:
+        """Get the number of models created so far.
+
+        :return: The number of models.
+        """
+
+        return len(self._models)
+
+    def get_loaded(self, id: str) -> typing.Any:
+        """Get a model if it's already created, without creating it.
+
+        :param id: The id of the model.
+        :return: The model, or None if it isn't created yet.
+        """
+
+        return self._models.get(id)
+
+    def __getitem__(self, id: str) -> typing.Any:
+        model = self._models.get(id)
+        if model is None:
+            model = self._models[id] = self._create(self._records[id])
+
+        return model
+
+    def __contains__(self, id: object) -> bool:
+        return id in self._records
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
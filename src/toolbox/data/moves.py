@@ -1,46 +1,45 @@
-import json
-
 from models.enumerations.move_category_enum import MoveCategoryEnum
 from models.enumerations.staged_stat_enum import StagedStatEnum
 from models.enumerations.type_enum import TypeEnum
 from models.move_effects_model import MoveEffectsModel
 from models.move_model import MoveModel
-from toolbox.init import PATH
+from toolbox.data.lazy_catalog import LazyCatalog
+from toolbox.data.pack import move_records
 
 """This module is meant to load the data regarding the moves available in the 
 game.
 
-A JSON file is read and instantiates a ``Move`` for each node of the file.
-All the moves are then stored in a dictionary whose the key is the id of the 
-move. 
+The records of the moves are read from the data pack (built from the JSON
+file). All the moves are then stored in a read-only mapping whose the key is
+the id of the move, and which instantiates a ``Move`` the first time it's
+accessed.
 """
 
-MOVE_ID = "id"
-MOVE_TYPE = "type"
-MOVE_CATEGORY = "category"
-MOVE_POWER = "power"
-MOVE_ACCURACY = "accuracy"
-MOVE_DEFAULT_PP = "defaultPp"
-MOVE_EFFECTS = "effects"
-MOVE_STATS = "stats"
-MOVE_STATUS = "status"
-
-moves = dict()
-with open(PATH + "/assets/data/moves.json") as file:
-    json_moves = json.load(file)
-    for move in json_moves:
-        id = move[MOVE_ID]
-        type = TypeEnum[move[MOVE_TYPE]]
-        category = MoveCategoryEnum[move[MOVE_CATEGORY]]
-        power = move[MOVE_POWER] if MOVE_POWER in move else None
-        accuracy = move[MOVE_ACCURACY] if MOVE_ACCURACY in move else None
-        default_pp = move[MOVE_DEFAULT_PP]
-        effects = None
-        if MOVE_EFFECTS in move:
-            effects_node = move[MOVE_EFFECTS]
-            effects_stats = {StagedStatEnum[name]: value for name, value in effects_node[MOVE_STATS].items()}
-            effects_status = effects_node[MOVE_STATUS] if MOVE_STATUS in effects_node else None
-
-            effects = MoveEffectsModel(effects_stats, effects_status)
-
-        moves[id] = MoveModel(id, type, category, power, accuracy, default_pp, effects)
+
+def create_move(record: tuple) -> MoveModel:
+    """Instantiate a move from its record.
+
+    :param record: The record of the move, as described in ``pack``.
+    :return: A new ``MoveModel``.
+    """
+
+    id, type, category, power, accuracy, default_pp, effects = record
+    if effects:
+        effects_stats, effects_status = effects
+        effects = MoveEffectsModel({StagedStatEnum[name]: value for name, value in effects_stats}, effects_status)
+
+    return MoveModel(id, TypeEnum[type], MoveCategoryEnum[category], power, accuracy, default_pp, effects)
+
+
+def get_move(id: str) -> MoveModel:
+    """Get a move of the catalog, e.g. when a save referring to it by id is
+    loaded.
+
+    :param id: The id of the move.
+    :return: The ``MoveModel`` of the catalog.
+    """
+
+    return moves[id]
+
+
+moves = LazyCatalog(move_records(), create_move)
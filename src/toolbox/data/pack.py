@@ -0,0 +1,317 @@
+import hashlib
+import json
+import marshal
+import mmap
+import os
+import struct
+import typing
+
+from models.enumerations.experience_function_enum import ExperienceFunctionEnum
+from models.enumerations.move_category_enum import MoveCategoryEnum
+from models.enumerations.staged_stat_enum import StagedStatEnum
+from models.enumerations.stat_enum import StatEnum
+from models.enumerations.type_enum import TypeEnum
+from toolbox.data.invalid_data_error import InvalidDataError
+from toolbox.data.pack_records import PackRecords
+from toolbox.init import PATH
+
+"""This module is meant to compile the JSON data of the moves and of the pokemon
+into a binary pack, which is quicker to load.
+
+The JSON files are validated and turned into records, i.e. tuples of plain
+values with the enumerations given by name:
+    - move: (id, type, category, power, accuracy, default PP, effects), the
+    effects being None or (((staged stat, stage), ...), status).
+    - pokemon: (id, (type, ...), ((stat, base stat), ...), base experience,
+    experience function, ((level, (move id, ...)), ...)).
+
+The pack starts with a header (magic, version, offset of the index), followed
+by each record serialized by ``marshal``, and ends with the index. The index
+holds the offset and the length of each record by id, and the fingerprint
+(modification time, size and SHA-1) of the JSON files it was built from.
+
+The pack is memory-mapped when loaded, and only its index is read: the
+records are decoded when they're accessed. It's used as long as the JSON files
+haven't changed: their modification time and size are checked first, and
+their hash only if those differ. Otherwise, the records are read from the JSON
+files and the pack is built again.
+"""
+
+MOVES_JSON = PATH + "/assets/data/moves.json"
+POKEMON_JSON = PATH + "/assets/data/pokemon.json"
+PACK_PATH = PATH + "/assets/data/data.pack"
+
+PACK_MAGIC = b"PYMP"
+PACK_VERSION = 1
+MARSHAL_VERSION = 4
+HEADER = struct.Struct("<4sHQ")
+
+MOVE_ID = "id"
+MOVE_TYPE = "type"
+MOVE_CATEGORY = "category"
+MOVE_POWER = "power"
+MOVE_ACCURACY = "accuracy"
+MOVE_DEFAULT_PP = "defaultPp"
+MOVE_EFFECTS = "effects"
+MOVE_STATS = "stats"
+MOVE_STATUS = "status"
+
+POKEMON_ID = "id"
+POKEMON_TYPE = "type"
+POKEMON_BASE_STATS = "baseStats"
+POKEMON_BASE_EXPERIENCE = "baseExperience"
+POKEMON_EXPERIENCE_FUNCTION = "experienceFunction"
+POKEMON_MOVES_BY_LVL_UP = "movesByLvlUp"
+
+Records = typing.Mapping[str, tuple]
+
+_records = None
+
+
+def move_records() -> Records:
+    """Get the records of the moves, loaded once.
+
+    :return: A mapping assigning its record to the id of each move.
+    """
+
+    return _load()[0]
+
+
+def species_records() -> Records:
+    """Get the records of the species of pokemon, loaded once.
+
+    :return: A mapping assigning its record to the id of each species.
+    """
+
+    return _load()[1]
+
+
+def build_pack(path: str = PACK_PATH) -> typing.Tuple[Records, Records]:
+    """Validate the JSON files and write the pack.
+
+    :param path: The path of the pack.
+    :return: The records of the moves and of the species.
+    """
+
+    moves, species, sources = read_json()
+    _write_pack(path, moves, species, sources)
+
+    return moves, species
+
+
+def read_json() -> typing.Tuple[Records, Records, tuple]:
+    """Read and validate the JSON files.
+
+    :return: The records of the moves, the records of the species and the
+    fingerprint of the JSON files.
+    """
+
+    with open(MOVES_JSON, "rb") as file:
+        json_moves = file.read()
+    with open(POKEMON_JSON, "rb") as file:
+        json_pokemon = file.read()
+
+    errors = []
+    moves = _move_records(json.loads(json_moves.decode("utf-8")), errors)
+    species = _species_records(json.loads(json_pokemon.decode("utf-8")), moves, errors)
+    if errors:
+        raise InvalidDataError(errors)
+
+    sources = (_fingerprint(MOVES_JSON, json_moves), _fingerprint(POKEMON_JSON, json_pokemon))
+
+    return moves, species, sources
+
+
+def _load() -> typing.Tuple[Records, Records]:
+    """Load the records from the pack, or from the JSON files if the pack is
+    missing or out of date, in which case the pack is built again.
+
+    :return: The records of the moves and of the species.
+    """
+
+    global _records
+    if _records is None:
+        _records = _read_pack(PACK_PATH)
+        if _records is None:
+            moves, species, sources = read_json()
+            try:
+                _write_pack(PACK_PATH, moves, species, sources)
+            except OSError:
+                pass
+            _records = moves, species
+
+    return _records
+
+
+def _read_pack(path: str) -> typing.Optional[typing.Tuple[Records, Records]]:
+    """Map the pack and read its index.
+
+    :param path: The path of the pack.
+    :return: The records of the moves and of the species, or None if the pack
+    is missing, unreadable or out of date.
+    """
+
+    try:
+        with open(path, "rb") as file:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_offset = HEADER.unpack_from(data)
+        index = marshal.loads(data[index_offset:]) if magic == PACK_MAGIC and version == PACK_VERSION else None
+        if not index or not _is_fresh(index["sources"]):
+            data.close()
+            return None
+
+        return PackRecords(data, index["moves"]), PackRecords(data, index["pokemon"])
+    except (OSError, ValueError, EOFError, TypeError, KeyError, struct.error):
+        return None
+
+
+def _write_pack(path: str, moves: Records, species: Records, sources: tuple) -> None:
+    """Write the records into the pack.
+
+    The file is replaced atomically so that a running game never reads a
+    partial pack.
+
+    :param path: The path of the pack.
+    :param moves: The records of the moves.
+    :param species: The records of the species.
+    :param sources: The fingerprint of the JSON files.
+    """
+
+    index = {"sources": sources}
+    with open(path + ".tmp", "wb") as file:
+        file.write(HEADER.pack(PACK_MAGIC, PACK_VERSION, 0))
+        for kind, records in (("moves", moves), ("pokemon", species)):
+            index[kind] = dict()
+            for id, record in records.items():
+                data = marshal.dumps(record, MARSHAL_VERSION)
+                index[kind][id] = (file.tell(), len(data))
+                file.write(data)
+
+        index_offset = file.tell()
+        file.write(marshal.dumps(index, MARSHAL_VERSION))
+        file.seek(0)
+        file.write(HEADER.pack(PACK_MAGIC, PACK_VERSION, index_offset))
+    os.replace(path + ".tmp", path)
+
+
+def _fingerprint(path: str, content: bytes) -> typing.Tuple[int, int, str]:
+    """Get the fingerprint of a JSON file.
+
+    :param path: The path of the file.
+    :param content: The content of the file.
+    :return: The modification time in nanoseconds, the size and the SHA-1 of
+    the file.
+    """
+
+    return os.stat(path).st_mtime_ns, len(content), hashlib.sha1(content).hexdigest()
+
+
+def _is_fresh(sources: tuple) -> bool:
+    """Get whether the JSON files are the ones the pack was built from.
+
+    :param sources: The fingerprint of the JSON files stored in the pack.
+    :return: True if none of the files changed.
+    """
+
+    for path, (mtime, size, digest) in zip((MOVES_JSON, POKEMON_JSON), sources):
+        stat = os.stat(path)
+        if (stat.st_mtime_ns, stat.st_size) == (mtime, size):
+            continue
+
+        with open(path, "rb") as file:
+            if hashlib.sha1(file.read()).hexdigest() != digest:
+                return False
+
+    return True
+
+
+def _move_records(json_moves: typing.List[dict], errors: typing.List[str]) -> Records:
+    """Turn the JSON nodes of the moves into records.
+
+    :param json_moves: The nodes of the moves.
+    :param errors: The list the problems found are added to.
+    :return: A dictionary assigning its record to the id of each move.
+    """
+
+    records = dict()
+    for position, move in enumerate(json_moves):
+        id = move.get(MOVE_ID)
+        where = "move {0}".format(id if id else "#" + str(position))
+        if not isinstance(id, str) or id in records:
+            errors.append("{0}: missing or duplicate id".format(where))
+            continue
+
+        effects = None
+        if MOVE_EFFECTS in move:
+            effects_node = move[MOVE_EFFECTS]
+            stats = effects_node.get(MOVE_STATS, dict())
+            _check_names(StagedStatEnum, stats, where, errors)
+            effects = tuple(stats.items()), effects_node.get(MOVE_STATUS)
+
+        _check_names(TypeEnum, [move.get(MOVE_TYPE)], where, errors)
+        _check_names(MoveCategoryEnum, [move.get(MOVE_CATEGORY)], where, errors)
+        if not isinstance(move.get(MOVE_DEFAULT_PP), int):
+            errors.append("{0}: missing default PP".format(where))
+
+        records[id] = (id, move.get(MOVE_TYPE), move.get(MOVE_CATEGORY), move.get(MOVE_POWER),
+                       move.get(MOVE_ACCURACY), move.get(MOVE_DEFAULT_PP), effects)
+
+    return records
+
+
+def _species_records(json_pokemon: typing.List[dict], moves: Records, errors: typing.List[str]) -> Records:
+    """Turn the JSON nodes of the pokemon into records.
+
+    :param json_pokemon: The nodes of the pokemon.
+    :param moves: The records of the moves, to check the moves learned.
+    :param errors: The list the problems found are added to.
+    :return: A dictionary assigning its record to the id of each species.
+    """
+
+    records = dict()
+    for position, pokemon in enumerate(json_pokemon):
+        id = pokemon.get(POKEMON_ID)
+        where = "pokemon {0}".format(id if id else "#" + str(position))
+        if not isinstance(id, str) or id in records:
+            errors.append("{0}: missing or duplicate id".format(where))
+            continue
+
+        types = pokemon.get(POKEMON_TYPE, [])
+        if not 1 <= len(types) <= 2:
+            errors.append("{0}: {1} types instead of 1 or 2".format(where, len(types)))
+        _check_names(TypeEnum, types, where, errors)
+
+        base_stats = pokemon.get(POKEMON_BASE_STATS, dict())
+        _check_names(StatEnum, base_stats, where, errors)
+        if set(base_stats) != set(StatEnum.__members__):
+            errors.append("{0}: the base stats are not {1}".format(where, ", ".join(StatEnum.__members__)))
+
+        _check_names(ExperienceFunctionEnum, [pokemon.get(POKEMON_EXPERIENCE_FUNCTION)], where, errors)
+        if not isinstance(pokemon.get(POKEMON_BASE_EXPERIENCE), int):
+            errors.append("{0}: missing base experience".format(where))
+
+        moves_by_lvl_up = []
+        for level, level_moves in pokemon.get(POKEMON_MOVES_BY_LVL_UP, dict()).items():
+            if not level.isdigit():
+                errors.append("{0}: invalid level {1}".format(where, level))
+                continue
+            errors.extend("{0}: unknown move {1}".format(where, move) for move in level_moves if move not in moves)
+            moves_by_lvl_up.append((int(level), tuple(level_moves)))
+
+        records[id] = (id, tuple(types), tuple(base_stats.items()), pokemon.get(POKEMON_BASE_EXPERIENCE),
+                       pokemon.get(POKEMON_EXPERIENCE_FUNCTION), tuple(moves_by_lvl_up))
+
+    return records
+
+
+def _check_names(enum: typing.Type, names: typing.Iterable[str], where: str, errors: typing.List[str]) -> None:
+    """Check that names are names of members of an enumeration.
+
+    :param enum: The enumeration.
+    :param names: The names to check.
+    :param where: The node the names come from, for the error messages.
+    :param errors: The list the problems found are added to.
+    """
+
+    errors.extend("{0}: unknown {1} {2}".format(where, enum.__name__, name) for name in names
+                  if not isinstance(name, str) or name not in enum.__members__)
@@ -0,0 +1,40 @@
+import marshal
+import mmap
+import typing
+from collections.abc import Mapping
+
+
+class PackRecords(Mapping):
+    """The records of one kind of data (moves or pokemon) stored in a
+    memory-mapped data pack.
+
+    Only the index of the records is read up front. Each record is decoded from
+    the pack when it's accessed.
+    """
+
+    __slots__ = ("_data", "_index")
+
+    def __init__(self, data: mmap.mmap, index: typing.Dict[str, typing.Tuple[int, int]]) -> None:
+        """Create new pack records.
+
+        :param data: The memory-mapped pack.
+        :param index: A dictionary assigning the offset and the length of its
+        record in the pack to each id.
+        """
+
+        self._data = data
+        self._index = index
+
+    def __getitem__(self, id: str) -> tuple:
+        offset, length = self._index[id]
+
+        return marshal.loads(self._data[offset:offset + length])
+
+    def __contains__(self, id: object) -> bool:
+        return id in self._index
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
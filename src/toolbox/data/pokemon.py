@@ -1,38 +1,49 @@
-import json
+import typing
 
 from models.enumerations.experience_function_enum import ExperienceFunctionEnum
 from models.enumerations.stat_enum import StatEnum
 from models.enumerations.type_enum import TypeEnum
+from models.move_model import MoveModel
 from models.pokemon_species_model import PokemonSpeciesModel
-from toolbox.init import PATH
+from toolbox.data.lazy_catalog import LazyCatalog
+from toolbox.data.pack import species_records
 from .moves import moves
 
 """This module is meant to load the data regarding the pokemon available in the 
 game.
 
-A JSON file is read and instantiates a ``Pokemon`` for each node of the file.
-All the pokemon are then stored in a dictionary whose the key is the id of the 
-pokemon. 
+The records of the pokemon are read from the data pack (built from the JSON
+file). All the pokemon are then stored in a read-only mapping whose the key is
+the id of the pokemon, and which instantiates a ``Pokemon`` (and the moves it
+learns) the first time it's accessed.
 """
 
-POKEMON_ID = "id"
-POKEMON_TYPE = "type"
-POKEMON_BASE_STATS = "baseStats"
-POKEMON_BASE_EXPERIENCE = "baseExperience"
-POKEMON_EXPERIENCE_FUNCTION = "experienceFunction"
-POKEMON_MOVES_BY_LVL_UP = "movesByLvlUp"
-
-pokemons = dict()
-with open(PATH + "/assets/data/pokemon.json") as file:
-    json_pokemon = json.load(file)
-    for pokemon in json_pokemon:
-        id = pokemon[POKEMON_ID]
-        type = [TypeEnum[type] for type in pokemon[POKEMON_TYPE]]
-        base_stats = {StatEnum[name]: value for name, value in pokemon[POKEMON_BASE_STATS].items()}
-        base_experience = pokemon[POKEMON_BASE_EXPERIENCE]
-        experience_function = ExperienceFunctionEnum[pokemon[POKEMON_EXPERIENCE_FUNCTION]]
-        moves_by_lvl_up = dict()
-        for (lvl, movesList) in pokemon[POKEMON_MOVES_BY_LVL_UP].items():
-            moves_by_lvl_up[int(lvl)] = [moves[move] for move in movesList]
-
-        pokemons[id] = PokemonSpeciesModel(id, type, moves_by_lvl_up, base_stats, base_experience, experience_function)
+
+def create_species(record: tuple, moves: typing.Mapping[str, MoveModel]) -> PokemonSpeciesModel:
+    """Instantiate a species from its record.
+
+    :param record: The record of the species, as described in ``pack``.
+    :param moves: The moves, by id.
+    :return: A new ``PokemonSpeciesModel``.
+    """
+
+    id, type, base_stats, base_experience, experience_function, moves_by_lvl_up = record
+
+    return PokemonSpeciesModel(id, [TypeEnum[name] for name in type],
+                               {level: [moves[move] for move in level_moves] for level, level_moves in moves_by_lvl_up},
+                               {StatEnum[name]: value for name, value in base_stats}, base_experience,
+                               ExperienceFunctionEnum[experience_function])
+
+
+def get_species(id: str) -> PokemonSpeciesModel:
+    """Get a species of the catalog, e.g. when a save referring to it by id is
+    loaded.
+
+    :param id: The id of the species.
+    :return: The ``PokemonSpeciesModel`` of the catalog.
+    """
+
+    return pokemons[id]
+
+
+pokemons = LazyCatalog(species_records(), lambda record: create_species(record, moves))
@@ -0,0 +1,64 @@
+import typing
+from array import array
+from collections.abc import Mapping
+from enum import Enum
+
+
+class EnumArrayView(Mapping):
+    """A read-only mapping over an array of values indexed by the ``index``
+    of the members of an enumeration, e.g.:
+
+    >>> stats = EnumArrayView(StatEnum, array("h", [45, 49, 49, 65, 65, 45]))
+    >>> stats[StatEnum.ATTACK]
+    49
+    >>> dict(stats)
+    {<StatEnum.HP: 'HP'>: 45, <StatEnum.ATTACK: 'Attack'>: 49, ...}
+
+    The view doesn't copy the array, so it reflects its later changes.
+    """
+
+    __slots__ = ("_enum", "_values")
+
+    def __init__(self, enum: typing.Type[Enum], values: array) -> None:
+        """Create a new view.
+
+        :param enum: The enumeration whose members are the keys.
+        :param values: The array holding the value of each member at its
+        index.
+        """
+
+        self._enum = enum
+        self._values = values
+
+    @property
+    def typecode(self) -> str:
+        """Get the type code of the array.
+
+        :return: The type code, as given to ``array``.
+        """
+
+        return self._values.typecode
+
+    def tobytes(self) -> bytes:
+        """Get a copy of the array as raw bytes, e.g. to be read by
+        ``numpy.frombuffer``.
+
+        :return: The values in the order of the enumeration.
+        """
+
+        return self._values.tobytes()
+
+    def __getitem__(self, key: Enum) -> typing.Any:
+        if type(key) is not self._enum:
+            raise KeyError(key)
+
+        return self._values[key.index]
+
+    def __iter__(self) -> typing.Iterator[Enum]:
+        return iter(self._enum)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return "{0}({1})".format(type(self).__name__, dict(self))
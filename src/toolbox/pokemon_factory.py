@@ -0,0 +1,84 @@
+import typing
+from array import array
+
+import numpy
+
+from models.enumerations.stat_enum import StatEnum
+from models.learned_move_model import LearnedMoveModel
+from models.pokemon_model import PokemonModel
+from models.pokemon_species_model import PokemonSpeciesModel
+
+"""This module is meant to create many pokemon at once, e.g. to fill encounter
+pools or the populations of simulations.
+
+The species, the levels and the IV of all the pokemon are drawn from a NumPy
+generator in a few calls, and their stats are calculated with array
+operations. The pokemon know the last ``MAX_MOVES`` moves their species learns
+by leveling up until their level, and are named after the id of their species.
+"""
+
+MAX_MOVES = 4
+
+
+def create_pokemons(count: int, species: typing.List[PokemonSpeciesModel], levels: typing.List[typing.Tuple[int, int]],
+                    probabilities: typing.List[float] = None, seed: int = None) -> typing.List[PokemonModel]:
+    """Create pokemon of random species and levels.
+
+    :param count: The number of pokemon.
+    :param species: The species the pokemon are drawn from.
+    :param levels: The lowest and the highest level of the pokemon of each
+    species, at most 100, in the order of the species.
+    :param probabilities: The probability of each species. If None, they are
+    all equally likely.
+    :param seed: The seed of the generator. If None, a random one is used.
+    :return: A list of ``count`` new ``PokemonModel``.
+    :raise ValueError: If there isn't a range of levels for each species.
+    """
+
+    if len(levels) != len(species):
+        raise ValueError("Expected {0} ranges of levels, got {1}".format(len(species), len(levels)))
+
+    rng = numpy.random.RandomState(seed)
+    species_indexes = rng.choice(len(species), count, p=probabilities)
+    level_min, level_max = numpy.array(levels).reshape(-1, 2).T
+    levels = rng.randint(level_min[species_indexes], level_max[species_indexes] + 1)
+    iv = rng.randint(0, 32, (count, len(StatEnum)))
+
+    return _create_pokemons(species, species_indexes, levels, iv)
+
+
+def _create_pokemons(species: typing.List[PokemonSpeciesModel], species_indexes: numpy.ndarray,
+                     levels: numpy.ndarray, iv: numpy.ndarray) -> typing.List[PokemonModel]:
+    """Create the pokemon whose species, levels and IV are drawn.
+
+    :param species: The species the pokemon are drawn from.
+    :param species_indexes: An array of the index of the species of each
+    pokemon.
+    :param levels: An array of the level of each pokemon.
+    :param iv: An N x 6 array of the IV of each pokemon, in the order of
+    ``StatEnum``.
+    :return: A list of new ``PokemonModel``.
+    """
+
+    base_stats = numpy.array([[species_model.base_stats[stat] for stat in StatEnum] for species_model in species])
+    stats = StatEnum.get_stats(levels, base_stats[species_indexes], iv)
+
+    row_size = len(StatEnum) * array(PokemonModel.STATS_TYPECODE).itemsize
+    iv_bytes = iv.astype(PokemonModel.STATS_TYPECODE).tobytes()
+    stats_bytes = stats.astype(PokemonModel.STATS_TYPECODE).tobytes()
+
+    pokemons = []
+    for index, (species_index, level) in enumerate(zip(species_indexes.tolist(), levels.tolist())):
+        species_model = species[species_index]
+        experience_table = species_model.experience_function.table
+
+        start = index * row_size
+        pokemons.append(PokemonModel.from_arrays(
+            species_model, species_model.id, level,
+            [LearnedMoveModel(move, move.default_pp, move.default_pp)
+             for move in species_model.get_last_moves(level, MAX_MOVES)],
+            experience_table[level - 1], experience_table[level],
+            array(PokemonModel.STATS_TYPECODE, iv_bytes[start:start + row_size]),
+            array(PokemonModel.STATS_TYPECODE, stats_bytes[start:start + row_size])))
+
+    return pokemons
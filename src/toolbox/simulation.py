@@ -0,0 +1,199 @@
+import multiprocessing
+import random
+import typing
+
+import numpy
+
+from models.battle.batch_battle_engine import BatchBattleEngine
+from models.battle.battle_engine import BattleEngine
+from models.battle.battle_model import BattleModel
+from models.battle.battle_state_model import BattleStateModel
+from models.battle.fight_action_model import FightActionModel
+from models.battle.matchup_result_model import MatchupResultModel
+from models.pokemon_model import PokemonModel
+
+"""This module is meant to estimate the outcome of a matchup by simulating many
+battles between two parties with the battle engine.
+
+The battles are spread across a pool of processes. The parties are sent to each
+worker once, when the pool starts. Every battle is played on them after their
+initial state has been restored.
+
+One-on-one matchups can also be simulated by the batch engine, which plays all
+the battles at once with NumPy operations.
+"""
+
+MAX_ROUNDS = 500
+CHUNKS_PER_WORKER = 4
+SIMULATION_PLACE = "simulation"
+
+_parties = None
+
+
+def simulate_matchup(party_a: typing.List[PokemonModel], party_b: typing.List[PokemonModel], n: int,
+                     workers: int = None, seed: int = None) -> MatchupResultModel:
+    """Simulate ``n`` independent battles between two parties.
+
+    Both parties choose their moves randomly. The first party plays the role
+    of the player. The parties are left untouched.
+
+    :param party_a: The first list of ``PokemonModel``.
+    :param party_b: The second list of ``PokemonModel``.
+    :param n: The number of battles to simulate.
+    :param workers: The number of processes. If None, one per CPU. If 1, the
+    battles are simulated in the current process.
+    :param seed: The seed from which the seed of every battle is drawn. If
+    None, it is randomly generated.
+    :return: A ``MatchupResultModel``.
+    """
+
+    workers = workers if workers else multiprocessing.cpu_count()
+    rng = random.Random(seed)
+    chunks = _split(n, workers * CHUNKS_PER_WORKER if workers > 1 else 1)
+    tasks = [(rng.getrandbits(64), size) for size in chunks]
+
+    if workers == 1:
+        _init_worker(party_a, party_b)
+        results = [_simulate_chunk(task) for task in tasks]
+    else:
+        with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(party_a, party_b)) as pool:
+            results = pool.map(_simulate_chunk, tasks)
+
+    return sum(results, MatchupResultModel(0, 0, 0, 0))
+
+
+def simulate_duel(pokemon_a: PokemonModel, pokemon_b: PokemonModel, n: int, seed: int = None,
+                  max_rounds: int = MAX_ROUNDS) -> MatchupResultModel:
+    """Simulate ``n`` independent one-on-one battles with the batch engine.
+
+    Both pokemon choose their moves randomly. The first pokemon plays the role
+    of the player. The pokemon are left untouched.
+
+    :param pokemon_a: The first ``PokemonModel``.
+    :param pokemon_b: The second ``PokemonModel``.
+    :param n: The number of battles to simulate.
+    :param seed: The seed of the batch. If None, it is randomly generated.
+    :param max_rounds: The number of rounds after which a battle is stopped.
+    :return: A ``MatchupResultModel``.
+    """
+
+    engine = BatchBattleEngine([pokemon_a] * n, [pokemon_b] * n, seed)
+    engine.run(max_rounds)
+
+    return MatchupResultModel(n, int(numpy.count_nonzero(engine.outcomes == BatchBattleEngine.PLAYER_WON)),
+                              int(numpy.count_nonzero(engine.outcomes == BatchBattleEngine.DRAW)),
+                              int(engine.rounds.sum()))
+
+
+def play_battles(party_a: typing.List[PokemonModel], party_b: typing.List[PokemonModel], n: int,
+                 seed: int) -> MatchupResultModel:
+    """Play ``n`` battles between two parties in the current process.
+
+    The initial state of the parties is restored before every battle and once
+    they are all played.
+
+    :param party_a: The first list of ``PokemonModel``, playing the role of the
+    player.
+    :param party_b: The second list of ``PokemonModel``.
+    :param n: The number of battles to play.
+    :param seed: The seed from which the seed of every battle is drawn.
+    :return: A ``MatchupResultModel``.
+    """
+
+    rng = random.Random(seed)
+    wins = draws = total_rounds = 0
+
+    battle = BattleModel(party_a, party_b, SIMULATION_PLACE, 0)
+    initial_state = BattleStateModel.from_battle(battle)
+    for _ in range(n):
+        won, rounds = play_battle(party_a, party_b, rng.getrandbits(32))
+        initial_state.to_battle(battle)
+        wins += 1 if won else 0
+        draws += 1 if won is None else 0
+        total_rounds += rounds
+
+    return MatchupResultModel(n, wins, draws, total_rounds)
+
+
+def play_battle(party_a: typing.List[PokemonModel], party_b: typing.List[PokemonModel], seed: int,
+                max_rounds: int = MAX_ROUNDS) -> typing.Tuple[typing.Union[bool, None], int]:
+    """Play a battle until one of the parties is out of usable pokemon.
+
+    The parties are modified by the battle.
+
+    :param party_a: The first list of ``PokemonModel``, playing the role of the
+    player.
+    :param party_b: The second list of ``PokemonModel``.
+    :param seed: The seed of the battle.
+    :param max_rounds: The number of rounds after which the battle is stopped.
+    :return: Whether the first party won (None if the battle was stopped) and
+    the number of rounds played.
+    """
+
+    battle = BattleModel(party_a, party_b, SIMULATION_PLACE, seed)
+    engine = BattleEngine(battle)
+
+    for rounds in range(1, max_rounds + 1):
+        players_action = FightActionModel(battle, True, battle.rng.choice(battle.players_pokemon.moves))
+        fainted_pokemon = engine.round(players_action).fainted_pokemon
+
+        if fainted_pokemon is battle.players_pokemon:
+            next_pokemon = _first_conscious_pokemon(party_a)
+            if next_pokemon is None:
+                return False, rounds
+            battle.shift_players_pokemon(next_pokemon)
+        elif fainted_pokemon is battle.opponent_pokemon:
+            next_pokemon = _first_conscious_pokemon(party_b)
+            if next_pokemon is None:
+                return True, rounds
+            battle.opponent_pokemon = next_pokemon
+
+    return None, max_rounds
+
+
+def _init_worker(party_a: typing.List[PokemonModel], party_b: typing.List[PokemonModel]) -> None:
+    """Keep the parties in the worker for all the battles it simulates.
+
+    :param party_a: The first list of ``PokemonModel``.
+    :param party_b: The second list of ``PokemonModel``.
+    """
+
+    global _parties
+    _parties = (party_a, party_b)
+
+
+def _simulate_chunk(task: typing.Tuple[int, int]) -> MatchupResultModel:
+    """Simulate a chunk of battles between the parties of the worker.
+
+    :param task: The seed of the chunk and its number of battles.
+    :return: A ``MatchupResultModel``.
+    """
+
+    seed, size = task
+
+    return play_battles(_parties[0], _parties[1], size, seed)
+
+
+def _first_conscious_pokemon(party: typing.List[PokemonModel]) -> typing.Union[PokemonModel, None]:
+    """Get the first pokemon of the party who can fight.
+
+    :param party: A list of ``PokemonModel``.
+    :return: A ``PokemonModel`` or None if they are all KO.
+    """
+
+    for pokemon in party:
+        if pokemon.hp > 0:
+            return pokemon
+
+    return None
+
+
+def _split(n: int, parts: int) -> typing.List[int]:
+    """Split a number of battles into chunks of almost equal sizes.
+
+    :param n: The number of battles.
+    :param parts: The number of chunks.
+    :return: The list of the non-empty chunk sizes.
+    """
+
+    return [size for size in (n // parts + (1 if index < n % parts else 0) for index in range(parts)) if size]
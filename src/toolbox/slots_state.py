@@ -0,0 +1,30 @@
+import typing
+
+"""This module is meant to restore the pickled state of the models with
+``__slots__``, whatever the version of the model which was pickled.
+
+An instance with slots and no ``__dict__`` is pickled with the state
+``(None, {slot: value})``, whereas the models saved before they had slots
+were pickled with their ``__dict__``. Both are accepted, so that the saves
+written by the previous versions of the game still load.
+"""
+
+
+def set_slots_state(instance: typing.Any, state: typing.Union[dict, tuple]) -> bool:
+    """Set the attributes of an instance from its pickled state.
+
+    :param instance: The instance being unpickled.
+    :param state: Its ``__dict__`` or its ``(__dict__, slots)`` state.
+    :return: True if the state is the ``__dict__`` of a model saved before
+    it had slots, which may need to be migrated.
+    """
+
+    legacy = isinstance(state, dict)
+    if not legacy:
+        dict_state, slots_state = state
+        state = {**(dict_state or dict()), **(slots_state or dict())}
+
+    for name, value in state.items():
+        setattr(instance, name, value)
+
+    return legacy
@@ -0,0 +1,258 @@
+import csv
+import hashlib
+import json
+import multiprocessing
+import os
+import random
+import typing
+
+import numpy
+
+from models.battle.markov_solver import MarkovSolver
+from models.battle.matchup_result_model import MatchupResultModel
+from models.enumerations.stat_enum import StatEnum
+from models.learned_move_model import LearnedMoveModel
+from models.pokemon_model import PokemonModel
+from toolbox.data.pokemon import pokemons
+from toolbox.init import PATH
+from toolbox.simulation import play_battles
+
+"""This module is meant to balance the species by playing a round-robin
+tournament between all of them.
+
+Every species fights every species (itself included) at the same level, with
+the moves they learn by leveling up. The win rate of each pairing is written
+into a species x species matrix, as a CSV file and as a ``.npy`` file.
+
+Instead of playing battles, the pairings can be solved exactly by the
+``MarkovSolver``, in which case the matrix holds win probabilities without any
+sampling noise.
+
+The result of each pairing is kept in a cache next to the matrix, along with a
+fingerprint of the JSON data of both species and of their moves. When the data
+is edited, only the pairings whose fingerprint changed are played again.
+"""
+
+MAX_MOVES = 4
+TOURNAMENT_IV = 15
+CACHE_VERSION = 1
+CACHE_FLUSH_INTERVAL = 100
+
+POKEMON_JSON = PATH + "/assets/data/pokemon.json"
+MOVES_JSON = PATH + "/assets/data/moves.json"
+
+
+def run_tournament(output: str, level: int, battles: int, workers: int = None, seed: int = 0,
+                   species: typing.List[str] = None, exact: bool = False) -> numpy.ndarray:
+    """Play the round-robin tournament and write the win rate matrix.
+
+    The matrix is written into ``output + ".csv"`` and ``output + ".npy"``, and
+    the cache into ``output + ".cache.json"``. The cell ``[i, j]`` is the rate
+    of the battles won by the species ``i`` against the species ``j``.
+
+    :param output: The path of the output files, without extension.
+    :param level: The level of all the pokemon.
+    :param battles: The number of battles played by each pairing.
+    :param workers: The number of processes. If None, one per CPU.
+    :param seed: The seed from which the seed of every pairing is derived.
+    :param species: The ids of the species taking part. If None, all of them.
+    :param exact: Whether the pairings are solved exactly instead of played,
+    in which case the number of battles and the seed are ignored.
+    :return: The win rate matrix.
+    """
+
+    species = species if species else sorted(pokemons)
+    fingerprints = species_fingerprints()
+    cache_path = output + ".cache.json"
+    cache = _load_cache(cache_path)
+
+    results = dict()
+    tasks = []
+    for species_a in species:
+        for species_b in species:
+            key = _cell_key(fingerprints, species_a, species_b, level, battles, seed, exact)
+            cell = cache.get(species_a + "|" + species_b)
+            if cell and cell["key"] == key:
+                results[species_a, species_b] = _win_rate(cell["result"], exact)
+            else:
+                tasks.append((species_a, species_b, level, battles, key, _pairing_seed(seed, species_a, species_b),
+                              exact))
+
+    if tasks:
+        workers = workers if workers else multiprocessing.cpu_count()
+        with multiprocessing.Pool(workers) as pool:
+            chunksize = max(1, len(tasks) // (workers * 16))
+            for done, (species_a, species_b, key, result) in enumerate(
+                    pool.imap_unordered(_play_pairing, tasks, chunksize), 1):
+                results[species_a, species_b] = _win_rate(result, exact)
+                cache[species_a + "|" + species_b] = {"key": key, "result": result}
+                if done % CACHE_FLUSH_INTERVAL == 0:
+                    _save_cache(cache_path, cache)
+        _save_cache(cache_path, cache)
+
+    matrix = numpy.array([[results[species_a, species_b] for species_b in species]
+                          for species_a in species])
+    _save_matrix(output, species, matrix)
+
+    return matrix
+
+
+def species_pokemon(species_id: str, level: int) -> PokemonModel:
+    """Create the pokemon representing a species in the tournament.
+
+    They know the last ``MAX_MOVES`` moves their species learns by leveling up
+    until their level, and all of their IV are ``TOURNAMENT_IV``.
+
+    :param species_id: The id of the species.
+    :param level: The level of the pokemon.
+    :return: A new ``PokemonModel``.
+    """
+
+    species = pokemons[species_id]
+    learned_moves = [LearnedMoveModel(move) for move in species.get_last_moves(level, MAX_MOVES)]
+
+    return PokemonModel(species, species_id, level, learned_moves,
+                        iv={stat: TOURNAMENT_IV for stat in StatEnum})
+
+
+def species_fingerprints() -> typing.Dict[str, str]:
+    """Get a fingerprint of the JSON data of each species.
+
+    The fingerprint covers the node of the species and the nodes of all the
+    moves they can learn, so that it changes whenever any data affecting
+    their battles is edited.
+
+    :return: A dictionary assigning a fingerprint to the id of each species.
+    """
+
+    with open(POKEMON_JSON) as file:
+        json_pokemon = json.load(file)
+    with open(MOVES_JSON) as file:
+        json_moves = {move["id"]: move for move in json.load(file)}
+
+    fingerprints = dict()
+    for pokemon in json_pokemon:
+        learnset = sorted({move for level_moves in pokemon["movesByLvlUp"].values() for move in level_moves})
+        data = json.dumps([pokemon, [json_moves.get(move) for move in learnset]], sort_keys=True)
+        fingerprints[pokemon["id"]] = hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+    return fingerprints
+
+
+def _play_pairing(task: typing.Tuple[str, str, int, int, str, int, bool]) -> typing.Tuple[str, str, str,
+                                                                                          typing.List[float]]:
+    """Play the battles of a pairing, or solve it exactly.
+
+    :param task: The ids of both species, their level, the number of battles,
+    the cache key, the seed of the pairing and whether it is solved exactly.
+    :return: The ids of both species, the cache key and the result of the
+    pairing as cached.
+    """
+
+    species_a, species_b, level, battles, key, seed, exact = task
+    if exact:
+        result = MarkovSolver(species_pokemon(species_a, level), species_pokemon(species_b, level),
+                              hp_buckets=None).solve()
+        return species_a, species_b, key, [result.win_probability, result.loss_probability, result.expected_rounds]
+
+    result = play_battles([species_pokemon(species_a, level)], [species_pokemon(species_b, level)], battles, seed)
+
+    return species_a, species_b, key, [result.battles, result.wins, result.draws, result.rounds]
+
+
+def _win_rate(result: typing.List[float], exact: bool) -> float:
+    """Get the win rate of a pairing from its cached result.
+
+    :param result: The win probability, the loss probability and the expected
+    number of rounds if the pairing was solved exactly, the fields of its
+    ``MatchupResultModel`` otherwise.
+    :param exact: Whether the pairing was solved exactly.
+    :return: The win rate of the first species.
+    """
+
+    return result[0] if exact else MatchupResultModel(*result).win_rate
+
+
+def _cell_key(fingerprints: typing.Dict[str, str], species_a: str, species_b: str, level: int, battles: int,
+              seed: int, exact: bool) -> str:
+    """Get the key identifying the result of a pairing in the cache.
+
+    :param fingerprints: The fingerprint of each species.
+    :param species_a: The id of the first species.
+    :param species_b: The id of the second species.
+    :param level: The level of the pokemon.
+    :param battles: The number of battles.
+    :param seed: The seed of the tournament.
+    :param exact: Whether the pairing is solved exactly.
+    :return: The key of the cell.
+    """
+
+    if exact:
+        return "{0}:{1}:{2}:exact".format(fingerprints[species_a], fingerprints[species_b], level)
+
+    return "{0}:{1}:{2}:{3}:{4}".format(fingerprints[species_a], fingerprints[species_b], level, battles, seed)
+
+
+def _pairing_seed(seed: int, species_a: str, species_b: str) -> int:
+    """Derive the seed of a pairing from the seed of the tournament.
+
+    It only depends on the pairing, so that a pairing played again gives the
+    same result whatever the other species of the tournament.
+
+    :param seed: The seed of the tournament.
+    :param species_a: The id of the first species.
+    :param species_b: The id of the second species.
+    :return: The seed of the pairing.
+    """
+
+    return random.Random("{0}:{1}:{2}".format(seed, species_a, species_b)).getrandbits(64)
+
+
+def _load_cache(path: str) -> typing.Dict[str, typing.Dict]:
+    """Load the cached results of the pairings.
+
+    :param path: The path of the cache file.
+    :return: A dictionary assigning the cache key and the result to each
+    pairing. Empty if the file doesn't exist or has another version.
+    """
+
+    if not os.path.isfile(path):
+        return dict()
+
+    with open(path) as file:
+        cache = json.load(file)
+
+    return cache["cells"] if cache.get("version") == CACHE_VERSION else dict()
+
+
+def _save_cache(path: str, cells: typing.Dict[str, typing.Dict]) -> None:
+    """Write the cached results of the pairings.
+
+    The file is replaced atomically so that an interrupted tournament keeps
+    the cells already played.
+
+    :param path: The path of the cache file.
+    :param cells: The dictionary assigning the cache key and the result to
+    each pairing.
+    """
+
+    with open(path + ".tmp", "w") as file:
+        json.dump({"version": CACHE_VERSION, "cells": cells}, file)
+    os.replace(path + ".tmp", path)
+
+
+def _save_matrix(output: str, species: typing.List[str], matrix: numpy.ndarray) -> None:
+    """Write the win rate matrix as a CSV file and a ``.npy`` file.
+
+    :param output: The path of the output files, without extension.
+    :param species: The ids of the species, in the order of the matrix.
+    :param matrix: The win rate matrix.
+    """
+
+    numpy.save(output + ".npy", matrix)
+
+    with open(output + ".csv", "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow([""] + species)
+        for species_id, row in zip(species, matrix.tolist()):
+            writer.writerow([species_id] + ["{0:.4f}".format(win_rate) for win_rate in row])
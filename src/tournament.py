@@ -0,0 +1,40 @@
+import argparse
+import sys
+import time
+
+from toolbox.tournament import run_tournament
+
+"""This script plays a round-robin tournament between the species to help
+balancing them.
+
+The win rate matrix is written as a CSV file and a ``.npy`` file. The pairings
+already played with the same data are taken from the cache.
+"""
+
+
+def main() -> int:
+    """Play the tournament with the options given on the command line.
+
+    :return: The exit status.
+    """
+
+    parser = argparse.ArgumentParser(description="Play a round-robin tournament between the species.")
+    parser.add_argument("output", help="The path of the output files, without extension.")
+    parser.add_argument("-l", "--level", type=int, default=50, help="The level of the pokemon.")
+    parser.add_argument("-m", "--battles", type=int, default=100, help="The number of battles per pairing.")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="The number of processes.")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="The seed of the tournament.")
+    parser.add_argument("--species", nargs="+", default=None, help="The species taking part (all by default).")
+    parser.add_argument("--exact", action="store_true", help="Solve the pairings exactly instead of playing them.")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    matrix = run_tournament(args.output, args.level, args.battles, args.workers, args.seed, args.species,
+                            args.exact)
+    print("{0}x{0} win rate matrix written in {1:.2f}s.".format(len(matrix), time.perf_counter() - start))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
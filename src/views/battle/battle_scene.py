@@ -8,6 +8,7 @@ from cocos.scenes import FadeTransition
 
 from models.battle.battle_model import BattleModel
 from models.battle.fight_action_model import FightActionModel
+from models.battle.round_result_model import RoundResultModel
 from models.battle.run_action_model import RunActionModel
 from models.battle.shift_action_model import ShiftActionModel
 from models.enumerations.move_category_enum import MoveCategoryEnum
@@ -121,7 +122,7 @@ class BattleScene(cocos.scene.Scene):
         self._actions = ActionsLayer()
         self.add(self._actions)
 
-        self._moves = MovesLayer(self._battle.players_pokemon)
+        self._moves = MovesLayer(self._battle.players_pokemon, self._battle.opponent_pokemon)
         self.add(self._moves)
 
         self._player = PlayerLayer()
@@ -179,7 +180,14 @@ class BattleScene(cocos.scene.Scene):
         self.do(Delay(2.2) + CallFunc(self.show_actions))
 
     def show_actions(self) -> None:
-        """Ask the player to choose an action."""
+        """Ask the player to choose an action.
+
+        When a recorded battle is replayed, the next round is played instead.
+        """
+
+        if self._battle_controller.replaying:
+            self._battle_controller.replay_round()
+            return
 
         self._dialog.set_text(I18n().get("BATTLE.WHAT_WILL_DO").format(self._battle.players_pokemon.nickname))
 
@@ -204,22 +212,22 @@ class BattleScene(cocos.scene.Scene):
     def run_action(self) -> None:
         """The player selected to run. It is transmitted to the controller."""
 
-        self._battle_controller.round(RunActionModel(self._battle.players_pokemon, self._battle.opponent_pokemon))
+        self._battle_controller.round(
+            RunActionModel(self._battle.players_pokemon, self._battle.opponent_pokemon, self._battle.rng))
 
     def _successful_run(self) -> None:
         """The attempt to run is successful. The battle is over."""
 
         self._dialog.set_text(I18n().get("BATTLE.SUCCESSFUL_RUN"), lambda: self._battle_controller.run())
 
-    def round(self, first_action: typing.Union[FightActionModel, RunActionModel, ShiftActionModel],
-              second_action: typing.Union[FightActionModel, RunActionModel, ShiftActionModel]) -> None:
+    def round(self, round_result: RoundResultModel) -> None:
         """Play the actions.
 
-        :param first_action: The first action.
-        :param second_action: The second action.
+        :param round_result: The ``RoundResultModel`` containing the actions in
+        the order they have been played.
         """
 
-        self._do_action(first_action, second_action)
+        self._do_action(round_result.first_action, round_result.second_action)
 
     def _do_action(self, action: typing.Union[FightActionModel, RunActionModel, ShiftActionModel],
                    next_action: typing.Union[FightActionModel, RunActionModel, ShiftActionModel] = None):
@@ -249,7 +257,7 @@ class BattleScene(cocos.scene.Scene):
                                        I18n().get("BATTLE.GO_POKEMON").format(action.pokemon.nickname)))
 
             self.remove(self._moves)
-            self._moves = MovesLayer(action.pokemon)
+            self._moves = MovesLayer(action.pokemon, self._battle.opponent_pokemon)
             self.add(self._moves)
 
             self.do(Delay(3) + CallFunc(callback))
@@ -541,7 +549,7 @@ class BattleScene(cocos.scene.Scene):
         self._dialog.set_text(I18n().get("BATTLE.GO_POKEMON").format(action.pokemon.nickname))
 
         self.remove(self._moves)
-        self._moves = MovesLayer(action.pokemon)
+        self._moves = MovesLayer(action.pokemon, self._battle.opponent_pokemon)
         self.add(self._moves)
 
         self.do(Delay(2) + CallFunc(self.show_actions))
@@ -2,6 +2,7 @@ import cocos
 import pyglet
 from cocos.actions import *
 
+from models.battle import damage_calculator
 from models.pokemon_model import PokemonModel
 from toolbox.i18n import I18n
 from toolbox.init import PATH
@@ -10,20 +11,25 @@ from views.common.layer import Layer
 
 
 class MovesLayer(Layer):
-    """Shows the pokemon's list of moves."""
+    """Shows the pokemon's list of moves and the expected damage of the
+    selected one."""
 
     SELECTED_SPRITE = "SELECTED_SPRITE"
+    EXPECTED_DAMAGE = "EXPECTED_DAMAGE"
 
     is_event_handler = True
 
-    def __init__(self, pokemon: PokemonModel) -> None:
+    def __init__(self, pokemon: PokemonModel, opponent_pokemon: PokemonModel) -> None:
         """Show the pokemon's list of moves and ask the player to choose one.
 
         :param pokemon: The player's pokemon.
+        :param opponent_pokemon: The opponent pokemon, the target of the
+        moves.
         """
 
         super().__init__()
         self._pokemon = pokemon
+        self._opponent_pokemon = opponent_pokemon
         self._selected = 0
 
         self._is_visible = False
@@ -45,12 +51,24 @@ class MovesLayer(Layer):
         self._actions[len(self._actions) - 1].add(text)
 
     def _update_selected_action(self) -> None:
-        """Show the selected sprite of the selected action."""
+        """Show the selected sprite of the selected action and the expected
+        damage of the selected move, given the current stats and staged stats
+        of both pokemon."""
 
         for action in range(len(self._actions)):
             self._actions[action].get(MovesLayer.SELECTED_SPRITE).visible = False
+            if action < len(self._pokemon.moves):
+                self._actions[action].get(MovesLayer.EXPECTED_DAMAGE).visible = False
 
         self._actions[self._selected].get(MovesLayer.SELECTED_SPRITE).visible = True
+        if self._selected < len(self._pokemon.moves):
+            move = self._pokemon.moves[self._selected].move
+            if damage_calculator.is_damaging(move):
+                distribution = damage_calculator.damage_distribution(self._pokemon, self._opponent_pokemon, move)
+                expected_damage = self._actions[self._selected].get(MovesLayer.EXPECTED_DAMAGE)
+                expected_damage.element.text = I18n().get("BATTLE.EXPECTED_DAMAGE").format(
+                    round(distribution.expected_damage))
+                expected_damage.visible = True
 
     def on_key_press(self, key, modifiers) -> bool:
         """Manage the key press event.
@@ -133,4 +151,9 @@ class MovesLayer(Layer):
             type.scale = 0.9
             self._actions[index].add(type)
 
+            expected_damage = cocos.text.Label("", font_size=9, anchor_x="right", anchor_y="center", bold=True)
+            expected_damage.position = (-self._actions[index].width / 2 - 5, 0)
+            expected_damage.visible = False
+            self._actions[index].add(expected_damage, name=MovesLayer.EXPECTED_DAMAGE)
+
             self.add(self._actions[index])
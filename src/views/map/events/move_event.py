@@ -1,5 +1,6 @@
 import cocos
 
+from models.map.walkability_model import WalkabilityModel
 from views.map.map_scene import MapScene
 from views.map.player_direction_enum import PlayerDirectionEnum
 
@@ -8,7 +9,7 @@ class MoveEvent:
     """Move the player."""
 
     def __init__(self, map_scene: MapScene, x: int, y: int, direction: PlayerDirectionEnum,
-                 new_direction: PlayerDirectionEnum, map: cocos.tiles.Resource) -> None:
+                 new_direction: PlayerDirectionEnum, walkability: WalkabilityModel) -> None:
         """Create an event to move the player.
 
         :param map_scene: The scene containing the map.
@@ -16,7 +17,7 @@ class MoveEvent:
         :param y: The y coordinate of the player on the map.
         :param direction: The direction the player is facing.
         :param new_direction: The new direction the player wants to move to.
-        :param map: The map.
+        :param walkability: The walkability grid of the map.
         """
 
         if direction == PlayerDirectionEnum.UP:
@@ -31,19 +32,8 @@ class MoveEvent:
         if new_direction != direction:
             move = True
         else:
-            walkable = True
-            for key, value in map.contents.items():
-                if isinstance(value, cocos.tiles.RectMapLayer):
-                    cell = value.get_neighbor(value.get_at_pixel(x, y), players_direction)
-                    if not cell:
-                        walkable = False
-                        break
-                    if cell.tile:
-                        tile = cell.tile
-                        if "walkable" not in tile.properties or tile.properties["walkable"] in (
-                                "false", "False", None):
-                            walkable = False
-            move = walkable
+            move = walkability.is_walkable(int(x // MapScene.TILE_SIZE) + players_direction[0],
+                                           int(y // MapScene.TILE_SIZE) + players_direction[1])
 
         if move:
             map_scene.move_player(new_direction)
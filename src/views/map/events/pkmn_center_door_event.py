@@ -1,3 +1,5 @@
+import typing
+
 import cocos
 
 from views.map.map_scene import MapScene
@@ -8,15 +10,17 @@ class PkmnCenterDoorEvent:
     """Animate a PKMN Center door on the map."""
 
     def __init__(self, map_scene: MapScene, x: int, y: int, direction: PlayerDirectionEnum,
-                 object: cocos.tiles.TmxObject) -> None:
-        """Create an event animating PKMN Center door on the map.
+                 object: cocos.tiles.TmxObject, payload: typing.Any) -> None:
+        """Create an event animating PKMN Center door on the map. The player is
+        on the object.
 
         :param map_scene: The scene containing the map.
         :param x: The x coordinate of the player on the map.
         :param y: The y coordinate of the player on the map.
         :param direction: The direction the player is facing.
         :param object: The object containing all the info about the event.
+        :param payload: The value of the ``pkmn_center_door`` property of the
+        object.
         """
 
-        if object.px <= x and object.px + object.width > x and object.py <= y and object.py + object.height > y:
-            map_scene.pkmn_center_door(object.px, object.py)
+        map_scene.pkmn_center_door(object.px, object.py)
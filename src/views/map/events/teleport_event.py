@@ -1,7 +1,6 @@
-import json
-
 import cocos
 
+from models.map.teleport_model import TeleportModel
 from views.map.map_scene import MapScene
 from views.map.player_direction_enum import PlayerDirectionEnum
 
@@ -10,24 +9,17 @@ class TeleportEvent:
     """Teleport the player to another map."""
 
     def __init__(self, map_scene: MapScene, x: int, y: int, direction: PlayerDirectionEnum,
-                 object: cocos.tiles.TmxObject) -> None:
-        """Create an event to teleport the player to another map.
+                 object: cocos.tiles.TmxObject, payload: TeleportModel) -> None:
+        """Create an event to teleport the player to another map. The player is
+        on the object.
 
         :param map_scene: The scene containing the map.
         :param x: The x coordinate of the player on the map.
         :param y: The y coordinate of the player on the map.
         :param direction: The direction the player is facing.
         :param object: The object containing all the info about the event.
+        :param payload: The target of the teleport.
         """
 
-        data = dict()
-        if object.px <= x and object.px + object.width > x and object.py <= y and object.py + object.height > y:
-            data = json.loads(object.properties["teleport"])
-
-        if data:
-            map = data["map"]
-            i = data["x"]
-            j = data["y"]
-            required_direction = data["direction"]
-            if PlayerDirectionEnum[required_direction] == direction:
-                map_scene.teleport(map, (i, j), direction)
+        if payload.direction == direction:
+            map_scene.teleport(payload.map, payload.position, direction)